@@ -21,14 +21,16 @@ bl_info = {
     "category": "Import",
 }
 
-from . import operators, ui, properties
+from . import operators, ui, properties, watch
 
 def register():
     properties.register()
     operators.register()
     ui.register()
+    watch.register()
 
 def unregister():
+    watch.unregister()
     ui.unregister()
     operators.unregister()
     properties.unregister()
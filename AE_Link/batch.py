@@ -0,0 +1,319 @@
+"""Headless batch import of export files into .blend files.
+
+Run as a Blender script, without a UI:
+
+    blender -b --factory-startup --python AE_Link/batch.py -- shots/ --output blends/ --workers 4
+
+Every export file given, or found below a given folder, is split into jobs
+of one item or one composition each. The jobs are spread over a pool of
+background Blender instances that each import their jobs into a fresh file
+and save it. Import options take the defaults of the sidebar, change them
+with the same names as there (--decimate, --retime-fps 24, ...). A summary
+is printed and written to batch_report.json in the output folder. With
+--profile-log, the stage timings of every job are appended to a JSON Lines
+file, like the Profiling settings of the sidebar do.
+
+Planning, scheduling and the worker loop do not depend on bpy, the Blender
+side is the builder of headless.py. run_jobs takes the builder as an
+argument, so it can be run against a stub.
+"""
+
+import os
+import sys
+
+if __name__ == "__main__" and not globals().get("__package__"):
+    # Run as a script, import the add-on as a package from its parent folder
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = os.path.basename(os.path.dirname(os.path.abspath(__file__)))
+    __import__(__package__)
+
+import argparse
+import heapq
+import json
+import re
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from . import catalog, parser
+
+REPORT_NAME = "batch_report.json"
+
+# Item types the import operators build
+IMPORTED_TYPES = ('camera', 'av')
+
+# Import options of the bl_camera_* scene properties: name, type, choices.
+# Each batch file has a single scene, so 'create_new_scene' is not offered.
+IMPORT_OPTIONS = (
+    ('apply_comp_settings', bool, None),
+    ('enable_motion_blur', bool, None),
+    ('transparent_bg', bool, None),
+    ('set_qt_preset', bool, None),
+    ('start_position', float, 3),
+    ('reduce_motion', bool, None),
+    ('bake_reduction', bool, None),
+    ('bulk_keyframes', bool, None),
+    ('decimate', bool, None),
+    ('decimate_mode', str, ('BEZIER', 'LINEAR')),
+    ('location_tolerance', float, None),
+    ('rotation_tolerance', float, None),
+    ('retime', bool, None),
+    ('retime_fps', float, None),
+    ('retime_step', float, None),
+    ('retime_position', str, ('SPLINE', 'LINEAR')),
+)
+
+
+class BatchJob(NamedTuple):
+    """Items of one export file written to one .blend file"""
+    name: str
+    file: str
+    item_ids: List[str]
+    output: str
+    frames: int
+
+
+def _clean_name(name: str) -> str:
+    return re.sub(r'[^\w.-]+', '_', name).strip('_') or "item"
+
+
+def find_inputs(paths: Sequence[str]) -> List[str]:
+    """Export files of paths, folders are searched like the project catalog does"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(catalog.find_export_files(path))
+        else:
+            files.append(os.path.abspath(path))
+    return files
+
+
+def plan_jobs(files: Sequence[str], group: str = 'comp', output_dir: Optional[str] = None) -> List[BatchJob]:
+    """Split the items of files into jobs of one composition or one item each
+
+    Cameras come first in a job, so layers are placed relative to them. The
+    .blend files go to output_dir, or next to their export file.
+    """
+    jobs = []
+    used = set()
+    for path in files:
+        entries = [entry for entry in parser.visible_items(path) if entry.type in IMPORTED_TYPES]
+        groups = {}
+        for entry in sorted(entries, key=lambda entry: entry.type != 'camera'):
+            key = (entry.comp or entry.name) if group == 'comp' else entry.id
+            groups.setdefault(key, []).append(entry)
+
+        stem = os.path.splitext(os.path.basename(path))[0]
+        directory = output_dir or os.path.dirname(path)
+        for key, members in groups.items():
+            if group == 'comp':
+                name = key
+            else:
+                name = f"{members[0].comp}_{members[0].name}" if members[0].comp else members[0].name
+            output = os.path.join(directory, f"{_clean_name(stem)}_{_clean_name(name)}.blend")
+            if output in used:
+                output = os.path.join(directory, f"{_clean_name(stem)}_{_clean_name(name)}_{members[0].id}.blend")
+            used.add(output)
+            jobs.append(BatchJob(name, path, [entry.id for entry in members], output,
+                                 sum(entry.frame_count for entry in members)))
+    return jobs
+
+
+def assign_workers(jobs: Sequence[BatchJob], workers: int) -> List[List[BatchJob]]:
+    """Spread jobs over workers, largest first to the least loaded worker"""
+    workers = max(1, min(workers, len(jobs)))
+    loads = [(0, i) for i in range(workers)]
+    assigned = [[] for _ in range(workers)]
+    for job in sorted(jobs, key=lambda job: job.frames, reverse=True):
+        load, i = heapq.heappop(loads)
+        assigned[i].append(job)
+        heapq.heappush(loads, (load + max(job.frames, 1), i))
+    return [worker_jobs for worker_jobs in assigned if worker_jobs]
+
+
+def run_jobs(jobs: Sequence[BatchJob], options: Dict, builder) -> List[Dict]:
+    """Build and save every job with builder, return one result per job
+
+    builder.build(job, options) imports the items of a job into a fresh
+    file and saves it to job.output, returning the number of imported items
+    and the operator reports. An error fails only its own job.
+    """
+    results = []
+    for job in jobs:
+        start = time.perf_counter()
+        result = {'name': job.name, 'file': job.file, 'output': job.output,
+                  'items': 0, 'frames': job.frames, 'reports': [], 'error': None}
+        try:
+            os.makedirs(os.path.dirname(job.output) or '.', exist_ok=True)
+            result['items'], result['reports'] = builder.build(job, options)
+            if not result['items']:
+                result['error'] = "No item was imported"
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {str(e)}"
+        result['seconds'] = time.perf_counter() - start
+        results.append(result)
+    return results
+
+
+def blender_binary(explicit: Optional[str] = None) -> Optional[str]:
+    """The Blender executable to start workers with, the running one by default"""
+    if explicit:
+        return explicit
+    bpy = sys.modules.get('bpy')
+    return getattr(getattr(bpy, 'app', None), 'binary_path', None) or None
+
+
+def worker_command(blender: str, spec_path: str) -> List[str]:
+    return [blender, '-b', '--factory-startup', '--python', os.path.abspath(__file__),
+            '--', '--worker', spec_path]
+
+
+def _run_worker(blender: str, jobs: List[BatchJob], options: Dict, directory: str, index: int,
+                profile_log: Optional[str] = None) -> List[Dict]:
+    """Run jobs in a background Blender, failed results for all jobs if it crashes"""
+    spec_path = os.path.join(directory, f"worker_{index}.json")
+    result_path = os.path.join(directory, f"worker_{index}_result.json")
+    with open(spec_path, 'w', encoding='utf-8') as f:
+        json.dump({'jobs': [job._asdict() for job in jobs], 'options': options, 'result': result_path,
+                   'profile_log': profile_log}, f)
+
+    process = subprocess.run(worker_command(blender, spec_path), stdout=subprocess.PIPE,
+                             stderr=subprocess.STDOUT, text=True, errors='replace')
+    try:
+        with open(result_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        tail = process.stdout.strip().splitlines()[-5:]
+        error = f"Worker exited with code {process.returncode}: " + " | ".join(tail)
+        return [{'name': job.name, 'file': job.file, 'output': job.output, 'items': 0,
+                 'frames': job.frames, 'reports': [], 'error': error, 'seconds': 0.0} for job in jobs]
+
+
+def run_pool(jobs: Sequence[BatchJob], options: Dict, workers: int, blender: str,
+             profile_log: Optional[str] = None) -> List[Dict]:
+    """Run jobs on a pool of background Blender instances"""
+    assigned = assign_workers(jobs, workers)
+    with tempfile.TemporaryDirectory(prefix="ae_link_batch_") as directory, \
+            ThreadPoolExecutor(max_workers=len(assigned) or 1) as pool:
+        futures = [pool.submit(_run_worker, blender, worker_jobs, options, directory, i, profile_log)
+                   for i, worker_jobs in enumerate(assigned)]
+        results = [result for future in futures for result in future.result()]
+    # Report in the planned order
+    order = {job.output: i for i, job in enumerate(jobs)}
+    return sorted(results, key=lambda result: order.get(result['output'], len(order)))
+
+
+def write_report(results: Sequence[Dict], path: str, seconds: float) -> Dict:
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seconds': seconds,
+        'jobs': len(results),
+        'failed': sum(1 for result in results if result['error']),
+        'results': list(results),
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def print_summary(results: Sequence[Dict]):
+    for result in results:
+        if result['error']:
+            print(f"FAILED  {result['name']}: {result['error']}")
+        else:
+            print(f"OK      {result['name']}: {result['items']} items, {result['frames']} frames, "
+                  f"{result['seconds']:.2f} s -> {result['output']}")
+    failed = sum(1 for result in results if result['error'])
+    print(f"{len(results) - failed} of {len(results)} files written")
+
+
+def _add_option_arguments(arg_parser: argparse.ArgumentParser):
+    group = arg_parser.add_argument_group("import options", "Defaults are those of the sidebar")
+    for name, kind, extra in IMPORT_OPTIONS:
+        flag = "--" + name.replace('_', '-')
+        if kind is bool:
+            group.add_argument(flag, dest=name, action=argparse.BooleanOptionalAction, default=None)
+        elif extra and kind is float:
+            group.add_argument(flag, dest=name, type=float, nargs=extra, metavar=('X', 'Y', 'Z'))
+        else:
+            group.add_argument(flag, dest=name, type=kind, choices=extra)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(prog="batch.py", description=__doc__.splitlines()[0])
+    arg_parser.add_argument('inputs', nargs='*', help="export files or folders containing them")
+    arg_parser.add_argument('--output', help="folder for the .blend files (default: next to each export file)")
+    arg_parser.add_argument('--group', choices=('comp', 'item'), default='comp',
+                            help="write one .blend per composition or per item (default: comp)")
+    arg_parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                            help="background Blender instances, 0 imports in this process")
+    arg_parser.add_argument('--blender', help="Blender executable for the workers (default: the running one)")
+    arg_parser.add_argument('--report', help=f"summary JSON file (default: {REPORT_NAME} in the output folder)")
+    arg_parser.add_argument('--profile-log', help="append the stage timings of every job to this JSON Lines file")
+    arg_parser.add_argument('--worker', metavar='SPEC', help=argparse.SUPPRESS)
+    _add_option_arguments(arg_parser)
+    return arg_parser
+
+
+def script_arguments(argv: Sequence[str]) -> List[str]:
+    """Arguments after '--', Blender keeps its own arguments before it"""
+    argv = list(argv)
+    return argv[argv.index('--') + 1:] if '--' in argv else argv[1:]
+
+
+def worker_main(spec_path: str) -> int:
+    """Entry point of a pool instance: run the jobs of a spec file"""
+    from .headless import BlendBuilder
+
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    jobs = [BatchJob(**job) for job in spec['jobs']]
+    results = run_jobs(jobs, spec['options'], BlendBuilder(spec.get('profile_log')))
+    with open(spec['result'], 'w', encoding='utf-8') as f:
+        json.dump(results, f)
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_arg_parser().parse_args(script_arguments(sys.argv if argv is None else argv))
+    if args.worker:
+        return worker_main(args.worker)
+    if not args.inputs:
+        print("No export files or folders given")
+        return 2
+
+    options = {name: getattr(args, name) for name, _, _ in IMPORT_OPTIONS if getattr(args, name) is not None}
+    if 'start_position' in options:
+        options['start_position'] = tuple(options['start_position'])
+
+    profile_log = os.path.abspath(args.profile_log) if args.profile_log else None
+    start = time.perf_counter()
+    output_dir = os.path.abspath(args.output) if args.output else None
+    jobs = plan_jobs(find_inputs(args.inputs), args.group, output_dir)
+    if not jobs:
+        print("No camera or av items found")
+        return 2
+    print(f"{len(jobs)} files to write from {len(set(job.file for job in jobs))} export files")
+
+    if args.workers <= 0:
+        from .headless import BlendBuilder
+        results = run_jobs(jobs, options, BlendBuilder(profile_log))
+    else:
+        blender = blender_binary(args.blender)
+        if not blender:
+            print("Blender executable unknown, run this as a Blender script or pass --blender")
+            return 2
+        results = run_pool(jobs, options, args.workers, blender, profile_log)
+
+    report_path = args.report or os.path.join(output_dir or os.path.dirname(jobs[0].file), REPORT_NAME)
+    report = write_report(results, report_path, time.perf_counter() - start)
+    print_summary(results)
+    print(f"Report: {report_path}")
+    return 1 if report['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""Project catalog of the items of many export files.
+
+A directory tree is scanned for export files and the metadata of their
+items is stored in a SQLite database, in a cache folder outside of the
+project (see cache_path) or in the scanned root. Rescans only index the
+files whose size or modification time changed, so searching all shots of
+a project does not require opening each file.
+
+This module does not depend on bpy.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from . import parser
+from .track import Track, read_item
+
+CATALOG_NAME = ".aelink_catalog.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    deleted_mtime_ns INTEGER NOT NULL,
+    scanned REAL NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    file TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    comp TEXT NOT NULL,
+    fps REAL,
+    first_frame REAL,
+    last_frame REAL,
+    frame_count INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    PRIMARY KEY (file, id)
+);
+CREATE INDEX IF NOT EXISTS items_name ON items (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS items_comp ON items (comp COLLATE NOCASE);
+"""
+
+
+class CatalogItem(NamedTuple):
+    """Metadata of one cataloged item"""
+    file: str
+    id: str
+    name: str
+    type: str
+    comp: str
+    fps: Optional[float]
+    first_frame: Optional[float]
+    last_frame: Optional[float]
+    frame_count: int
+    start: int
+    end: int
+
+
+class ScanResult(NamedTuple):
+    indexed: int
+    unchanged: int
+    removed: int
+    errors: List[Tuple[str, str]]
+
+
+def catalog_path(root: str) -> str:
+    return os.path.join(root, CATALOG_NAME)
+
+
+def cache_path(cache_dir: str, root: str) -> str:
+    """Database of root in a cache folder, one per root directory"""
+    root = os.path.normcase(os.path.abspath(root))
+    digest = hashlib.sha1(root.encode('utf-8', 'surrogateescape')).hexdigest()[:16]
+    return os.path.join(cache_dir, f"catalog_{digest}.db")
+
+
+def find_export_files(root: str) -> List[str]:
+    """Return the paths of all JSON files below root, tombstone files excluded"""
+    paths = []
+    for directory, dirnames, _ in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for name in sorted(parser.get_json_files(directory)):
+            if not name.endswith(parser.TOMBSTONE_SUFFIX):
+                paths.append(os.path.join(directory, name))
+    return paths
+
+
+def _deleted_mtime_ns(path: str) -> int:
+    try:
+        return os.stat(parser.tombstone_path(path)).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _escape_like(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class Catalog:
+    """SQLite catalog of the export files below a root directory
+
+    The database is db_path, or CATALOG_NAME in the root when not given.
+    """
+
+    def __init__(self, root: str, db_path: Optional[str] = None):
+        self.root = os.path.abspath(root)
+        self.db_path = db_path or catalog_path(self.root)
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection, one per call so scans can run on worker threads"""
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def scan(self, progress: Optional[Callable[..., None]] = None) -> ScanResult:
+        """Index new and changed export files below the root, forget removed ones
+
+        progress is called with the fraction of files checked and a status
+        text, it may raise to stop the scan. Files scanned so far are kept.
+        """
+        paths = find_export_files(self.root)
+        indexed = unchanged = 0
+        errors = []
+
+        with closing(self.connect()) as connection:
+            known = {row[0]: row[1:] for row in connection.execute(
+                "SELECT path, size, mtime_ns, deleted_mtime_ns FROM files")}
+
+            for i, path in enumerate(paths):
+                if progress is not None:
+                    progress(i / max(len(paths), 1), os.path.relpath(path, self.root))
+                try:
+                    size, mtime_ns = parser.file_signature(path)
+                except OSError:
+                    continue
+                signature = (size, mtime_ns, _deleted_mtime_ns(path))
+                if known.get(path) == signature:
+                    unchanged += 1
+                    continue
+
+                error = self._index_file(connection, path, signature)
+                if error:
+                    errors.append((path, error))
+                else:
+                    indexed += 1
+
+            # Files below the root that are gone
+            present = set(paths)
+            prefix = _escape_like(os.path.join(self.root, '')) + '%'
+            gone = [row[0] for row in connection.execute(
+                "SELECT path FROM files WHERE path LIKE ? ESCAPE '\\'", (prefix,))
+                if row[0] not in present]
+            with connection:
+                connection.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in gone])
+
+        return ScanResult(indexed, unchanged, len(gone), errors)
+
+    def _index_file(self, connection: sqlite3.Connection, path: str, signature) -> Optional[str]:
+        """Replace the rows of one file, return an error text if it is not an export file"""
+        error = None
+        rows = []
+        try:
+            # Indexes of scanned files are not kept, a project can have thousands
+            for entry in parser.visible_items(path, cache=False):
+                fps = entry.header.get('comp_details', {}).get('fps')
+                rows.append((path, entry.id, entry.name, entry.type, entry.comp or "",
+                             float(fps) if isinstance(fps, (int, float)) else None,
+                             entry.first_frame, entry.last_frame, entry.frame_count,
+                             entry.start, entry.end))
+        except (OSError, ValueError) as e:
+            error = str(e)
+            rows = []
+
+        with connection:
+            connection.execute("DELETE FROM files WHERE path = ?", (path,))
+            connection.execute(
+                "INSERT INTO files (path, size, mtime_ns, deleted_mtime_ns, scanned, error) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (path, *signature, time.time(), error)
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return error
+
+    def search(self, text: str = "", item_type: str = "", limit: int = 500) -> List[CatalogItem]:
+        """Items whose name, composition or file contain text, by composition and name"""
+        if not os.path.isfile(self.db_path):
+            return []
+        pattern = f"%{_escape_like(text)}%"
+        query = ("SELECT file, id, name, type, comp, fps, first_frame, last_frame, frame_count, start, end "
+                 "FROM items WHERE (name LIKE ?1 ESCAPE '\\' OR comp LIKE ?1 ESCAPE '\\' "
+                 "OR file LIKE ?1 ESCAPE '\\')")
+        params = [pattern]
+        if item_type:
+            query += " AND type = ?2"
+            params.append(item_type)
+        query += " ORDER BY comp COLLATE NOCASE, name COLLATE NOCASE LIMIT ?"
+        params.append(limit)
+        with closing(self.connect()) as connection:
+            return [CatalogItem(*row) for row in connection.execute(query, params)]
+
+    def get(self, file: str, item_id: str) -> Optional[CatalogItem]:
+        if not os.path.isfile(self.db_path):
+            return None
+        with closing(self.connect()) as connection:
+            row = connection.execute(
+                "SELECT file, id, name, type, comp, fps, first_frame, last_frame, frame_count, start, end "
+                "FROM items WHERE file = ? AND id = ?", (file, item_id)).fetchone()
+        return CatalogItem(*row) if row else None
+
+    def load(self, file: str, item_id: str) -> Tuple[Optional[Dict], Optional[Track], Optional[int]]:
+        """Like track.read_item, reading only the cataloged span when possible"""
+        item = self.get(file, item_id)
+        if item is None:
+            return read_item(file, item_id)
+        return self.load_item(item)
+
+    def load_item(self, item: CatalogItem) -> Tuple[Optional[Dict], Optional[Track], Optional[int]]:
+        """Return (item, track, checksum) of a cataloged item
+
+        Only the item's byte span is read while its file is unchanged since
+        the scan. Otherwise, or with an up to date sidecar, this falls back
+        to track.read_item.
+        """
+        with closing(self.connect()) as connection:
+            row = connection.execute(
+                "SELECT size, mtime_ns FROM files WHERE path = ?", (item.file,)).fetchone()
+        try:
+            unchanged = row is not None and tuple(row) == parser.file_signature(item.file)
+        except OSError:
+            unchanged = False
+        if not unchanged or parser.open_sidecar(item.file) is not None:
+            return read_item(item.file, item.id)
+
+        with open(item.file, 'rb') as f:
+            f.seek(item.start)
+            raw = f.read(item.end - item.start)
+        item_data = json.loads(raw)
+        return item_data, Track.from_transform_data(item_data.get('transform_data', {})), zlib.crc32(raw)
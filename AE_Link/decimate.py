@@ -0,0 +1,181 @@
+"""Error-bounded keyframe reduction of baked channels.
+
+Every channel is reduced independently to the fewest keys that reproduce
+all baked samples within a tolerance. Keys are chosen Douglas-Peucker
+style, but all segments that exceed the tolerance are split in the same
+vectorized pass. Splits are kept balanced and every pass only checks the
+samples of segments that changed, so a pass shortens all open segments
+and long tracks need a few dozen passes.
+
+This module does not depend on bpy.
+"""
+
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class Reduction(NamedTuple):
+    """Keys of one reduced channel"""
+    frames: np.ndarray
+    values: np.ndarray
+    # (K, 2) handle coordinates for Bezier keys, None for linear keys
+    handles_left: Optional[np.ndarray]
+    handles_right: Optional[np.ndarray]
+    max_error: float
+
+
+def _ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Concatenation of np.arange(start, stop) for every pair"""
+    lengths = stops - starts
+    offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(lengths.sum()) + offsets
+
+
+def _split_points(samples: np.ndarray, errors: np.ndarray, starts: np.ndarray, stops: np.ndarray,
+                  lengths: np.ndarray, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (new keys, violating segment mask) of segments given by their inner samples
+
+    samples are the inner samples of the segments from starts to stops,
+    grouped by segment, lengths the sample count of each segment. Every
+    segment above tolerance is split at its worst sample, and also at the
+    middle of the longer part when the worst sample is in the outer quarter,
+    so every pass at least shortens segments to three quarters.
+    """
+    offsets = np.cumsum(lengths) - lengths
+    seg_max = np.maximum.reduceat(errors, offsets)
+    violating = seg_max > tolerance
+    if not violating.any():
+        return samples[:0], violating
+
+    # First sample with the maximum error of each violating segment
+    candidates = np.flatnonzero(np.repeat(violating, lengths) & (errors == np.repeat(seg_max, lengths)))
+    groups = np.searchsorted(offsets, candidates, side='right') - 1
+    first = np.ones(len(candidates), dtype=bool)
+    first[1:] = groups[1:] != groups[:-1]
+    worst = samples[candidates[first]]
+
+    start = starts[violating]
+    stop = stops[violating]
+    size = stop - start
+    near_start = (worst - start) * 4 < size
+    near_stop = (stop - worst) * 4 < size
+    middle = np.where(near_start, (worst + stop) // 2, (start + worst) // 2)[near_start | near_stop]
+    return np.concatenate((worst, middle)), violating
+
+
+def _linear_curve(x: np.ndarray, y: np.ndarray, keys: np.ndarray, samples: np.ndarray,
+                  segments: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Linear interpolation of the keys at samples
+
+    segments are the key intervals holding the samples, lengths their
+    sample counts. Coefficients are computed per segment and repeated.
+    """
+    x0 = x[keys[segments]]
+    y0 = y[keys[segments]]
+    slope = (y[keys[segments + 1]] - y0) / (x[keys[segments + 1]] - x0)
+    return np.repeat(y0 - slope * x0, lengths) + np.repeat(slope, lengths) * x[samples]
+
+
+def hermite_tangents(kx: np.ndarray, ky: np.ndarray) -> np.ndarray:
+    """Slopes at the keys, central differences clamped to zero at extrema"""
+    count = len(kx)
+    slopes = np.zeros(count)
+    if count < 3:
+        return slopes
+
+    secants = np.diff(ky) / np.diff(kx)
+    slopes[1:-1] = (ky[2:] - ky[:-2]) / (kx[2:] - kx[:-2])
+    # No overshoot past local extrema, like auto clamped handles
+    slopes[1:-1][secants[:-1] * secants[1:] <= 0] = 0.0
+    return slopes
+
+
+def _hermite_curve(x: np.ndarray, y: np.ndarray, keys: np.ndarray, samples: np.ndarray,
+                   segments: np.ndarray, lengths: np.ndarray, slopes: np.ndarray) -> np.ndarray:
+    """Hermite curve through the keys with slopes at samples, arguments as for _linear_curve"""
+    x0 = x[keys[segments]]
+    y0 = y[keys[segments]]
+    dx = x[keys[segments + 1]] - x0
+    secant = (y[keys[segments + 1]] - y0) / dx
+    m0 = slopes[segments]
+    m1 = slopes[segments + 1]
+    # Power form in u = x - x0
+    c2 = (3 * secant - 2 * m0 - m1) / dx
+    c3 = (m0 + m1 - 2 * secant) / (dx * dx)
+    u = x[samples] - np.repeat(x0, lengths)
+    cubic = np.repeat(c2, lengths) + u * np.repeat(c3, lengths)
+    return np.repeat(y0, lengths) + u * (np.repeat(m0, lengths) + u * cubic)
+
+
+def bezier_handles(kx: np.ndarray, ky: np.ndarray, slopes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Aligned handles one third of the neighboring intervals long
+
+    Bezier segments with these handles evaluate exactly to the Hermite
+    curve used by _hermite_curve.
+    """
+    intervals = np.diff(kx)
+    left_len = np.concatenate(([intervals[0] if len(intervals) else 1.0], intervals)) / 3.0
+    right_len = np.concatenate((intervals, [intervals[-1] if len(intervals) else 1.0])) / 3.0
+
+    left = np.column_stack((kx - left_len, ky - slopes * left_len))
+    right = np.column_stack((kx + right_len, ky + slopes * right_len))
+    return left, right
+
+
+def reduce_channel(frames, values, tolerance: float, mode: str = 'LINEAR') -> Reduction:
+    """Reduce one baked channel to keys within tolerance of every sample
+
+    mode is 'LINEAR' for linear interpolation or 'BEZIER' for aligned
+    Bezier handles, see bezier_handles.
+    """
+    x = np.asarray(frames, dtype=np.float64)
+    y = np.asarray(values, dtype=np.float64)
+    count = len(x)
+    tolerance = max(float(tolerance), 0.0)
+    bezier = mode == 'BEZIER'
+
+    keys = np.arange(min(count, 2)) * max(count - 1, 0)
+    errors = np.zeros(count)
+    slopes = np.zeros(len(keys))
+    # Segments to check, by the index of their first key
+    dirty = np.arange(max(len(keys) - 1, 0))
+    while len(dirty):
+        starts = keys[dirty]
+        stops = keys[dirty + 1]
+        lengths = stops - starts - 1
+        inner = lengths > 0
+        dirty, starts, stops, lengths = dirty[inner], starts[inner], stops[inner], lengths[inner]
+        if not len(dirty):
+            break
+
+        samples = _ranges(starts + 1, stops)
+        if bezier:
+            curve = _hermite_curve(x, y, keys, samples, dirty, lengths, slopes)
+        else:
+            curve = _linear_curve(x, y, keys, samples, dirty, lengths)
+        errors[samples] = np.abs(y[samples] - curve)
+
+        added, violating = _split_points(samples, errors[samples], starts, stops, lengths, tolerance)
+        if not len(added):
+            break
+        # Split points are inner samples and never coincide
+        keys = np.sort(np.concatenate((keys, added)))
+        errors[added] = 0.0
+
+        # Only the parts of split segments change, plus the neighbors of
+        # split segments in Bezier mode, whose end tangents move
+        split = np.searchsorted(keys, np.concatenate((starts[violating], added)))
+        if bezier:
+            slopes = hermite_tangents(x[keys], y[keys])
+            ends = np.searchsorted(keys, stops[violating])
+            split = np.concatenate((split, split - 1, ends))
+        marked = np.zeros(len(keys) - 1, dtype=bool)
+        marked[np.clip(split, 0, len(keys) - 2)] = True
+        dirty = np.flatnonzero(marked)
+
+    if not bezier:
+        return Reduction(x[keys], y[keys], None, None, float(errors.max(initial=0.0)))
+
+    left, right = bezier_handles(x[keys], y[keys], slopes)
+    return Reduction(x[keys], y[keys], left, right, float(errors.max(initial=0.0)))
@@ -0,0 +1,118 @@
+"""Reuse of camera datablocks and actions built by earlier imports.
+
+Every camera datablock and action made by an import is tagged with a
+fingerprint of what it was built from: the lens settings for cameras, the
+track contents and conversion options for actions. Importing the same
+data again links the existing datablock instead of building a copy.
+
+Datablocks also keep a hash of their contents from when they were tagged,
+so a camera or action edited by the user since is not reused.
+"""
+
+import hashlib
+import json
+
+import bpy
+import numpy as np
+
+from . import keyframes
+
+# Custom property holding the fingerprint of a datablock
+FINGERPRINT_KEY = "ae_link_fingerprint"
+# Custom property holding the content hash of a datablock when it was tagged
+STATE_KEY = "ae_link_state"
+
+# Camera settings compared before a tagged camera is reused
+CAMERA_SETTINGS = ('type', 'lens', 'lens_unit', 'sensor_fit', 'sensor_width', 'sensor_height',
+                   'shift_x', 'shift_y', 'clip_start', 'clip_end')
+# Keyframe attributes compared before a tagged action is reused: name, values per key, dtype
+KEY_ATTRIBUTES = (('co', 2, np.float32), ('handle_left', 2, np.float32), ('handle_right', 2, np.float32),
+                  ('interpolation', 1, np.int32))
+
+# Import options that change the keys written for a track
+ANIMATION_OPTIONS = ('bulk_keyframes', 'decimate', 'decimate_mode', 'location_tolerance', 'rotation_tolerance',
+                     'reduce_motion', 'bake_reduction', 'start_position')
+
+
+def _hash(*parts):
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def camera_fingerprint(item_data):
+    return _hash('camera', item_data.get('camera_data', {}))
+
+
+def animation_fingerprint(track, offset, options):
+    """Fingerprint of the keys bake_animation writes for track"""
+    settings = {key: options.get(key) for key in ANIMATION_OPTIONS}
+    # Bulk keys use the interpolation of the user preferences
+    settings['key_settings'] = list(keyframes.default_key_settings())
+    return _hash('animation', track.digest(), [round(float(v), 9) for v in offset], settings)
+
+
+def camera_state(camera):
+    """Hash of the settings of a camera datablock"""
+    return _hash('camera_state', [getattr(camera, name) for name in CAMERA_SETTINGS])
+
+
+def action_state(action):
+    """Hash of the keyframes of all fcurves of an action"""
+    digest = hashlib.blake2b(digest_size=16)
+    for fcurve in keyframes.action_fcurves(action):
+        points = fcurve.keyframe_points
+        digest.update(json.dumps([fcurve.data_path, fcurve.array_index, len(points)]).encode('utf-8'))
+        for attr, width, dtype in KEY_ATTRIBUTES:
+            values = np.zeros(len(points) * width, dtype=dtype)
+            points.foreach_get(attr, values)
+            digest.update(values.data)
+    return digest.hexdigest()
+
+
+class Registry:
+    """Tagged cameras and actions of the current file, by fingerprint"""
+
+    def __init__(self):
+        self.cameras = {}
+        self.actions = {}
+        for camera in bpy.data.cameras:
+            if camera.get(FINGERPRINT_KEY):
+                self.cameras.setdefault(camera[FINGERPRINT_KEY], camera)
+        for action in bpy.data.actions:
+            if action.get(FINGERPRINT_KEY):
+                self.actions.setdefault(action[FINGERPRINT_KEY], action)
+
+    def _find(self, table, fingerprint, state):
+        datablock = table.get(fingerprint)
+        if datablock is None:
+            return None
+        try:
+            # Removed datablocks raise ReferenceError, retagged ones hold
+            # another fingerprint
+            if datablock.get(FINGERPRINT_KEY) == fingerprint:
+                if datablock.get(STATE_KEY) == state(datablock):
+                    return datablock
+                # Edited since it was built, never reuse it
+                del datablock[FINGERPRINT_KEY]
+        except ReferenceError:
+            pass
+        del table[fingerprint]
+        return None
+
+    def camera(self, fingerprint):
+        return self._find(self.cameras, fingerprint, camera_state)
+
+    def action(self, fingerprint):
+        return self._find(self.actions, fingerprint, action_state)
+
+    def add_camera(self, fingerprint, camera):
+        camera[FINGERPRINT_KEY] = fingerprint
+        camera[STATE_KEY] = camera_state(camera)
+        self.cameras[fingerprint] = camera
+
+    def add_action(self, fingerprint, action):
+        action[FINGERPRINT_KEY] = fingerprint
+        action[STATE_KEY] = action_state(action)
+        self.actions[fingerprint] = action
@@ -0,0 +1,62 @@
+"""Import side of batch.py, running in background Blender instances.
+
+Each job is imported into an empty file with the code of the Import
+Checked operator and saved as a .blend file. With a profile log, the
+load, import and save stages of every job are appended to it as a run.
+"""
+
+import sys
+
+import bpy
+
+from . import operators, profiling
+
+
+def ensure_registered():
+    """Register the add-on when a script runs it without enabling it"""
+    if not hasattr(bpy.types.Scene, "bl_camera_retime"):
+        sys.modules[__package__].register()
+
+
+class BlendBuilder(operators.CameraImportMixin):
+    """Builds the .blend file of a batch job, see batch.run_jobs"""
+
+    def __init__(self, profile_log=None):
+        self.profile_log = profile_log
+        self.reports = []
+
+    def report(self, level, message):
+        self.reports.append(f"{next(iter(level))}: {message}")
+
+    def build(self, job, options):
+        """Import the items of job into an empty file and save it, return (imported items, reports)"""
+        bpy.ops.wm.read_homefile(use_empty=True)
+        ensure_registered()
+        self.reports = []
+
+        scene = bpy.context.scene
+        scene.name = job.name
+        # Options left out keep the defaults of the scene properties
+        for name, value in options.items():
+            setattr(scene, f"bl_camera_{name}", value)
+        # There is no window to switch scenes in, every file has one scene
+        scene.bl_camera_create_new_scene = False
+
+        if self.profile_log:
+            scene.bl_profile_enabled = True
+            scene.bl_profile_log_path = self.profile_log
+        profiler = operators.profile_run(bpy.context, f"Batch {job.name}")
+        profiler.extra['file'] = job.file
+        with profiler:
+            keys = [(job.file, item_id) for item_id in job.item_ids]
+            with profiling.stage("load"):
+                loaded = operators.load_items(None, keys, self.read_import_options(bpy.context))
+            with profiling.stage("import", sum(len(item.track) for item in loaded if item.track is not None)):
+                operators.BL_OT_import_selected.build(self, bpy.context, loaded)
+
+            imported = sum(1 for obj in scene.objects if "ae_link_id" in obj)
+            if imported:
+                with profiling.stage("save"):
+                    bpy.ops.wm.save_as_mainfile(filepath=job.output, check_existing=False)
+        operators.report_profile(self, profiler)
+        return imported, self.reports
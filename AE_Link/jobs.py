@@ -0,0 +1,93 @@
+"""Background jobs for reading and converting export data.
+
+A Job runs a function on a worker thread. The function receives the job
+and reports progress through job.update(), which raises Cancelled once the
+job was cancelled. Results are picked up on the main thread, where modal
+operators write them into datablocks. Stages of the function are recorded
+into the profiler that was active when the job was created.
+
+This module does not depend on bpy.
+"""
+
+import threading
+from typing import Callable, List, Optional
+
+from . import profiling
+
+
+class Cancelled(Exception):
+    """Raised inside a job function when the job was cancelled"""
+
+
+class Job:
+    """Function running on a worker thread, with progress and cancellation"""
+
+    def __init__(self, name: str, target: Callable, *args):
+        self.name = name
+        self.progress = 0.0
+        self.status = ""
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self._target = target
+        self._args = args
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._profiler = profiling.active()
+        self._thread = threading.Thread(target=self._run, name=f"AE Link {name}", daemon=True)
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def start(self) -> 'Job':
+        active.append(self)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def update(self, progress: float, status: Optional[str] = None):
+        """Report progress from 0 to 1, raises Cancelled if the job was cancelled"""
+        if self._cancel.is_set():
+            raise Cancelled()
+        self.progress = min(max(progress, 0.0), 1.0)
+        if status is not None:
+            self.status = status
+
+    def step(self, start: float, end: float) -> Callable[[float], None]:
+        """Progress callback mapping 0..1 of a sub-task to start..end of the job"""
+        return lambda fraction: self.update(start + (end - start) * fraction)
+
+    def _run(self):
+        try:
+            with profiling.attached(self._profiler):
+                self.result = self._target(self, *self._args)
+            self.progress = 1.0
+        except Cancelled:
+            pass
+        except Exception as e:
+            self.error = e
+        finally:
+            self._done.set()
+
+    def finish(self):
+        """Forget a done job, called by its owner after using the result"""
+        if self in active:
+            active.remove(self)
+
+
+# Started jobs that were not finished yet, shown in the sidebar panel
+active: List[Job] = []
+
+
+def cancel_all():
+    for job in list(active):
+        job.cancel()
@@ -0,0 +1,169 @@
+import bpy
+import numpy as np
+
+# Raw DNA values expected by foreach_set for the keyframe enum properties
+INTERPOLATION_VALUES = {'CONSTANT': 0, 'LINEAR': 1, 'BEZIER': 2}
+HANDLE_TYPE_VALUES = {'FREE': 0, 'AUTO': 1, 'VECTOR': 2, 'ALIGNED': 3, 'AUTO_CLAMPED': 4}
+
+TRANSFORM_GROUP = "Object Transforms"
+
+def default_key_settings(context=None):
+    """Return the (interpolation, handle type) keyframe_insert would use"""
+    context = context or bpy.context
+    edit = context.preferences.edit
+    return edit.keyframe_new_interpolation_type, edit.keyframe_new_handle_type
+
+def ensure_action(obj, name=None):
+    """Return the action of obj, creating and assigning one if needed"""
+    anim_data = obj.animation_data or obj.animation_data_create()
+    if anim_data.action is None:
+        anim_data.action = bpy.data.actions.new(name=name or f"{obj.name}Action")
+    return anim_data.action
+
+def assign_action(obj, action):
+    """Make obj use an existing action, sharing it with the objects already using it"""
+    anim_data = obj.animation_data or obj.animation_data_create()
+    anim_data.action = action
+    # Blender 4.4+: a slot is not always picked automatically
+    if getattr(anim_data, "action_slot", False) is None and len(action.slots):
+        anim_data.action_slot = action.slots[0]
+
+def action_fcurves(action):
+    """Return the fcurves of all slots of an action"""
+    if len(getattr(action, "layers", ())):
+        # Blender 4.4+: slotted actions keep their fcurves in channelbags
+        return [fcurve for layer in action.layers for strip in layer.strips
+                for channelbag in strip.channelbags for fcurve in channelbag.fcurves]
+    return list(action.fcurves)
+
+def ensure_fcurve(obj, action, data_path, index, group=TRANSFORM_GROUP, clear=True):
+    """Return the fcurve for data_path[index] on the action of obj, emptied if clear is set"""
+    if hasattr(action, "fcurve_ensure_for_datablock"):
+        # Blender 4.4+: slotted actions
+        fcurve = action.fcurve_ensure_for_datablock(obj, data_path, index=index, group_name=group)
+    else:
+        fcurve = action.fcurves.find(data_path, index=index)
+        if fcurve is None:
+            fcurve = action.fcurves.new(data_path, index=index, action_group=group)
+    if clear:
+        fcurve.keyframe_points.clear()
+    return fcurve
+
+def interpolation_codes(interpolation):
+    """Return the raw values of a sequence of interpolation identifiers as an int32 array"""
+    names = np.asarray(interpolation)
+    if names.dtype.kind in 'iu':
+        return names.astype(np.int32, copy=False)
+    codes = np.empty(len(names), dtype=np.int32)
+    for name, value in INTERPOLATION_VALUES.items():
+        codes[names == name] = value
+    return codes
+
+def _set_points(points, attr, values, width, existing):
+    """foreach_set attr of all points, values holding the ones after the existing points"""
+    if existing:
+        # foreach_set writes whole collections, keep the existing values
+        full = np.empty(len(points) * width, dtype=values.dtype)
+        points.foreach_get(attr, full)
+        full[existing * width:] = values
+        values = full
+    points.foreach_set(attr, values)
+
+def fill_fcurve(fcurve, frames, values, interpolation='BEZIER', handle_type='AUTO_CLAMPED',
+                handles_left=None, handles_right=None):
+    """Allocate keyframe points after the existing ones of an fcurve and fill them with foreach_set
+
+    interpolation may be a single enum identifier, a sequence with one
+    identifier per key or their interpolation_codes. handles_left and
+    handles_right are optional (N, 2) handle coordinates, meant for the FREE
+    and ALIGNED handle types. Existing keys are written back unchanged.
+    """
+    count = len(frames)
+    points = fcurve.keyframe_points
+    existing = len(points)
+    points.add(count)
+
+    co = np.empty(count * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+    _set_points(points, "co", co, 2, existing)
+    if handles_left is not None and handles_right is not None:
+        _set_points(points, "handle_left", np.asarray(handles_left, dtype=np.float32).ravel(), 2, existing)
+        _set_points(points, "handle_right", np.asarray(handles_right, dtype=np.float32).ravel(), 2, existing)
+    else:
+        # Handles are recalculated by fcurve.update(), start them on the key
+        _set_points(points, "handle_left", co, 2, existing)
+        _set_points(points, "handle_right", co, 2, existing)
+
+    if isinstance(interpolation, str):
+        ipo = np.full(count, INTERPOLATION_VALUES[interpolation], dtype=np.int32)
+    else:
+        ipo = interpolation_codes(interpolation)
+    _set_points(points, "interpolation", ipo, 1, existing)
+
+    handles = np.full(count, HANDLE_TYPE_VALUES[handle_type], dtype=np.int32)
+    _set_points(points, "handle_left_type", handles, 1, existing)
+    _set_points(points, "handle_right_type", handles, 1, existing)
+
+    fcurve.update()
+
+def write_channels(obj, data_path, frames, channels, interpolation=None, handle_type=None, append=False):
+    """Write one fcurve per array index of data_path from per-channel value arrays
+
+    With append the keys are added after the existing keys of the fcurves.
+    """
+    if interpolation is None or handle_type is None:
+        default_ipo, default_handle = default_key_settings()
+        interpolation = default_ipo if interpolation is None else interpolation
+        handle_type = handle_type or default_handle
+    if not isinstance(interpolation, str):
+        # Convert once for all channels
+        interpolation = interpolation_codes(interpolation)
+
+    action = ensure_action(obj)
+    fcurves = []
+    for index, values in enumerate(channels):
+        fcurve = ensure_fcurve(obj, action, data_path, index, clear=not append)
+        fill_fcurve(fcurve, frames, values, interpolation, handle_type)
+        fcurves.append(fcurve)
+    return fcurves
+
+def write_reduced_channels(obj, data_path, reductions):
+    """Write one fcurve per array index of data_path from decimate.Reduction results
+
+    Linear reductions get LINEAR keys, Bezier ones get ALIGNED handles at
+    the computed positions.
+    """
+    action = ensure_action(obj)
+    fcurves = []
+    for index, reduction in enumerate(reductions):
+        fcurve = ensure_fcurve(obj, action, data_path, index)
+        if reduction.handles_left is None:
+            fill_fcurve(fcurve, reduction.frames, reduction.values, 'LINEAR', 'VECTOR')
+        else:
+            fill_fcurve(fcurve, reduction.frames, reduction.values, 'BEZIER', 'ALIGNED',
+                        reduction.handles_left, reduction.handles_right)
+        fcurves.append(fcurve)
+    return fcurves
+
+def write_transform_keyframes(obj, frames, locations, rotations, interpolation=None, handle_type=None,
+                              append=False):
+    """Bake location and rotation_euler keys for obj in a single pass
+
+    frames is a sequence of N frame numbers, locations and rotations are
+    (N, 3) arrays of Blender-space values. The result matches calling
+    keyframe_insert for every frame with the current preferences. With
+    append the keys are added after the ones written before, frames must
+    come after the last existing key.
+    """
+    frames = np.asarray(frames, dtype=np.float32)
+    locations = np.asarray(locations, dtype=np.float32).reshape(-1, 3)
+    rotations = np.asarray(rotations, dtype=np.float32).reshape(-1, 3)
+
+    write_channels(obj, "location", frames, locations.T, interpolation, handle_type, append)
+    write_channels(obj, "rotation_euler", frames, rotations.T, interpolation, handle_type, append)
+
+    # Leave the object at the last baked values like the per-frame path does
+    if len(frames):
+        obj.location = locations[-1]
+        obj.rotation_euler = rotations[-1]
@@ -0,0 +1,140 @@
+"""Shared datablocks of imported "av" layers.
+
+Footage is loaded once per source file: layers pointing at the same file
+share one image, one material and one plane mesh of the same size. The
+cache is filled from datablocks made by earlier imports, which are tagged
+with their normalized source path.
+"""
+
+import os
+import re
+from urllib.parse import unquote
+
+import bpy
+
+# Custom property that tags materials and meshes with their source path
+SOURCE_KEY = "ae_link_source"
+
+
+def resolve_source_path(path):
+    """Return a local file path for an exported source path
+
+    Older exports store AE's absoluteURI, which is URL-encoded and writes
+    Windows drives as "/c/...".
+    """
+    if os.path.exists(path):
+        return path
+    candidate = unquote(path)
+    match = re.match(r'^/([a-zA-Z])/(.*)$', candidate)
+    if match and os.name == 'nt':
+        candidate = f"{match.group(1)}:/{match.group(2)}"
+    return os.path.expanduser(candidate)
+
+
+def source_key(path):
+    return os.path.normcase(os.path.abspath(bpy.path.abspath(path)))
+
+
+class MediaCache:
+    """Images, materials and plane meshes of av layers, by source path"""
+
+    def __init__(self):
+        self.images = {}
+        self.materials = {}
+        self.meshes = {}
+        self._scanned = False
+
+    def _scan(self):
+        # One pass over existing datablocks instead of one per layer
+        if self._scanned:
+            return
+        self._scanned = True
+        for image in bpy.data.images:
+            if image.filepath:
+                self.images.setdefault(source_key(image.filepath), image)
+        for material in bpy.data.materials:
+            if material.get(SOURCE_KEY):
+                self.materials.setdefault(material[SOURCE_KEY], material)
+        for mesh in bpy.data.meshes:
+            if mesh.get(SOURCE_KEY):
+                size = tuple(mesh.get("ae_link_size", ()))
+                self.meshes.setdefault((mesh[SOURCE_KEY], size), mesh)
+
+    def image(self, path):
+        """Return the image of a source file, raises RuntimeError if it cannot be loaded"""
+        self._scan()
+        key = source_key(path)
+        image = self.images.get(key)
+        if image is None:
+            image = bpy.data.images.load(path, check_existing=True)
+            self.images[key] = image
+        return image
+
+    def material(self, path, image):
+        """Return the unlit, alpha-aware material showing image"""
+        self._scan()
+        key = source_key(path)
+        material = self.materials.get(key)
+        if material is None:
+            material = self._new_material(image)
+            material[SOURCE_KEY] = key
+            self.materials[key] = material
+        return material
+
+    def plane_mesh(self, path, width, height, material):
+        """Return a width x height plane with its origin at the top left corner
+
+        The layer space of AE has its origin at the top left corner with Y
+        pointing down, the plane spans X and -Y to match it.
+        """
+        self._scan()
+        key = (source_key(path), (float(width), float(height)))
+        mesh = self.meshes.get(key)
+        if mesh is None:
+            mesh = bpy.data.meshes.new(os.path.basename(path))
+            vertices = [(0.0, 0.0, 0.0), (0.0, -height, 0.0), (width, -height, 0.0), (width, 0.0, 0.0)]
+            mesh.from_pydata(vertices, [], [(0, 1, 2, 3)])
+            uv_layer = mesh.uv_layers.new(name="UVMap")
+            uv_layer.data.foreach_set("uv", (0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 1.0, 1.0))
+            mesh.materials.append(material)
+            mesh.update()
+            mesh[SOURCE_KEY] = key[0]
+            mesh["ae_link_size"] = key[1]
+            self.meshes[key] = mesh
+        return mesh
+
+    def _new_material(self, image):
+        material = bpy.data.materials.new(image.name)
+        material.use_nodes = True
+        nodes = material.node_tree.nodes
+        links = material.node_tree.links
+        nodes.clear()
+
+        texture = nodes.new('ShaderNodeTexImage')
+        texture.image = image
+        texture.location = (-500, 0)
+        if image.source == 'MOVIE':
+            texture.image_user.frame_duration = image.frame_duration
+            texture.image_user.use_auto_refresh = True
+
+        # Footage shows as rendered in AE, unaffected by scene lights
+        emission = nodes.new('ShaderNodeEmission')
+        emission.location = (-200, -100)
+        transparent = nodes.new('ShaderNodeBsdfTransparent')
+        transparent.location = (-200, 100)
+        mix = nodes.new('ShaderNodeMixShader')
+        mix.location = (50, 0)
+        output = nodes.new('ShaderNodeOutputMaterial')
+        output.location = (250, 0)
+
+        links.new(texture.outputs['Color'], emission.inputs['Color'])
+        links.new(texture.outputs['Alpha'], mix.inputs['Fac'])
+        links.new(transparent.outputs['BSDF'], mix.inputs[1])
+        links.new(emission.outputs['Emission'], mix.inputs[2])
+        links.new(mix.outputs['Shader'], output.inputs['Surface'])
+
+        if hasattr(material, 'surface_render_method'):
+            material.surface_render_method = 'BLENDED'
+        else:
+            material.blend_method = 'BLEND'
+        return material
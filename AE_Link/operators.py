@@ -1,11 +1,275 @@
 import bpy
 import json
 import os
-from math import radians, exp
+import time
+from math import degrees, radians
+from typing import NamedTuple, Optional
 from bpy.props import StringProperty, BoolProperty, FloatProperty, FloatVectorProperty, IntProperty
 from bpy.types import Operator
 from bpy_extras.io_utils import ImportHelper
 
+from . import catalog, decimate, dedup, jobs, keyframes, media, parser, profiling
+from .track import Track, hold_interpolation, load_item, motion_reduction_influence, read_item, reduce_motion
+
+def profile_run(context, name):
+    """Return a Profiler for an operator run, configured from the scene settings"""
+    scene = context.scene
+    log_path = bpy.path.abspath(scene.bl_profile_log_path) if scene.bl_profile_log_path else None
+    return profiling.Profiler(
+        name,
+        enabled=scene.bl_profile_enabled,
+        track_memory=scene.bl_profile_memory,
+        log_path=log_path,
+        extra={'blender': bpy.app.version_string, 'file': scene.bl_json_file_path}
+    )
+
+def report_profile(operator, profiler):
+    """Add the stage timings of a finished run to the operator report"""
+    if profiler.enabled:
+        operator.report({'INFO'}, profiling.format_summary(profiler.result()))
+
+# Incremented on every change of an items list, for the list's filter cache
+item_list_generation = 0
+
+def fill_item_list(scene, index):
+    """Update the items list of scene to the entries of an item index
+    
+    Only items that changed are added, removed or updated, so checked
+    items and the active item stay selected.
+    """
+    global item_list_generation
+    items = scene.bl_json_items
+    active_index = scene.bl_active_json_index
+    active_id = items[active_index].id if 0 <= active_index < len(items) else None
+    entries = {entry.id: entry for entry in index}
+    
+    # Remove items no longer in the file, from the end so indices stay valid
+    for i in range(len(items) - 1, -1, -1):
+        if items[i].id not in entries:
+            items.remove(i)
+    
+    # Update the remaining ones, writing only changed values
+    existing = set()
+    for item in items:
+        entry = entries[item.id]
+        existing.add(item.id)
+        if item.name != entry.name:
+            item.name = entry.name
+        if item.type != entry.type:
+            item.type = entry.type
+        if item.comp != (entry.comp or ""):
+            item.comp = entry.comp or ""
+    
+    # Add new items
+    for entry in index:
+        if entry.id not in existing:
+            item = items.add()
+            item.name = entry.name
+            item.type = entry.type
+            item.comp = entry.comp or ""
+            item.id = entry.id
+    
+    # Keep the same item active
+    if active_id is not None:
+        for i, item in enumerate(items):
+            if item.id == active_id:
+                if i != active_index:
+                    scene.bl_active_json_index = i
+                break
+        else:
+            scene.bl_active_json_index = min(active_index, max(len(items) - 1, 0))
+    item_list_generation += 1
+
+# Motion reduction always uses the maximum factor
+MOTION_REDUCTION_FACTOR = 100
+
+# Results shown for a catalog search
+CATALOG_RESULT_LIMIT = 500
+
+def catalog_cache_dir():
+    """Per-user folder of the catalog databases"""
+    try:
+        return bpy.utils.extension_path_user(__package__, path="catalogs", create=True)
+    except (AttributeError, ValueError):
+        # Loaded as a legacy add-on instead of an extension
+        return bpy.utils.user_resource('DATAFILES', path=os.path.join("ae_link", "catalogs"), create=True)
+
+def project_catalog(scene, root):
+    """Return the catalog of root, stored in the user cache unless the scene keeps it in the folder"""
+    if scene.bl_catalog_in_folder:
+        return catalog.Catalog(root)
+    return catalog.Catalog(root, catalog.cache_path(catalog_cache_dir(), root))
+
+def search_catalog(scene):
+    """Fill the catalog results of scene with the items matching its search text"""
+    global item_list_generation
+    results = scene.bl_catalog_items
+    results.clear()
+    root = bpy.path.abspath(scene.bl_catalog_root) if scene.bl_catalog_root else ""
+    if os.path.isdir(root):
+        for entry in project_catalog(scene, root).search(scene.bl_catalog_search, limit=CATALOG_RESULT_LIMIT):
+            item = results.add()
+            item.name = entry.name
+            item.type = entry.type
+            item.comp = entry.comp
+            item.id = entry.id
+            item.file = entry.file
+    scene.bl_active_catalog_index = min(scene.bl_active_catalog_index, max(len(results) - 1, 0))
+    item_list_generation += 1
+
+class LoadedItem(NamedTuple):
+    """An item read for import, error is set if reading failed"""
+    filepath: str
+    id: str
+    data: Optional[dict]
+    track: Optional[Track]
+    # CRC32 of the item's bytes in the export file, for live sync
+    checksum: Optional[int]
+    error: Optional[Exception]
+    seconds: float
+
+def comp_offsets():
+    """Return {composition: location offset} of the imported cameras, see CameraImportMixin.comp_offset"""
+    offsets = {}
+    for obj in bpy.data.objects:
+        comp = obj.get("ae_link_comp")
+        if obj.type == 'CAMERA' and comp and "ae_link_offset" in obj:
+            offsets.setdefault(comp, tuple(obj["ae_link_offset"]))
+    return offsets
+
+def retime_track(item_data, track, options):
+    """Return track resampled as set by the retime options, or track itself
+    
+    The resampled track is kept in the cache of track, see Track.resample.
+    """
+    source_fps = item_data.get('comp_details', {}).get('fps')
+    if not options.get('retime') or not source_fps or not len(track):
+        return track
+    target_fps = options['retime_fps'] or source_fps
+    return track.resample(source_fps, target_fps, options['retime_step'], options['retime_position'])
+
+def load_items(job, keys, options, loader=read_item, offsets=None):
+    """Read (filepath, item id) keys and convert their tracks, without touching bpy
+    
+    Runs on a worker thread when job is given. Tracks are retimed with the
+    import options, and conversions and fingerprints are kept on the
+    tracks, so the main thread only writes datablocks. Layers are converted
+    with the offset of a camera of their composition loaded before them,
+    or from offsets, see comp_offsets. loader returns (item, track,
+    checksum) like track.read_item.
+    """
+    offsets = dict(offsets or {})
+    indexing = 0.0
+    if job is not None and loader is read_item:
+        # Indexing is the slow part of reading a file the first time
+        indexing = 0.3
+        filepaths = [f for f in dict.fromkeys(f for f, _ in keys) if parser.open_sidecar(f) is None]
+        for n, filepath in enumerate(filepaths):
+            job.update(indexing * n / len(filepaths), "Indexing")
+            parser.index_json_file(filepath, job.step(indexing * n / len(filepaths),
+                                                      indexing * (n + 1) / len(filepaths)))
+    
+    loaded = []
+    for i, (filepath, item_id) in enumerate(keys):
+        if job is not None:
+            job.update(indexing + (1.0 - indexing) * i / len(keys), f"Loading {item_id}")
+        start = time.perf_counter()
+        try:
+            with profiling.stage(f"load {item_id}"):
+                item_data, track, checksum = loader(filepath, item_id)
+            item_type = item_data.get('type') if item_data else None
+            if item_type in ('camera', 'av') and len(track):
+                with profiling.stage("retime", len(track)):
+                    retimed = retime_track(item_data, track, options)
+                comp = item_data.get('comp')
+                if item_type == 'camera':
+                    offset = retimed.start_offset(options['start_position'])
+                    if comp:
+                        offsets[comp] = tuple(offset)
+                else:
+                    offset = offsets.get(comp, (0.0, 0.0, 0.0))
+                with profiling.stage("convert", len(retimed)):
+                    retimed.to_blender(offset=offset)
+                    retimed.digest()
+        except Exception as e:
+            loaded.append(LoadedItem(filepath, item_id, None, None, None, e, 0.0))
+            continue
+        loaded.append(LoadedItem(filepath, item_id, item_data, track, checksum, None,
+                                 time.perf_counter() - start))
+    return loaded
+
+def set_scene_fps(scene, fps):
+    """Set the frame rate of scene, fractional rates like 29.97 through fps_base"""
+    scene.render.fps = max(1, round(fps))
+    scene.render.fps_base = scene.render.fps / fps
+
+def redraw_sidebar(context):
+    for area in context.screen.areas if context.screen else ():
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
+
+class BackgroundJobMixin:
+    """Runs the reading part of an operator on a worker thread when invoked from the UI
+    
+    start_job() returns a started jobs.Job, or None to cancel. When it is
+    done, finish_job() gets its result on the main thread and writes the
+    datablocks. execute() stays synchronous for scripts. Esc cancels.
+    Both threads are profiled as one run, like execute().
+    """
+    
+    def invoke(self, context, event):
+        self._profiler = profile_run(context, self.bl_label).start()
+        # The job records its stages into the profiler active when it is created
+        with profiling.attached(self._profiler):
+            job = self.start_job(context)
+        if job is None:
+            return {'CANCELLED'}
+        self._profiler.name = job.name
+        self._job = job
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, 100)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        job = self._job
+        if event.type == 'ESC' and event.value == 'PRESS':
+            job.cancel()
+        elif event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        context.window_manager.progress_update(int(job.progress * 100))
+        redraw_sidebar(context)
+        if not job.done:
+            return {'PASS_THROUGH'}
+        
+        self.end_job(context)
+        if job.cancelled:
+            self.report({'WARNING'}, f"{job.name} cancelled")
+            result = {'CANCELLED'}
+        elif job.error is not None:
+            self.report({'ERROR'}, f"Error reading JSON file: {str(job.error)}")
+            result = {'CANCELLED'}
+        else:
+            with profiling.attached(self._profiler):
+                result = self.finish_job(context, job.result)
+        self._profiler.finish()
+        report_profile(self, self._profiler)
+        return result
+    
+    def cancel(self, context):
+        self._job.cancel()
+        self.end_job(context)
+        self._profiler.finish()
+    
+    def end_job(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        self._job.finish()
+        redraw_sidebar(context)
+
 class BL_OT_select_json_file(Operator, ImportHelper):
     """Select a JSON file for import"""
     bl_idname = "bl.select_json_file"
@@ -13,13 +277,22 @@ class BL_OT_select_json_file(Operator, ImportHelper):
     bl_options = {'REGISTER', 'UNDO'}
     
     filter_glob: StringProperty(
-        default='*.json',
+        default='*.json;*.jsonl',
         options={'HIDDEN'}
     )
     
+    def invoke(self, context, event):
+        # Set on the instance the file browser calls execute() on
+        self._interactive = True
+        return super().invoke(context, event)
+    
     def execute(self, context):
         context.scene.bl_json_file_path = self.filepath
-        self.refresh_json_items(context)
+        if getattr(self, "_interactive", False) and not bpy.app.background:
+            # Picked in the file browser, index the file in the background
+            bpy.ops.bl.refresh_json_items('INVOKE_DEFAULT')
+        else:
+            self.refresh_json_items(context)
         return {'FINISHED'}
     
     def refresh_json_items(self, context):
@@ -30,32 +303,51 @@ class BL_OT_select_json_file(Operator, ImportHelper):
             self.report({'WARNING'}, "File does not exist")
             return
         
+        # Scene settings are not applied on file load, sync them here
+        parser.set_cache_budget(context.scene.bl_cache_budget_mb * 1024 * 1024)
+        
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            # Streams the file once and reuses the index while it is unchanged.
+            # Items deleted since the last compaction are left out
+            index = parser.visible_items(filepath)
         except Exception as e:
             self.report({'ERROR'}, f"Error reading JSON file: {str(e)}")
             return
         
-        # Clear existing items
-        context.scene.bl_json_items.clear()
-        
-        # Add items from JSON
-        for item_id, item_data in data.items():
-            item = context.scene.bl_json_items.add()
-            item.name = item_data.get('layer_name', 'Unnamed')
-            item.type = item_data.get('type', 'unknown')
-            item.id = item_id
+        fill_item_list(context.scene, index)
         
         self.report({'INFO'}, f"Loaded {len(context.scene.bl_json_items)} items from JSON")
 
-class BL_OT_refresh_json_items(Operator):
+class BL_OT_refresh_json_items(Operator, BackgroundJobMixin):
     """Refresh JSON items list"""
     bl_idname = "bl.refresh_json_items"
     bl_label = "Sync"
     bl_options = {'REGISTER', 'UNDO'}
     
+    def start_job(self, context):
+        filepath = context.scene.bl_json_file_path
+        if not filepath:
+            self.report({'WARNING'}, "No JSON file selected")
+            return None
+        if not os.path.isfile(filepath):
+            self.report({'WARNING'}, "File does not exist")
+            return None
+        
+        parser.set_cache_budget(context.scene.bl_cache_budget_mb * 1024 * 1024)
+        return jobs.Job("Sync", lambda job: parser.visible_items(filepath, job.update)).start()
+    
+    def finish_job(self, context, index):
+        fill_item_list(context.scene, index)
+        self.report({'INFO'}, f"Loaded {len(context.scene.bl_json_items)} items from JSON")
+        return {'FINISHED'}
+    
     def execute(self, context):
+        with profile_run(context, "Sync") as profiler:
+            result = self.run(context)
+        report_profile(self, profiler)
+        return result
+    
+    def run(self, context):
         if not context.scene.bl_json_file_path:
             self.report({'WARNING'}, "No JSON file selected")
             return {'CANCELLED'}
@@ -64,76 +356,81 @@ class BL_OT_refresh_json_items(Operator):
         self.report({'INFO'}, "Item list refreshed")
         return {'FINISHED'}
 
-class BL_OT_import_item(Operator):
-    """Import selected item from JSON"""
-    bl_idname = "bl.import_item"
-    bl_label = "Import Item"
-    bl_options = {'REGISTER', 'UNDO'}
+class CameraImportMixin:
+    """Scene setup, camera and av plane creation shared by the import operators"""
     
-    @classmethod
-    def poll(cls, context):
-        return (context.scene.bl_json_file_path and 
-                len(context.scene.bl_json_items) > 0 and
-                0 <= context.scene.bl_active_json_index < len(context.scene.bl_json_items))
+    def read_import_options(self, context):
+        """Read the import options from the scene before any new scene is made active"""
+        scene = context.scene
+        return {
+            'create_new_scene': scene.bl_camera_create_new_scene,
+            'apply_comp_settings': scene.bl_camera_apply_comp_settings,
+            'enable_motion_blur': scene.bl_camera_enable_motion_blur,
+            'transparent_bg': scene.bl_camera_transparent_bg,
+            'start_position': tuple(scene.bl_camera_start_position),
+            'reduce_motion': scene.bl_camera_reduce_motion,
+            'bake_reduction': scene.bl_camera_bake_reduction,
+            'set_qt_preset': scene.bl_camera_set_qt_preset,
+            'bulk_keyframes': scene.bl_camera_bulk_keyframes,
+            'decimate': scene.bl_camera_decimate,
+            'decimate_mode': scene.bl_camera_decimate_mode,
+            'location_tolerance': scene.bl_camera_location_tolerance,
+            'rotation_tolerance': scene.bl_camera_rotation_tolerance,
+            'retime': scene.bl_camera_retime,
+            'retime_fps': scene.bl_camera_retime_fps,
+            'retime_step': scene.bl_camera_retime_step,
+            'retime_position': scene.bl_camera_retime_position,
+        }
     
-    def execute(self, context):
-        filepath = context.scene.bl_json_file_path
-        active_index = context.scene.bl_active_json_index
-        
-        if not os.path.isfile(filepath):
-            self.report({'ERROR'}, "JSON file does not exist")
-            return {'CANCELLED'}
-        
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-        except Exception as e:
-            self.report({'ERROR'}, f"Error reading JSON file: {str(e)}")
-            return {'CANCELLED'}
-        
-        # Get the selected item
-        item_id = context.scene.bl_json_items[active_index].id
-        item_data = data.get(item_id)
-        
-        if not item_data:
-            self.report({'ERROR'}, "Selected item not found in JSON")
-            return {'CANCELLED'}
+    def import_camera(self, context, camera_data, track, filepath=None, item_id=None, checksum=None,
+                      options=None):
+        """Import camera data from JSON, with frames taken from track
         
-        # Handle different item types
-        item_type = item_data.get('type', 'unknown')
-        
-        if item_type == 'camera':
-            self.import_camera(context, item_data)
-        else:
-            self.report({'WARNING'}, f"Unsupported item type: {item_type}")
-        
-        return {'FINISHED'}
+        options default to the import options of the scene.
+        """
+        options = options or self.read_import_options(context)
+        with profiling.stage("scene_setup"):
+            scene = self.setup_scene(context, camera_data, options)
+        camera_obj = self.create_camera(scene, camera_data, track, options)
+        if filepath and item_id:
+            self.link_item(camera_obj, filepath, item_id, options, checksum)
+        self.report({'INFO'}, f"Imported camera: {camera_data['layer_name']}")
+        return camera_obj
+    
+    def import_av(self, context, item_data, track, filepath=None, item_id=None, checksum=None,
+                  media_cache=None):
+        """Import an av layer as a textured plane, None if its footage cannot be loaded"""
+        options = self.read_import_options(context)
+        with profiling.stage("scene_setup"):
+            scene = self.setup_scene(context, item_data, options)
+        plane_obj = self.create_av_plane(scene, item_data, track, options, media_cache or media.MediaCache())
+        if plane_obj is None:
+            return None
+        if filepath and item_id:
+            self.link_item(plane_obj, filepath, item_id, options, checksum)
+        self.report({'INFO'}, f"Imported layer: {item_data['layer_name']}")
+        return plane_obj
     
-    def import_camera(self, context, camera_data):
-        """Import camera data from JSON"""
-        # --- MODIFIED ---
-        # Read new/changed properties from scene
-        create_new_scene = context.scene.bl_camera_create_new_scene
-        apply_comp_settings = context.scene.bl_camera_apply_comp_settings
-        enable_motion_blur = context.scene.bl_camera_enable_motion_blur
-        transparent_bg = context.scene.bl_camera_transparent_bg
-        start_position = context.scene.bl_camera_start_position
-        reduce_motion = context.scene.bl_camera_reduce_motion # New boolean
-        set_qt_preset = context.scene.bl_camera_set_qt_preset # New boolean
-        # --- END MODIFIED ---
+    def setup_scene(self, context, item_data, options, name=None):
+        """Return the scene to import into, with composition and render settings applied"""
+        create_new_scene = options['create_new_scene']
+        apply_comp_settings = options['apply_comp_settings']
+        enable_motion_blur = options['enable_motion_blur']
+        transparent_bg = options['transparent_bg']
+        set_qt_preset = options['set_qt_preset']
         
         if create_new_scene:
             # Create a new scene
-            scene = bpy.data.scenes.new(name=camera_data['layer_name'])
+            scene = bpy.data.scenes.new(name=name or item_data['layer_name'])
             # Make the new scene persistent (not temporary)
             context.window.scene = scene
         else:
             scene = context.scene
         
         # Apply composition settings if enabled
-        comp_details = camera_data.get('comp_details', {})
+        comp_details = item_data.get('comp_details', {})
         if apply_comp_settings:
-            scene.render.fps = comp_details.get('fps', 24)
+            set_scene_fps(scene, comp_details.get('fps', 24))
             scene.render.resolution_x = comp_details.get('width', 1920)
             scene.render.resolution_y = comp_details.get('height', 1080)
             scene.render.resolution_percentage = 100
@@ -146,6 +443,10 @@ class BL_OT_import_item(Operator):
             if 'shutter_angle' in comp_details:
                 scene.render.motion_blur_shutter = comp_details['shutter_angle'] / 360
         
+        # Retimed keys are in frames of the target rate
+        if options['retime'] and options['retime_fps']:
+            set_scene_fps(scene, options['retime_fps'])
+        
         # Enable transparent background if requested
         if transparent_bg:
             scene.render.film_transparent = True
@@ -160,87 +461,222 @@ class BL_OT_import_item(Operator):
             scene.render.film_transparent = True # Also force this
         # --- END ADDED ---
         
-        # Create camera
-        camera = bpy.data.cameras.new(name=camera_data['layer_name'])
+        return scene
+    
+    def create_camera(self, scene, camera_data, track, options, registry=None):
+        """Create the camera object of an item in scene and bake its animation
+        
+        Camera data and actions built from the same data before are reused.
+        """
+        apply_comp_settings = options['apply_comp_settings']
+        start_position = options['start_position']
+        reduce_motion = options['reduce_motion']
+        registry = registry or dedup.Registry()
+        track = self.retimed(camera_data, track, options)
+        
+        # Create camera, or link camera data with the same settings
+        camera = self.camera_datablock(camera_data, registry)
         camera_obj = bpy.data.objects.new(camera_data['layer_name'], camera)
         scene.collection.objects.link(camera_obj)
         
         # Set camera as active
         scene.camera = camera_obj
         
-        # Set camera properties
-        camera_data_details = camera_data.get('camera_data', {})
-        if 'focal_length' in camera_data_details:
-            camera.lens = float(camera_data_details['focal_length'])
-        
-        if 'sensor_size' in camera_data_details:
-            camera.sensor_width = float(camera_data_details['sensor_size'])
-        
         # Import animation data
-        transform_data = camera_data.get('transform_data', {})
-        frames = transform_data.get('frames', [])
-        
-        if frames:
-            # Adjust frame numbers for Blender convention (starting at 1 instead of 0)
-            ae_start_frame = transform_data.get('start_frame', 0)
-            ae_end_frame = transform_data.get('end_frame', len(frames) - 1)
-            
+        if len(track):
             # Set scene frame range if composition settings are enabled
             if apply_comp_settings:
                 scene.frame_start = 1
-                scene.frame_end = ae_end_frame - ae_start_frame + 1
-            
-            # --- MODIFIED (Bug/UX Fix) ---
-            # Calculate offset to make first position equal to the user's 'start_position'
-            first_frame_data = frames[0]
-            first_pos = first_frame_data['position']
-            
-            # The offset is (TargetBlenderPos - FirstFrameAECoordsInBlenderSpace)
-            position_offset = (
-                start_position[0] - first_pos['x'],  # Offset X
-                start_position[1] - first_pos['z'],  # Offset Y (from AE Z)
-                start_position[2] + first_pos['y']   # Offset Z (from AE Y)
-            )
-            # --- END MODIFIED ---
+                scene.frame_end = int(track.end_frame - track.start_frame + 1)
             
-            # Set keyframes for position and rotation
-            for frame_data in frames:
-                # Adjust frame number for Blender convention (frame + 1)
-                ae_frame = frame_data['frame']
-                blender_frame = ae_frame - ae_start_frame + 1
-                
-                # Position conversion from AE to Blender coordinate system:
-                # AE: X, Y, Z (Z is depth)
-                # Blender: X, Z, -Y (Y is up)
-                # Apply offset to make first position the user-defined 'start_position'
-                pos = frame_data['position']
-                camera_obj.location = (
-                    pos['x'] + position_offset[0],  # X axis with offset
-                    pos['z'] + position_offset[1],  # Z in Blender = Y in AE with offset
-                    -pos['y'] + position_offset[2]  # -Y in Blender = Z in AE with offset
-                )
-                camera_obj.keyframe_insert(data_path="location", frame=blender_frame)
-                
-                # Rotation conversion from AE to Blender coordinate system:
-                # AE: X (pitch), Y (yaw), Z (roll)
-                # Blender: X (pitch), Z (yaw), Y (roll) with sign adjustments
-                # Add +90 degrees to X rotation to fix camera pointing at floor
-                rot = frame_data['orientation']
-                camera_obj.rotation_euler = (
-                    radians(-rot['x'] + 90),  # Pitch (inverted) + 90 degrees offset
-                    radians(rot['z']),        # Roll (swapped from Z)
-                    radians(-rot['y'])        # Yaw (swapped from Y, inverted)
-                )
-                camera_obj.keyframe_insert(data_path="rotation_euler", frame=blender_frame)
+            self.bake_animation(camera_obj, camera_data, track, options, registry=registry)
             
             # --- MODIFIED ---
-            # Apply motion reduction if the new checkbox is enabled
-            if reduce_motion:
+            # Apply motion reduction if the new checkbox is enabled.
+            # When baked, bake_animation already wrote the reduced keys
+            if reduce_motion and not options['bake_reduction']:
                 # Hard-code the factor to 100 as requested
-                self.apply_motion_reduction(camera_obj, 100, start_position)
+                with profiling.stage("motion_reduction"):
+                    self.apply_motion_reduction(camera_obj, MOTION_REDUCTION_FACTOR, start_position)
             # --- END MODIFIED ---
         
-        self.report({'INFO'}, f"Imported camera: {camera_data['layer_name']}")
+        return camera_obj
+    
+    def create_av_plane(self, scene, item_data, track, options, media_cache, registry=None):
+        """Create a plane showing the footage of an av item and bake its animation"""
+        av_data = item_data.get('avData', {})
+        path = media.resolve_source_path(av_data.get('path', ''))
+        try:
+            with profiling.stage("media"):
+                image = media_cache.image(path)
+        except RuntimeError as e:
+            self.report({'WARNING'}, f"{item_data['layer_name']}: cannot load {path}: {str(e)}")
+            return None
+        
+        width = av_data.get('width') or image.size[0]
+        height = av_data.get('height') or image.size[1]
+        material = media_cache.material(path, image)
+        mesh = media_cache.plane_mesh(path, width, height, material)
+        
+        plane_obj = bpy.data.objects.new(item_data['layer_name'], mesh)
+        scene.collection.objects.link(plane_obj)
+        
+        track = self.retimed(item_data, track, options)
+        if len(track):
+            # Keep the layer where it is relative to a camera of its composition
+            offset = self.comp_offset(item_data)
+            self.bake_animation(plane_obj, item_data, track, options, offset, registry)
+        return plane_obj
+    
+    def retimed(self, item_data, track, options):
+        """Return track resampled as set by the retime options, see retime_track
+        
+        Tracks read by load_items were resampled there already.
+        """
+        return retime_track(item_data, track, options)
+    
+    def comp_offset(self, item_data):
+        """Location offset of an imported camera of the same composition, zero if there is none"""
+        return comp_offsets().get(item_data.get('comp'), (0.0, 0.0, 0.0))
+    
+    def camera_datablock(self, camera_data, registry, camera=None):
+        """Return camera data with the lens settings of an item
+        
+        An existing datablock with the same settings is preferred. Otherwise
+        camera is updated in place, or a new datablock is created if camera
+        is None or shared with other objects.
+        """
+        fingerprint = dedup.camera_fingerprint(camera_data)
+        existing = registry.camera(fingerprint)
+        if existing is not None:
+            return existing
+        
+        if camera is None:
+            camera = bpy.data.cameras.new(name=camera_data['layer_name'])
+        elif camera.users > 1:
+            camera = camera.copy()
+        self.apply_camera_settings(camera, camera_data)
+        registry.add_camera(fingerprint, camera)
+        return camera
+    
+    def apply_camera_settings(self, camera, camera_data):
+        """Copy lens settings of an item to camera data"""
+        camera_data_details = camera_data.get('camera_data', {})
+        if 'focal_length' in camera_data_details:
+            camera.lens = float(camera_data_details['focal_length'])
+        
+        if 'sensor_size' in camera_data_details:
+            camera.sensor_width = float(camera_data_details['sensor_size'])
+    
+    def bake_animation(self, camera_obj, camera_data, track, options, offset=None, registry=None):
+        """Convert track and write it as location and rotation keyframes of camera_obj
+        
+        An action baked from the same track and options before is assigned
+        instead of writing the keys again.
+        """
+        start_position = options['start_position']
+        bulk_keyframes = options['bulk_keyframes']
+        registry = registry or dedup.Registry()
+        
+        if offset is None:
+            offset = track.start_offset(start_position)
+        # Layers of the same composition are placed with this offset
+        camera_obj["ae_link_offset"] = [float(v) for v in offset]
+        if camera_data.get('comp'):
+            camera_obj["ae_link_comp"] = camera_data['comp']
+        
+        with profiling.stage("fingerprint", len(track)):
+            fingerprint = dedup.animation_fingerprint(track, offset, options)
+        
+        anim_data = camera_obj.animation_data
+        current = anim_data.action if anim_data else None
+        action = registry.action(fingerprint)
+        if action is not None:
+            if action != current:
+                keyframes.assign_action(camera_obj, action)
+            return
+        if current is not None and current.users > 1:
+            # Shared with other objects, write the keys into a new action
+            anim_data.action = None
+        
+        # Convert the whole track at once. The first position is moved
+        # to the user's 'start_position', see Track.blender_locations
+        with profiling.stage("convert", len(track)):
+            blender_frames, locations, rotations = track.to_blender(offset=offset)
+            if camera_obj.type == 'CAMERA' and options['reduce_motion'] and options['bake_reduction']:
+                # Same result as the constraints of apply_motion_reduction
+                influence = motion_reduction_influence(MOTION_REDUCTION_FACTOR)
+                locations = reduce_motion(locations, start_position, influence)
+            # Sparse exports get constant holds and linear segments
+            interpolation = hold_interpolation(blender_frames)
+        
+        with profiling.stage("keyframes", len(track)):
+            if options['decimate']:
+                # Keep only the keys needed to stay within the tolerances
+                self.write_decimated_keyframes(camera_obj, camera_data['layer_name'],
+                                               blender_frames, locations, rotations, options)
+            elif bulk_keyframes or interpolation is not None:
+                # Create all fcurve points at once
+                keyframes.write_transform_keyframes(camera_obj, blender_frames, locations, rotations,
+                                                    interpolation)
+            else:
+                # Legacy path: one keyframe_insert per channel and frame
+                for blender_frame, location, rotation in zip(blender_frames, locations, rotations):
+                    camera_obj.location = location
+                    camera_obj.keyframe_insert(data_path="location", frame=blender_frame)
+                    camera_obj.rotation_euler = rotation
+                    camera_obj.keyframe_insert(data_path="rotation_euler", frame=blender_frame)
+        
+        registry.add_action(fingerprint, camera_obj.animation_data.action)
+    
+    def update_camera(self, camera_obj, camera_data, track, options):
+        """Rewrite lens settings and keyframes of an already imported camera or plane in place"""
+        offset = None
+        registry = dedup.Registry()
+        if camera_obj.type == 'CAMERA':
+            camera_obj.data = self.camera_datablock(camera_data, registry, camera_obj.data)
+        else:
+            offset = self.comp_offset(camera_data)
+        track = self.retimed(camera_data, track, options)
+        if len(track):
+            # keyframe_insert would keep keys outside the new frame range
+            self.bake_animation(camera_obj, camera_data, track, dict(options, bulk_keyframes=True),
+                                offset, registry)
+    
+    def link_item(self, obj, filepath, item_id, options, checksum=None):
+        """Remember which exported item obj was built from, for live sync
+        
+        checksum is the one read with the item, see LoadedItem. It is
+        stored as parser.checksum_text, a CRC32 does not fit an int property.
+        """
+        obj["ae_link_file"] = filepath
+        obj["ae_link_id"] = item_id
+        obj["ae_link_options"] = json.dumps(options)
+        if checksum is not None:
+            obj["ae_link_hash"] = parser.checksum_text(checksum)
+    
+    def write_decimated_keyframes(self, obj, name, frames, locations, rotations, options):
+        """Reduce every channel within the tolerances and report the result"""
+        mode = options['decimate_mode']
+        if hold_interpolation(frames) is not None:
+            # Bezier segments would bulge inside holds, where there are no samples to check
+            mode = 'LINEAR'
+        location_keys = [
+            decimate.reduce_channel(frames, locations[:, i], options['location_tolerance'], mode)
+            for i in range(3)
+        ]
+        rotation_keys = [
+            decimate.reduce_channel(frames, rotations[:, i], radians(options['rotation_tolerance']), mode)
+            for i in range(3)
+        ]
+        keyframes.write_reduced_channels(obj, "location", location_keys)
+        keyframes.write_reduced_channels(obj, "rotation_euler", rotation_keys)
+        
+        key_count = sum(len(r.frames) for r in location_keys + rotation_keys)
+        location_error = max(r.max_error for r in location_keys)
+        rotation_error = degrees(max(r.max_error for r in rotation_keys))
+        self.report({'INFO'}, f"{name}: {key_count} of {6 * len(frames)} keys, max error "
+                    f"{location_error:.4g} units, {rotation_error:.4g}°")
     
     def apply_motion_reduction(self, camera_obj, reduce_motion_factor, start_position):
         """Apply motion reduction using constraints to an empty object"""
@@ -251,11 +687,7 @@ class BL_OT_import_item(Operator):
         
         # Calculate influence using exponential function
         # Map the factor from [1, 100] to influence [0, 1] with exponential curve
-        normalized_factor = (reduce_motion_factor - 1) / 99.0  # Map to [0, 1]
-        
-        # Exponential function that gives most values in the 0.9-1.0 range
-        # For factor=100, normalized_factor=1.0, influence = 1.0 - exp(-5.5) = ~0.9959
-        influence = 1.0 - exp(-5.5 * normalized_factor)
+        influence = motion_reduction_influence(reduce_motion_factor)
         
         # Add copy location constraint to camera with the calculated influence
         loc_constraint = camera_obj.constraints.new(type='COPY_LOCATION')
@@ -269,6 +701,381 @@ class BL_OT_import_item(Operator):
         rot_constraint.mix_mode = 'ADD'  # Additive rotation mixing
         
         # Don't keyframe it - apply it once as requested
+        return empty
+
+class BL_OT_import_item(Operator, CameraImportMixin, BackgroundJobMixin):
+    """Import selected item from JSON"""
+    bl_idname = "bl.import_item"
+    bl_label = "Import Item"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    @classmethod
+    def poll(cls, context):
+        return (context.scene.bl_json_file_path and 
+                len(context.scene.bl_json_items) > 0 and
+                0 <= context.scene.bl_active_json_index < len(context.scene.bl_json_items))
+    
+    def execute(self, context):
+        with profile_run(context, "Import") as profiler:
+            result = self.run(context)
+        report_profile(self, profiler)
+        return result
+    
+    def active_item_id(self, context):
+        """Return the id of the active list item, None if the file is missing"""
+        if not os.path.isfile(context.scene.bl_json_file_path):
+            self.report({'ERROR'}, "JSON file does not exist")
+            return None
+        return context.scene.bl_json_items[context.scene.bl_active_json_index].id
+    
+    def start_job(self, context):
+        item_id = self.active_item_id(context)
+        if item_id is None:
+            return None
+        filepath = context.scene.bl_json_file_path
+        options = self.read_import_options(context)
+        return jobs.Job("Import", load_items, [(filepath, item_id)], options, read_item, comp_offsets()).start()
+    
+    def finish_job(self, context, loaded):
+        return self.build(context, loaded[0])
+    
+    def run(self, context):
+        item_id = self.active_item_id(context)
+        if item_id is None:
+            return {'CANCELLED'}
+        
+        # Get the selected item from the binary sidecar when it is up to
+        # date, otherwise parse only its part of the JSON file
+        filepath = context.scene.bl_json_file_path
+        options = self.read_import_options(context)
+        (loaded,) = load_items(None, [(filepath, item_id)], options, read_item, comp_offsets())
+        return self.build(context, loaded)
+    
+    def build(self, context, loaded):
+        """Create the datablocks of a loaded item"""
+        filepath = loaded.filepath
+        item_data, track = loaded.data, loaded.track
+        if loaded.error is not None:
+            self.report({'ERROR'}, f"Error reading JSON file: {str(loaded.error)}")
+            return {'CANCELLED'}
+        
+        if not item_data:
+            self.report({'ERROR'}, "Selected item not found in JSON")
+            return {'CANCELLED'}
+        
+        # Handle different item types
+        item_type = item_data.get('type', 'unknown')
+        
+        if item_type == 'camera':
+            self.import_camera(context, item_data, track, filepath, loaded.id, loaded.checksum)
+        elif item_type == 'av':
+            if self.import_av(context, item_data, track, filepath, loaded.id, loaded.checksum) is None:
+                return {'CANCELLED'}
+        else:
+            self.report({'WARNING'}, f"Unsupported item type: {item_type}")
+        
+        return {'FINISHED'}
+
+class BL_OT_import_selected(Operator, CameraImportMixin, BackgroundJobMixin):
+    """Import all checked items in a single step"""
+    bl_idname = "bl.import_selected"
+    bl_label = "Import Checked"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    @classmethod
+    def poll(cls, context):
+        return (context.scene.bl_json_file_path and
+                any(item.selected for item in context.scene.bl_json_items))
+    
+    def execute(self, context):
+        with profile_run(context, "Import Checked") as profiler:
+            result = self.run(context)
+        report_profile(self, profiler)
+        return result
+    
+    def checked_item_ids(self, context):
+        """Return the ids of the checked items, None if the file is missing"""
+        if not os.path.isfile(context.scene.bl_json_file_path):
+            self.report({'ERROR'}, "JSON file does not exist")
+            return None
+        # Cameras first, so layers can be placed relative to them
+        checked = [item for item in context.scene.bl_json_items if item.selected]
+        return [item.id for item in sorted(checked, key=lambda item: item.type != 'camera')]
+    
+    def start_job(self, context):
+        item_ids = self.checked_item_ids(context)
+        if item_ids is None:
+            return None
+        filepath = context.scene.bl_json_file_path
+        keys = [(filepath, item_id) for item_id in item_ids]
+        return jobs.Job("Import Checked", load_items, keys, self.read_import_options(context), read_item,
+                        comp_offsets()).start()
+    
+    def finish_job(self, context, loaded):
+        return self.build(context, loaded)
+    
+    def run(self, context):
+        item_ids = self.checked_item_ids(context)
+        if item_ids is None:
+            return {'CANCELLED'}
+        filepath = context.scene.bl_json_file_path
+        keys = [(filepath, item_id) for item_id in item_ids]
+        return self.build(context, load_items(None, keys, self.read_import_options(context), read_item,
+                                              comp_offsets()))
+    
+    def build(self, context, loaded_items):
+        """Create the datablocks of loaded items, which may come from several files"""
+        # Read everything from the current scene before new scenes become active
+        options = self.read_import_options(context)
+        
+        # Items of the same composition share one scene
+        scenes = {}
+        # Longest track per scene name, all comps share one scene without Create New Scene
+        frame_ends = {}
+        timings = []
+        batch_start = time.perf_counter()
+        # Layers showing the same footage share image, material and mesh
+        media_cache = media.MediaCache()
+        registry = dedup.Registry()
+        
+        for loaded in loaded_items:
+            filepath, item_id, item_data, track = loaded.filepath, loaded.id, loaded.data, loaded.track
+            if loaded.error is not None:
+                self.report({'ERROR'}, f"Error reading item {item_id}: {str(loaded.error)}")
+                continue
+            
+            if not item_data:
+                self.report({'WARNING'}, f"Item {item_id} not found in JSON")
+                continue
+            
+            item_type = item_data.get('type', 'unknown')
+            if item_type not in ('camera', 'av'):
+                self.report({'WARNING'}, f"Unsupported item type: {item_type}")
+                continue
+            start = time.perf_counter()
+            
+            comp = item_data.get('comp') or item_data['layer_name']
+            if comp not in scenes:
+                with profiling.stage("scene_setup"):
+                    scenes[comp] = self.setup_scene(context, item_data, options, name=comp)
+            scene = scenes[comp]
+            
+            with profiling.stage(f"build {item_id}", len(track)):
+                if item_type == 'camera':
+                    obj = self.create_camera(scene, item_data, track, options, registry)
+                else:
+                    obj = self.create_av_plane(scene, item_data, track, options, media_cache, registry)
+            if obj is None:
+                continue
+            self.link_item(obj, filepath, item_id, options, loaded.checksum)
+            if len(track):
+                track = self.retimed(item_data, track, options)
+                length = int(track.end_frame - track.start_frame + 1)
+                frame_ends[scene.name] = max(frame_ends.get(scene.name, 0), length)
+            
+            timings.append((item_data['layer_name'], len(track), loaded.seconds, time.perf_counter() - start))
+        
+        # A shared scene has to cover its longest camera
+        if options['apply_comp_settings']:
+            for scene_name, frame_end in frame_ends.items():
+                bpy.data.scenes[scene_name].frame_end = frame_end
+        
+        for name, frame_count, load_time, build_time in timings:
+            self.report({'INFO'}, f"{name}: {frame_count} frames, "
+                        f"load {load_time * 1000:.1f} ms, build {build_time * 1000:.1f} ms")
+        self.report({'INFO'}, f"Imported {len(timings)} of {len(loaded_items)} items "
+                    f"in {time.perf_counter() - batch_start:.2f} s")
+        
+        return {'FINISHED'} if timings else {'CANCELLED'}
+
+class BL_OT_scan_catalog(Operator, BackgroundJobMixin):
+    """Index new and changed export files of the project folder into the catalog"""
+    bl_idname = "bl.scan_catalog"
+    bl_label = "Scan"
+    bl_options = {'REGISTER'}
+    
+    @classmethod
+    def poll(cls, context):
+        return bool(context.scene.bl_catalog_root)
+    
+    def execute(self, context):
+        project = self.project(context)
+        if project is None:
+            return {'CANCELLED'}
+        return self.finish_job(context, project.scan())
+    
+    def project(self, context):
+        root = bpy.path.abspath(context.scene.bl_catalog_root)
+        if not os.path.isdir(root):
+            self.report({'ERROR'}, "Project folder does not exist")
+            return None
+        return project_catalog(context.scene, root)
+    
+    def start_job(self, context):
+        project = self.project(context)
+        if project is None:
+            return None
+        return jobs.Job("Catalog Scan", lambda job: project.scan(job.update)).start()
+    
+    def finish_job(self, context, result):
+        for path, error in result.errors:
+            self.report({'WARNING'}, f"Skipped {path}: {error}")
+        search_catalog(context.scene)
+        self.report({'INFO'}, f"Catalog: {result.indexed} files indexed, {result.unchanged} unchanged, "
+                    f"{result.removed} removed")
+        return {'FINISHED'}
+
+class BL_OT_import_catalog_items(Operator, CameraImportMixin, BackgroundJobMixin):
+    """Import the checked catalog results, or the active one, from all their export files"""
+    bl_idname = "bl.import_catalog_items"
+    bl_label = "Import From Catalog"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    @classmethod
+    def poll(cls, context):
+        return len(context.scene.bl_catalog_items) > 0
+    
+    def execute(self, context):
+        with profile_run(context, "Import From Catalog") as profiler:
+            keys, loader, options = self.prepare(context)
+            result = BL_OT_import_selected.build(self, context, load_items(None, keys, options, loader,
+                                                                            comp_offsets()))
+        report_profile(self, profiler)
+        return result
+    
+    def prepare(self, context):
+        """Return the (file, item id) keys to import, their loader and the import options"""
+        scene = context.scene
+        results = scene.bl_catalog_items
+        checked = [item for item in results if item.selected]
+        if not checked and 0 <= scene.bl_active_catalog_index < len(results):
+            checked = [results[scene.bl_active_catalog_index]]
+        # Cameras first, so layers can be placed relative to them
+        checked.sort(key=lambda item: item.type != 'camera')
+        keys = [(item.file, item.id) for item in checked]
+        project = project_catalog(scene, bpy.path.abspath(scene.bl_catalog_root))
+        return keys, project.load, self.read_import_options(context)
+    
+    def start_job(self, context):
+        keys, loader, options = self.prepare(context)
+        if not keys:
+            return None
+        return jobs.Job("Import From Catalog", load_items, keys, options, loader, comp_offsets()).start()
+    
+    def finish_job(self, context, loaded):
+        return BL_OT_import_selected.build(self, context, loaded)
+
+class BL_OT_verify_motion_reduction(Operator, CameraImportMixin):
+    """Compare the baked motion reduction of the active camera with the constraints it replaces"""
+    bl_idname = "bl.verify_motion_reduction"
+    bl_label = "Verify Baked Reduction"
+    bl_options = {'REGISTER'}
+    
+    samples: IntProperty(
+        name="Samples",
+        description="Number of frames evaluated",
+        min=2,
+        default=50
+    )
+    
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        # Streamed cameras have no file to compare with
+        return (obj is not None and obj.type == 'CAMERA'
+                and os.path.isfile(obj.get("ae_link_file", "")))
+    
+    def execute(self, context):
+        camera_obj = context.active_object
+        options = json.loads(camera_obj.get("ae_link_options", "{}"))
+        if not (options.get('reduce_motion') and options.get('bake_reduction')):
+            self.report({'WARNING'}, "The active camera was imported without baked motion reduction")
+            return {'CANCELLED'}
+        
+        item_data, track = load_item(camera_obj["ae_link_file"], camera_obj["ae_link_id"])
+        if not item_data or not len(track):
+            self.report({'ERROR'}, "Item of the active camera not found in its JSON file")
+            return {'CANCELLED'}
+        
+        # Unreduced keys with the constraints of the non-baked import
+        track = self.retimed(item_data, track, options)
+        frames, locations, rotations = track.to_blender(offset=camera_obj["ae_link_offset"])
+        reference = bpy.data.objects.new(f"{camera_obj.name}_Check", None)
+        context.scene.collection.objects.link(reference)
+        keyframes.write_transform_keyframes(reference, frames, locations, rotations)
+        empty = self.apply_motion_reduction(reference, MOTION_REDUCTION_FACTOR, options['start_position'])
+        
+        scene = context.scene
+        current_frame = scene.frame_current
+        location_error = rotation_error = 0.0
+        try:
+            step = max(1, len(frames) // self.samples)
+            for frame in frames[::step]:
+                scene.frame_set(int(frame))
+                depsgraph = context.evaluated_depsgraph_get()
+                baked = camera_obj.evaluated_get(depsgraph).matrix_world
+                expected = reference.evaluated_get(depsgraph).matrix_world
+                location_error = max(location_error, (baked.translation - expected.translation).length)
+                difference = baked.to_quaternion().rotation_difference(expected.to_quaternion())
+                rotation_error = max(rotation_error, degrees(abs(difference.angle)))
+        finally:
+            scene.frame_set(current_frame)
+            action = reference.animation_data.action
+            bpy.data.objects.remove(reference)
+            bpy.data.objects.remove(empty)
+            if action.users == 0:
+                bpy.data.actions.remove(action)
+        
+        level = 'INFO' if location_error < 1e-3 and rotation_error < 1e-3 else 'WARNING'
+        self.report({level}, f"Baked reduction vs. constraints: max difference "
+                    f"{location_error:.3g} units, {rotation_error:.3g}°")
+        return {'FINISHED'}
+
+class BL_OT_cancel_jobs(Operator):
+    """Cancel reading and importing running in the background"""
+    bl_idname = "bl.cancel_jobs"
+    bl_label = "Cancel"
+    bl_options = {'REGISTER'}
+    
+    @classmethod
+    def poll(cls, context):
+        return bool(jobs.active)
+    
+    def execute(self, context):
+        jobs.cancel_all()
+        return {'FINISHED'}
+
+class BL_OT_build_sidecar(Operator):
+    """Convert the JSON file into a binary sidecar that imports memory-map instead of parsing"""
+    bl_idname = "bl.build_sidecar"
+    bl_label = "Build Binary Sidecar"
+    bl_options = {'REGISTER'}
+    
+    @classmethod
+    def poll(cls, context):
+        return bool(context.scene.bl_json_file_path)
+    
+    def execute(self, context):
+        with profile_run(context, "Build Sidecar") as profiler:
+            result = self.run(context)
+        report_profile(self, profiler)
+        return result
+    
+    def run(self, context):
+        filepath = context.scene.bl_json_file_path
+        
+        if not os.path.isfile(filepath):
+            self.report({'ERROR'}, "JSON file does not exist")
+            return {'CANCELLED'}
+        
+        try:
+            path = parser.write_sidecar(filepath)
+        except Exception as e:
+            self.report({'ERROR'}, f"Error writing sidecar: {str(e)}")
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, f"Wrote {os.path.basename(path)}")
+        return {'FINISHED'}
 
 class BL_OT_delete_item(Operator):
     """Delete selected item from JSON file"""
@@ -290,29 +1097,17 @@ class BL_OT_delete_item(Operator):
             self.report({'ERROR'}, "JSON file does not exist")
             return {'CANCELLED'}
         
+        # Get the selected item ID to delete
+        item_id = context.scene.bl_json_items[active_index].id
+        
+        # Only record a tombstone, the file is rewritten by Compact
         try:
-            # Read the current JSON data
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            deleted = parser.add_tombstone(filepath, item_id)
         except Exception as e:
-            self.report({'ERROR'}, f"Error reading JSON file: {str(e)}")
+            self.report({'ERROR'}, f"Error writing tombstone: {str(e)}")
             return {'CANCELLED'}
         
-        # Get the selected item ID to delete
-        item_id = context.scene.bl_json_items[active_index].id
-        
-        # Remove the item from the data
-        if item_id in data:
-            del data[item_id]
-            
-            # Write the updated data back to the file
-            try:
-                with open(filepath, 'w') as f:
-                    json.dump(data, f, indent=2)
-            except Exception as e:
-                self.report({'ERROR'}, f"Error writing JSON file: {str(e)}")
-                return {'CANCELLED'}
-            
+        if deleted:
             # Refresh the items list
             BL_OT_select_json_file.refresh_json_items(self, context)
             self.report({'INFO'}, f"Deleted item: {item_id}")
@@ -321,14 +1116,93 @@ class BL_OT_delete_item(Operator):
         
         return {'FINISHED'}
 
+class BL_OT_compact_json_file(Operator):
+    """Rewrite the JSON file without deleted items, in compact encoding"""
+    bl_idname = "bl.compact_json_file"
+    bl_label = "Compact"
+    bl_options = {'REGISTER'}
+    
+    @classmethod
+    def poll(cls, context):
+        return bool(context.scene.bl_json_file_path)
+    
+    def execute(self, context):
+        with profile_run(context, "Compact") as profiler:
+            result = self.run(context)
+        report_profile(self, profiler)
+        return result
+    
+    def run(self, context):
+        filepath = context.scene.bl_json_file_path
+        
+        if not os.path.isfile(filepath):
+            self.report({'ERROR'}, "JSON file does not exist")
+            return {'CANCELLED'}
+        
+        try:
+            removed = parser.compact(filepath)
+        except Exception as e:
+            self.report({'ERROR'}, f"Error compacting JSON file: {str(e)}")
+            return {'CANCELLED'}
+        
+        BL_OT_select_json_file.refresh_json_items(self, context)
+        self.report({'INFO'}, f"Compacted file, removed {removed} items")
+        return {'FINISHED'}
+
+class BL_OT_convert_json_lines(Operator):
+    """Write the JSON file as an append-only JSON Lines file, which After Effects exports add to quickly"""
+    bl_idname = "bl.convert_json_lines"
+    bl_label = "Convert to JSON Lines"
+    bl_options = {'REGISTER'}
+    
+    @classmethod
+    def poll(cls, context):
+        filepath = context.scene.bl_json_file_path
+        return bool(filepath) and not parser.is_json_lines(filepath)
+    
+    def execute(self, context):
+        filepath = context.scene.bl_json_file_path
+        
+        if not os.path.isfile(filepath):
+            self.report({'ERROR'}, "JSON file does not exist")
+            return {'CANCELLED'}
+        
+        try:
+            out_path = parser.convert_to_json_lines(filepath)
+        except Exception as e:
+            self.report({'ERROR'}, f"Error converting JSON file: {str(e)}")
+            return {'CANCELLED'}
+        
+        context.scene.bl_json_file_path = out_path
+        BL_OT_select_json_file.refresh_json_items(self, context)
+        self.report({'INFO'}, f"Converted to {os.path.basename(out_path)}, export to this file from After Effects")
+        return {'FINISHED'}
+
 def register():
     bpy.utils.register_class(BL_OT_select_json_file)
     bpy.utils.register_class(BL_OT_refresh_json_items)
     bpy.utils.register_class(BL_OT_import_item)
+    bpy.utils.register_class(BL_OT_import_selected)
+    bpy.utils.register_class(BL_OT_scan_catalog)
+    bpy.utils.register_class(BL_OT_import_catalog_items)
+    bpy.utils.register_class(BL_OT_verify_motion_reduction)
+    bpy.utils.register_class(BL_OT_cancel_jobs)
+    bpy.utils.register_class(BL_OT_build_sidecar)
     bpy.utils.register_class(BL_OT_delete_item)
+    bpy.utils.register_class(BL_OT_compact_json_file)
+    bpy.utils.register_class(BL_OT_convert_json_lines)
 
 def unregister():
+    jobs.cancel_all()
+    bpy.utils.unregister_class(BL_OT_convert_json_lines)
+    bpy.utils.unregister_class(BL_OT_compact_json_file)
     bpy.utils.unregister_class(BL_OT_delete_item)
+    bpy.utils.unregister_class(BL_OT_build_sidecar)
+    bpy.utils.unregister_class(BL_OT_cancel_jobs)
+    bpy.utils.unregister_class(BL_OT_verify_motion_reduction)
+    bpy.utils.unregister_class(BL_OT_import_catalog_items)
+    bpy.utils.unregister_class(BL_OT_scan_catalog)
+    bpy.utils.unregister_class(BL_OT_import_selected)
     bpy.utils.unregister_class(BL_OT_import_item)
     bpy.utils.unregister_class(BL_OT_refresh_json_items)
     bpy.utils.unregister_class(BL_OT_select_json_file)
\ No newline at end of file
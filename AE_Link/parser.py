@@ -1,20 +1,776 @@
 import os
+import re
+import sys
 import json
-from typing import List, Dict, Optional
+import mmap
+import struct
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, List, Dict, Optional, NamedTuple, Tuple
+
+from . import profiling
+
+# Append-only variant of the export format: every line is a JSON object
+# holding the items of one export, later lines replace items of the same id
+JSON_LINES_SUFFIX = '.jsonl'
 
 def get_json_files(directory: str) -> List[str]:
-    """Return names of all JSON files in directory"""
+    """Return names of all JSON and JSON Lines files in directory"""
     if not os.path.isdir(directory):
         return []
     
     return [f for f in os.listdir(directory) 
-            if f.lower().endswith('.json') and os.path.isfile(os.path.join(directory, f))]
+            if f.lower().endswith(('.json', JSON_LINES_SUFFIX)) and os.path.isfile(os.path.join(directory, f))]
+
+def is_json_lines(filepath: str) -> bool:
+    """Return True for export files in the append-only JSON Lines format"""
+    return filepath.lower().endswith(JSON_LINES_SUFFIX)
 
 def read_json_file(filepath: str) -> Optional[Dict]:
-    """Safely read and parse JSON file"""
+    """Safely read and parse JSON file, sharing the result through the document cache
+
+    A JSON Lines record cut off at the end of the file is left out, like
+    scan_items does.
+    """
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        size, mtime_ns = file_signature(filepath)
+        key = (filepath, size, mtime_ns, None)
+        data = document_cache.get(key)
+        if data is None:
+            with profiling.stage("decode"):
+                with open(filepath, 'r', encoding='utf-8-sig') as f:
+                    if is_json_lines(filepath):
+                        # Last writer wins, like the index
+                        data = {}
+                        for line in f:
+                            if not line.strip():
+                                continue
+                            try:
+                                data.update(json.loads(line))
+                            except json.JSONDecodeError:
+                                # Only the last line may be incomplete, as
+                                # while After Effects is still appending it
+                                if not data or line.endswith('\n'):
+                                    raise
+                    else:
+                        data = json.load(f)
+            document_cache.put(key, data, size)
+        return data
     except (json.JSONDecodeError, OSError) as e:
         print(f"Error reading {filepath}: {str(e)}")
-        return None
\ No newline at end of file
+        return None
+
+# --- Parsed document cache ---
+
+DEFAULT_CACHE_BUDGET = 256 * 1024 * 1024
+
+class DocumentCache:
+    """Process-wide LRU cache of parsed documents and items
+
+    Keys are (path, size, mtime_ns, item_id) tuples, item_id being None for
+    whole documents, so a changed file never hits stale entries. The cost of
+    an entry is the size of its JSON source in bytes, and the least recently
+    used entries are evicted once the total exceeds the budget. Cached values
+    are shared between callers and must not be modified.
+    """
+
+    def __init__(self, budget: int = DEFAULT_CACHE_BUDGET):
+        self.budget = budget
+        self.total = 0
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Tuple, value: Any, cost: int):
+        with self._lock:
+            # Entries of an older version of the same file can never hit again
+            for stale in [k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]]:
+                self._drop(stale)
+            if key in self._entries:
+                self._drop(key)
+            if cost > self.budget:
+                return
+            self._entries[key] = (value, cost)
+            self.total += cost
+            self._evict()
+
+    def set_budget(self, budget: int):
+        with self._lock:
+            self.budget = max(0, budget)
+            self._evict()
+
+    def invalidate(self, filepath: Optional[str] = None):
+        """Drop entries of filepath, or everything when no path is given"""
+        with self._lock:
+            for key in [k for k in self._entries if filepath is None or k[0] == filepath]:
+                self._drop(key)
+
+    def _drop(self, key: Tuple):
+        _, cost = self._entries.pop(key)
+        self.total -= cost
+
+    def _evict(self):
+        while self.total > self.budget and self._entries:
+            self._drop(next(iter(self._entries)))
+
+document_cache = DocumentCache()
+
+def set_cache_budget(budget: int):
+    """Set the memory budget of the shared document cache in bytes"""
+    document_cache.set_budget(budget)
+
+def invalidate(filepath: Optional[str] = None):
+    """Forget cached indexes and parsed data, call after writing a file"""
+    if filepath is None:
+        _index_cache.clear()
+        _digest_cache.clear()
+    else:
+        _index_cache.pop(filepath, None)
+        _digest_cache.pop(filepath, None)
+    document_cache.invalidate(filepath)
+
+# --- Streaming item index ---
+
+class ItemIndex(NamedTuple):
+    """Metadata of one top-level item, read without building its frames"""
+    id: str
+    name: str
+    type: str
+    comp: str
+    frame_count: int
+    first_frame: Optional[float]
+    last_frame: Optional[float]
+    start: int  # Byte offset of the item object
+    end: int    # Byte offset just past the item object
+    header: Dict  # The item with an empty 'frames' list
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Strings (group 1 marks object keys) and structural brackets
+_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"(\s*:)?|[{}\[\]]')
+_FRAME_KEY = b'"frame"'
+
+_decoder = json.JSONDecoder()
+# path -> (size, mtime_ns, items, end of the last record, last bytes of the indexed file)
+_index_cache: Dict[str, Tuple[int, int, List[ItemIndex], int, bytes]] = {}
+# path -> {(id, start, end): CRC32}, kept while a JSON Lines file only grows
+_digest_cache: Dict[str, Dict[Tuple[str, int, int], int]] = {}
+
+# Bytes compared to tell an appended JSON Lines file from a rewritten one
+_TAIL_SIZE = 64
+
+def file_signature(filepath: str) -> Tuple[int, int]:
+    """Return (size, mtime_ns) used to detect changed files"""
+    stat = os.stat(filepath)
+    return stat.st_size, stat.st_mtime_ns
+
+def _decode_frame(buf, start: int) -> Optional[Dict]:
+    """Decode the single frame object starting at byte offset start"""
+    if start < 0:
+        return None
+    # Frames hold only numbers and short keys, a small window is enough
+    window = bytes(buf[start:start + 4096]).decode('utf-8', 'ignore')
+    try:
+        frame, _ = _decoder.raw_decode(window)
+    except ValueError:
+        return None
+    return frame if isinstance(frame, dict) else None
+
+def _skip_frames(buf, open_pos: int, limit: int) -> Tuple[int, int]:
+    """Return (close_pos, frame_count) for the frames array opening at open_pos
+
+    Frames are flat objects of numbers, so the first ']' closes the array.
+    Arrays that contain other lists fall back to a token scan.
+    """
+    close_pos = buf.find(b']', open_pos + 1, limit)
+    if close_pos == -1:
+        raise ValueError("Unterminated frames list")
+
+    if buf.find(b'[', open_pos + 1, close_pos) == -1:
+        body = buf[open_pos + 1:close_pos]
+        count = body.count(_FRAME_KEY)
+        return close_pos, count
+
+    depth = 0
+    count = 0
+    for match in _TOKEN.finditer(buf, open_pos + 1, limit):
+        token = match.group(0)
+        if token in (b'{', b'['):
+            if depth == 0 and token == b'{':
+                count += 1
+            depth += 1
+        elif token in (b'}', b']'):
+            if depth == 0:
+                return match.start(), count
+            depth -= 1
+    raise ValueError("Unterminated frames list")
+
+def _frames_range(buf, open_pos: int, close_pos: int) -> Tuple[Optional[float], Optional[float]]:
+    """Read the frame numbers of the first and last frame of a frames array"""
+    first = _decode_frame(buf, buf.find(b'{', open_pos, close_pos))
+    last_key = buf.rfind(_FRAME_KEY, open_pos, close_pos)
+    last = _decode_frame(buf, buf.rfind(b'{', open_pos, last_key)) if last_key != -1 else None
+    return (first or {}).get('frame'), (last or {}).get('frame')
+
+def _index_item(buf, item_id: str, start: int, limit: int) -> ItemIndex:
+    """Index the item object starting at start, skipping over its frames"""
+    depth = 0
+    keys: List[Optional[str]] = []
+    pending_key = None
+    frames_span = None
+    frame_count = 0
+    frame_range = (None, None)
+
+    pos = start
+    while True:
+        match = _TOKEN.search(buf, pos, limit)
+        if match is None:
+            raise ValueError(f"Unterminated item '{item_id}'")
+        token = match.group(0)
+        pos = match.end()
+
+        if match.group(1):
+            pending_key = json.loads(token[:token.rindex(b'"') + 1])
+            continue
+
+        if token in (b'{', b'['):
+            if (token == b'[' and pending_key == 'frames' and depth == 2
+                    and keys[-1] == 'transform_data'):
+                close_pos, frame_count = _skip_frames(buf, match.start(), limit)
+                frames_span = (match.start(), close_pos)
+                frame_range = _frames_range(buf, match.start(), close_pos)
+                pos = close_pos + 1
+            else:
+                keys.append(pending_key)
+                depth += 1
+        elif token in (b'}', b']'):
+            depth -= 1
+            keys.pop()
+            if depth == 0:
+                end = match.end()
+                break
+        pending_key = None
+
+    if frames_span:
+        skeleton = buf[start:frames_span[0] + 1] + buf[frames_span[1]:end]
+    else:
+        skeleton = buf[start:end]
+    header = json.loads(bytes(skeleton).decode('utf-8'))
+
+    transform_data = header.get('transform_data', {})
+    first_frame, last_frame = frame_range
+    if first_frame is None:
+        first_frame = transform_data.get('start_frame')
+    if last_frame is None:
+        last_frame = transform_data.get('end_frame')
+
+    return ItemIndex(
+        id=item_id,
+        name=header.get('layer_name', 'Unnamed'),
+        type=header.get('type', 'unknown'),
+        comp=header.get('comp', ''),
+        frame_count=frame_count,
+        first_frame=first_frame,
+        last_frame=last_frame,
+        start=start,
+        end=end,
+        header=header,
+    )
+
+def _scan_object(buf, pos: int, limit: int, progress: Optional[Callable[[float], None]]) -> Tuple[List[ItemIndex], int]:
+    """Index the items of the top-level object whose '{' ends at pos, return (items, end)"""
+    items = []
+    while True:
+        match = _TOKEN.search(buf, pos, limit)
+        if match is None:
+            raise ValueError("Unterminated JSON object")
+        token = match.group(0)
+        if token == b'}':
+            return items, match.end()
+        if not match.group(1):
+            raise ValueError(f"Unexpected token at byte {match.start()}")
+
+        item_id = json.loads(token[:token.rindex(b'"') + 1])
+        value = _TOKEN.search(buf, match.end(), limit)
+        if value is None or value.group(0) != b'{':
+            raise ValueError(f"Item '{item_id}' is not an object")
+
+        item = _index_item(buf, item_id, value.start(), limit)
+        items.append(item)
+        pos = item.end
+        if progress is not None:
+            progress(pos / limit)
+
+def _scan_records(buf, pos: int, items: List[ItemIndex],
+                  progress: Optional[Callable[[float], None]]) -> Tuple[List[ItemIndex], int]:
+    """Merge the items of the records from pos on into items, return (items, end of the last record)"""
+    limit = len(buf)
+    merged = {item.id: item for item in items}
+    first_record = not merged
+
+    while True:
+        match = _TOKEN.search(buf, pos, limit)
+        if match is None:
+            if first_record:
+                raise ValueError("Export file must contain a JSON object")
+            break
+        if match.group(0) != b'{':
+            raise ValueError(f"Unexpected token at byte {match.start()}")
+
+        try:
+            record, end = _scan_object(buf, match.end(), limit, progress)
+        except ValueError:
+            # Only the last line of a JSON Lines file may be incomplete
+            if first_record or buf.find(b'\n', match.start(), limit) != -1:
+                raise
+            break
+        for item in record:
+            merged[item.id] = item
+        pos = end
+        first_record = False
+
+    return list(merged.values()), pos
+
+def scan_items(buf, progress: Optional[Callable[[float], None]] = None) -> List[ItemIndex]:
+    """Index all top-level items of an export document held in buf
+
+    buf holds a single JSON object, or JSON Lines records of such objects.
+    Items of later records replace earlier items with the same id and keep
+    their place in the list. A record cut off at the end of the buffer, as
+    while After Effects is still appending it, is left out.
+
+    progress is called with the scanned fraction of buf after every item.
+    """
+    pos = len(UTF8_BOM) if buf[:len(UTF8_BOM)] == UTF8_BOM else 0
+    return _scan_records(buf, pos, [], progress)[0]
+
+def index_json_file(filepath: str, progress: Optional[Callable[[float], None]] = None,
+                    cache: bool = True) -> List[ItemIndex]:
+    """Return the item index of an export file, streaming it only when it changed
+
+    The index is cached by path, size and modification time, unless cache
+    is False. A cached index is used either way. Raises OSError or
+    ValueError when the file cannot be read. progress is passed on to
+    scan_items.
+    """
+    size, mtime_ns = file_signature(filepath)
+    cached = _index_cache.get(filepath)
+    if cached and cached[0] == size and cached[1] == mtime_ns:
+        return cached[2]
+
+    if size == 0:
+        raise ValueError("File is empty")
+
+    with profiling.stage("index") as record:
+        with open(filepath, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                # Records appended to a JSON Lines file are indexed on their own
+                appended = (cached is not None and is_json_lines(filepath) and cached[0] < size
+                            and buf[max(0, cached[0] - _TAIL_SIZE):cached[0]] == cached[4])
+                if appended:
+                    items, end = _scan_records(buf, cached[3], cached[2], progress)
+                else:
+                    _digest_cache.pop(filepath, None)
+                    start = len(UTF8_BOM) if buf[:len(UTF8_BOM)] == UTF8_BOM else 0
+                    items, end = _scan_records(buf, start, [], progress)
+                tail = buf[max(0, size - _TAIL_SIZE):size]
+        record['frames'] = sum(item.frame_count for item in items)
+
+    if cache:
+        _index_cache[filepath] = (size, mtime_ns, items, end, tail)
+    return items
+
+# --- Single item loading ---
+
+def find_item(filepath: str, item_id: str) -> Optional[ItemIndex]:
+    """Return the index entry of item_id, or None if the file does not contain it"""
+    for entry in index_json_file(filepath):
+        if entry.id == item_id:
+            return entry
+    return None
+
+def read_item(filepath: str, item_id: str) -> Tuple[Optional[Dict], Optional[int]]:
+    """Parse only the subtree of item_id using its byte span from the index
+
+    Returns (item, CRC32 of its bytes), the checksum being the one of
+    item_checksum. Results are kept in the shared document cache. Returns
+    (None, None) when the item does not exist. Raises OSError or ValueError
+    when the file cannot be read.
+    """
+    size, mtime_ns = file_signature(filepath)
+    key = (filepath, size, mtime_ns, item_id)
+    cached = document_cache.get(key)
+    if cached is not None:
+        return cached
+
+    entry = find_item(filepath, item_id)
+    if entry is None:
+        return None, None
+
+    # A whole document parsed earlier already contains the item
+    document = document_cache.get((filepath, size, mtime_ns, None))
+    if document is not None:
+        return document.get(item_id), item_checksum(filepath, entry)
+
+    with profiling.stage("read"):
+        with open(filepath, 'rb') as f:
+            f.seek(entry.start)
+            raw = f.read(entry.end - entry.start)
+
+    if len(raw) != entry.end - entry.start or raw[:1] != b'{' or raw[-1:] != b'}':
+        # The file changed between indexing and reading
+        invalidate(filepath)
+        raise ValueError("Export file changed while reading, sync and try again")
+
+    with profiling.stage("decode", entry.frame_count):
+        result = json.loads(raw), zlib.crc32(raw)
+    document_cache.put(key, result, len(raw))
+    return result
+
+def load_item(filepath: str, item_id: str) -> Optional[Dict]:
+    """Parse only the subtree of item_id, see read_item"""
+    return read_item(filepath, item_id)[0]
+
+# --- Tombstones and compaction ---
+#
+# Deleting an item only records it in a small '<file>.deleted.json' sidecar
+# mapping item ids to a CRC32 of the item's bytes. Tombstoned items are
+# hidden right away, and compact() later rewrites the export file once.
+# Comparing checksums keeps an item visible when After Effects exports a
+# changed version of a deleted layer.
+
+TOMBSTONE_SUFFIX = '.deleted.json'
+
+def tombstone_path(filepath: str) -> str:
+    """Return the path of the tombstone sidecar belonging to an export file"""
+    return filepath + TOMBSTONE_SUFFIX
+
+def _write_atomic(path: str, data: bytes):
+    """Write data to a temporary file next to path and rename it into place"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def item_checksum(filepath: str, entry: ItemIndex) -> int:
+    """Return the CRC32 of the bytes of an indexed item"""
+    with open(filepath, 'rb') as f:
+        f.seek(entry.start)
+        return zlib.crc32(f.read(entry.end - entry.start))
+
+def checksum_text(checksum: int) -> str:
+    """Return a CRC32 as 8 hex digits, for ID properties that only hold 32-bit signed ints"""
+    return f"{checksum:08x}"
+
+def item_digests(filepath: str) -> Dict[str, int]:
+    """Return {item id: CRC32 of its bytes} for all items of an export file
+
+    Checksums of items a JSON Lines file had before records were appended
+    are not computed again.
+    """
+    index = index_json_file(filepath)
+    known = _digest_cache.get(filepath, {})
+    spans = {}
+    digests = {}
+    with open(filepath, 'rb') as f:
+        for entry in index:
+            span = (entry.id, entry.start, entry.end)
+            crc = known.get(span)
+            if crc is None:
+                f.seek(entry.start)
+                crc = zlib.crc32(f.read(entry.end - entry.start))
+            spans[span] = digests[entry.id] = crc
+    _digest_cache[filepath] = spans
+    return digests
+
+def read_tombstones(filepath: str) -> Dict[str, int]:
+    """Return {item id: checksum} of the items deleted from an export file"""
+    try:
+        with open(tombstone_path(filepath), 'r') as f:
+            return json.load(f).get('deleted', {})
+    except (json.JSONDecodeError, OSError, AttributeError):
+        return {}
+
+def add_tombstone(filepath: str, item_id: str) -> bool:
+    """Mark an item as deleted without touching the export file
+
+    Returns False when the item does not exist.
+    """
+    entry = find_item(filepath, item_id)
+    if entry is None:
+        return False
+
+    tombstones = read_tombstones(filepath)
+    tombstones[item_id] = item_checksum(filepath, entry)
+    _write_atomic(tombstone_path(filepath), json.dumps({'deleted': tombstones}).encode('utf-8'))
+    return True
+
+def deleted_items(filepath: str, index: Optional[List[ItemIndex]] = None) -> List[str]:
+    """Return ids of indexed items hidden by a matching tombstone"""
+    tombstones = read_tombstones(filepath)
+    if not tombstones:
+        return []
+
+    index = index if index is not None else index_json_file(filepath)
+    return [entry.id for entry in index
+            if entry.id in tombstones and tombstones[entry.id] == item_checksum(filepath, entry)]
+
+def visible_items(filepath: str, progress: Optional[Callable[[float], None]] = None,
+                  cache: bool = True) -> List[ItemIndex]:
+    """Return the item index of an export file without deleted items, see index_json_file"""
+    index = index_json_file(filepath, progress, cache)
+    deleted = set(deleted_items(filepath, index))
+    return [entry for entry in index if entry.id not in deleted]
+
+def _read_span(f, entry: ItemIndex) -> Dict:
+    f.seek(entry.start)
+    return json.loads(f.read(entry.end - entry.start))
+
+def _write_items(src, dst, entries: List[ItemIndex], json_lines: bool):
+    """Write the indexed items of src to dst in compact encoding
+
+    JSON Lines files get one record per item, which also drops the records
+    replaced by later exports.
+    """
+    if not json_lines:
+        dst.write(b'{')
+    for i, entry in enumerate(entries):
+        item = json.dumps(_read_span(src, entry), separators=(',', ':'))
+        record = f"{json.dumps(entry.id)}:{item}".encode('utf-8')
+        if json_lines:
+            dst.write(b'{' + record + b'}\n')
+        else:
+            dst.write(record if i == 0 else b',' + record)
+    if not json_lines:
+        dst.write(b'}')
+    dst.flush()
+    os.fsync(dst.fileno())
+
+def convert_to_json_lines(filepath: str, out_path: Optional[str] = None) -> str:
+    """Write the visible items of a legacy export file as a JSON Lines file
+
+    The new file is written next to the old one with a .jsonl extension,
+    unless out_path is given. After Effects appends to it in the time of
+    one layer export, however large the file grows. Returns its path.
+    """
+    if out_path is None:
+        out_path = os.path.splitext(filepath)[0] + JSON_LINES_SUFFIX
+    if os.path.abspath(out_path) == os.path.abspath(filepath):
+        raise ValueError("The export file is already in the JSON Lines format")
+
+    size, mtime_ns = file_signature(filepath)
+    entries = visible_items(filepath)
+    tmp_path = f"{out_path}.tmp"
+    with open(filepath, 'rb') as src, open(tmp_path, 'wb') as dst:
+        _write_items(src, dst, entries, True)
+
+    if file_signature(filepath) != (size, mtime_ns):
+        os.remove(tmp_path)
+        raise ValueError("Export file changed while converting, try again")
+
+    os.replace(tmp_path, out_path)
+    invalidate(out_path)
+    return out_path
+
+def compact(filepath: str) -> int:
+    """Rewrite the export file without deleted items, in compact encoding
+
+    Items are decoded one at a time and written to a temporary file that
+    replaces the export file in a single rename, so a crash never leaves a
+    partially written file. Returns the number of removed items.
+    """
+    size, mtime_ns = file_signature(filepath)
+    index = index_json_file(filepath)
+    deleted = set(deleted_items(filepath, index))
+
+    tmp_path = f"{filepath}.tmp"
+    with open(filepath, 'rb') as src, open(tmp_path, 'wb') as dst:
+        _write_items(src, dst, [entry for entry in index if entry.id not in deleted],
+                     is_json_lines(filepath))
+
+    if file_signature(filepath) != (size, mtime_ns):
+        os.remove(tmp_path)
+        raise ValueError("Export file changed while compacting, try again")
+
+    os.replace(tmp_path, filepath)
+    try:
+        os.remove(tombstone_path(filepath))
+    except OSError:
+        pass
+    invalidate(filepath)
+    return len(deleted)
+
+# --- Binary columnar sidecar ---
+#
+# Layout: preamble (magic, version, header length), a JSON header, then for
+# every item FRAME_COLUMNS float64 little-endian columns of equal length:
+# frame, position x/y/z, orientation x/y/z. The header stores the size and
+# mtime of the JSON file it was built from and, per item, the item without
+# its frames plus the byte offset and frame count of its column block.
+
+SIDECAR_SUFFIX = '.aelb'
+SIDECAR_MAGIC = b'AELB'
+SIDECAR_VERSION = 2
+FRAME_COLUMNS = 7
+
+_PREAMBLE = struct.Struct('<4sIQ')
+_ALIGN = 8
+
+_sidecar_cache: Dict[str, Tuple[int, int, 'Sidecar']] = {}
+
+def sidecar_path(filepath: str) -> str:
+    """Return the path of the binary sidecar belonging to an export file"""
+    return filepath + SIDECAR_SUFFIX
+
+def write_sidecar(filepath: str) -> str:
+    """Convert an export file into a binary columnar sidecar next to it
+
+    Items are decoded one at a time, so memory stays bounded by the largest
+    item. The sidecar is written to a temporary file and renamed into place.
+    Returns the sidecar path.
+    """
+    size, mtime_ns = file_signature(filepath)
+    index = index_json_file(filepath)
+    digests = item_digests(filepath)
+
+    items = {}
+    offset = 0
+    for entry in index:
+        items[entry.id] = {'item': entry.header, 'offset': offset, 'count': entry.frame_count,
+                           'checksum': digests[entry.id]}
+        offset += entry.frame_count * FRAME_COLUMNS * 8
+
+    header = json.dumps({
+        'source': {'size': size, 'mtime_ns': mtime_ns},
+        'items': items,
+    }, separators=(',', ':')).encode('utf-8')
+    header += b' ' * (-(_PREAMBLE.size + len(header)) % _ALIGN)
+
+    out_path = sidecar_path(filepath)
+    tmp_path = f"{out_path}.tmp"
+    with open(filepath, 'rb') as src, open(tmp_path, 'wb') as dst:
+        dst.write(_PREAMBLE.pack(SIDECAR_MAGIC, SIDECAR_VERSION, len(header)))
+        dst.write(header)
+
+        for entry in index:
+            frames = _read_span(src, entry).get('transform_data', {}).get('frames', [])
+            if len(frames) != entry.frame_count:
+                raise ValueError(f"Unexpected frame layout in item '{entry.id}'")
+
+            columns = [array('d') for _ in range(FRAME_COLUMNS)]
+            for frame in frames:
+                pos = frame['position']
+                rot = frame['orientation']
+                values = (frame['frame'], pos['x'], pos['y'], pos['z'], rot['x'], rot['y'], rot['z'])
+                for column, value in zip(columns, values):
+                    column.append(value)
+
+            for column in columns:
+                if sys.byteorder != 'little':
+                    column.byteswap()
+                column.tofile(dst)
+
+    if file_signature(filepath) != (size, mtime_ns):
+        os.remove(tmp_path)
+        raise ValueError("Export file changed while converting, try again")
+
+    # Windows cannot replace a file that is still mapped
+    _close_sidecar(out_path)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+def _close_sidecar(path: str):
+    """Forget the cached mapping of a sidecar and close it"""
+    cached = _sidecar_cache.pop(path, None)
+    if cached is None:
+        return
+    try:
+        cached[2].buffer.close()
+    except BufferError:
+        # Views from Sidecar.columns are alive, the mapping closes with them
+        pass
+
+class Sidecar:
+    """Memory-mapped binary sidecar, see write_sidecar for the layout"""
+
+    def __init__(self, path: str, header: Dict, buffer, data_offset: int):
+        self.path = path
+        self.items: Dict[str, Dict] = header['items']
+        self.source = header['source']
+        self.buffer = buffer
+        self.data_offset = data_offset
+
+    def item(self, item_id: str) -> Optional[Dict]:
+        """Return the item without its frames, or None if it is missing"""
+        entry = self.items.get(item_id)
+        return entry['item'] if entry else None
+
+    def checksum(self, item_id: str) -> Optional[int]:
+        """Return the item_checksum of the item in the export file"""
+        entry = self.items.get(item_id)
+        return entry['checksum'] if entry else None
+
+    def column_span(self, item_id: str) -> Tuple[int, int]:
+        """Return (byte offset, frame count) of the column block of an item"""
+        entry = self.items[item_id]
+        return self.data_offset + entry['offset'], entry['count']
+
+    def columns(self, item_id: str) -> List[memoryview]:
+        """Return the FRAME_COLUMNS float64 columns of an item without copying"""
+        offset, count = self.column_span(item_id)
+        view = memoryview(self.buffer)
+        width = count * 8
+        return [view[offset + i * width:offset + (i + 1) * width].cast('d')
+                for i in range(FRAME_COLUMNS)]
+
+def open_sidecar(filepath: str) -> Optional[Sidecar]:
+    """Return the memory-mapped sidecar of an export file if it is up to date
+
+    Returns None when there is no sidecar, it is unreadable, or it was built
+    from a different version of the export file. Mappings of such sidecars
+    are closed, so they can be rebuilt or deleted.
+    """
+    path = sidecar_path(filepath)
+    try:
+        sidecar_size, sidecar_mtime = file_signature(path)
+        source_signature = file_signature(filepath)
+    except OSError:
+        _close_sidecar(path)
+        return None
+
+    cached = _sidecar_cache.get(path)
+    if cached and cached[:2] == (sidecar_size, sidecar_mtime):
+        sidecar = cached[2]
+    else:
+        _close_sidecar(path)
+        sidecar = None
+        try:
+            with open(path, 'rb') as f:
+                magic, version, header_length = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+                if magic == SIDECAR_MAGIC and version == SIDECAR_VERSION and sys.byteorder == 'little':
+                    header = json.loads(f.read(header_length))
+                    # The mapping stays valid after the file object is closed
+                    buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    sidecar = Sidecar(path, header, buffer, _PREAMBLE.size + header_length)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Error reading {path}: {str(e)}")
+            return None
+        if sidecar is None:
+            return None
+        _sidecar_cache[path] = (sidecar_size, sidecar_mtime, sidecar)
+
+    if (sidecar.source['size'], sidecar.source['mtime_ns']) != source_signature:
+        _close_sidecar(path)
+        return None
+    return sidecar
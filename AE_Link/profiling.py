@@ -0,0 +1,205 @@
+"""Opt-in per-stage timing of add-on operations.
+
+An operator wraps its run in a Profiler, and code anywhere below it marks
+stages with the module-level stage() context manager. A run that goes on
+in a background job is started with start(), attached to the threads
+doing its work with attached() and ended with finish(). Stages record wall
+time, frames processed and, optionally, peak Python memory (tracemalloc,
+numpy arrays included). Outside of an enabled Profiler stage() does
+nothing, so instrumented code costs nothing when profiling is off.
+
+This module does not depend on bpy.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Profiler of the running operation per thread id
+_active: Dict[int, 'Profiler'] = {}
+
+# Result of the last finished profiled run, shown in the sidebar panel
+last_result: Optional[Dict] = None
+
+
+class Profiler:
+    """Collects the stages of one operator run
+
+    Use as a context manager around the run. When enabled is False nothing
+    is recorded. With log_path the result is appended to that JSON Lines
+    file on exit, together with the extra fields.
+    """
+
+    def __init__(self, name: str, enabled: bool = True, track_memory: bool = False,
+                 log_path: Optional[str] = None, extra: Optional[Dict] = None):
+        self.name = name
+        self.enabled = enabled
+        self.track_memory = track_memory and enabled
+        self.log_path = log_path
+        self.extra = extra
+        self.stages: List[Dict] = []
+        self.total = 0.0
+        self.peak_memory = 0
+        self._start = 0.0
+        self._depth = 0
+        self._started_tracemalloc = False
+        self._previous = None
+        self._peaks: List[int] = []
+        self._base = 0
+
+    def __enter__(self):
+        self.start()
+        self._previous = _attach(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _attach(self._previous)
+        self.finish()
+        return False
+
+    def start(self) -> 'Profiler':
+        """Start the run without recording stages of any thread yet"""
+        if not self.enabled:
+            return self
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.track_memory:
+            tracemalloc.reset_peak()
+            self._base = tracemalloc.get_traced_memory()[0]
+        self._start = time.perf_counter()
+        return self
+
+    def finish(self):
+        """End the run, keep it as last_result and write it to the log"""
+        global last_result
+        if not self.enabled:
+            return
+        self.total = time.perf_counter() - self._start
+        if self.track_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peak_memory = max(self.peak_memory, peak - self._base)
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+        last_result = self.result()
+        if self.log_path:
+            try:
+                append_log(self.log_path, last_result, self.extra)
+            except OSError as e:
+                print(f"Error writing {self.log_path}: {str(e)}")
+
+    @contextmanager
+    def stage(self, name: str, frames: int = 0):
+        """Time a stage. Yields its record, 'frames' may be set inside the block"""
+        record = {'name': name, 'depth': self._depth, 'seconds': 0.0, 'frames': frames, 'peak_memory': 0}
+        if not self.enabled:
+            yield record
+            return
+
+        self.stages.append(record)
+        if self.track_memory:
+            # Peaks of enclosing stages are carried in self._peaks, since
+            # tracemalloc only has a single peak counter
+            current, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self._peaks.append(current)
+            base = current
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            self._depth -= 1
+            if self.track_memory:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                record['peak_memory'] = peak - base
+                self.peak_memory = max(self.peak_memory, peak - self._base)
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                tracemalloc.reset_peak()
+
+    def result(self) -> Dict:
+        return {
+            'run': self.name,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'host': socket.gethostname(),
+            'total_seconds': self.total,
+            'peak_memory': self.peak_memory,
+            'frames': sum(s['frames'] for s in self.stages if s['depth'] == 0),
+            'stages': self.stages,
+        }
+
+
+def _attach(profiler: Optional[Profiler]) -> Optional[Profiler]:
+    """Make profiler the one of the calling thread, return the previous one"""
+    thread = threading.get_ident()
+    previous = _active.pop(thread, None)
+    if profiler is not None and profiler.enabled:
+        _active[thread] = profiler
+    return previous
+
+
+def active() -> Optional[Profiler]:
+    """Profiler recording the stages of the calling thread, if any"""
+    return _active.get(threading.get_ident())
+
+
+@contextmanager
+def attached(profiler: Optional[Profiler]):
+    """Record the stages of the calling thread into a started profiler inside the block
+    
+    Only one thread of a run should record stages at a time.
+    """
+    previous = _attach(profiler)
+    try:
+        yield profiler
+    finally:
+        _attach(previous)
+
+
+@contextmanager
+def stage(name: str, frames: int = 0):
+    """Time a stage of the Profiler of the calling thread, or do nothing if there is none
+    
+    Stages of other threads are not recorded, unless the run is attached to them.
+    """
+    profiler = active()
+    if profiler is None:
+        yield {'name': name, 'frames': frames}
+        return
+    with profiler.stage(name, frames) as record:
+        yield record
+
+
+def format_stage(record: Dict) -> str:
+    text = f"{record['name']}: {record['seconds'] * 1000:.1f} ms"
+    if record.get('frames'):
+        text += f", {record['frames']} frames"
+    if record.get('peak_memory'):
+        text += f", peak {record['peak_memory'] / (1024 * 1024):.1f} MB"
+    return text
+
+
+def format_summary(result: Dict) -> str:
+    """One line summary of the top-level stages of a run"""
+    stages = ", ".join(format_stage(s) for s in result['stages'] if s['depth'] == 0)
+    return f"{result['run']} took {result['total_seconds'] * 1000:.1f} ms ({stages})"
+
+
+def append_log(path: str, result: Dict, extra: Optional[Dict] = None):
+    """Append a run as one JSON line to a log file"""
+    record = dict(result, **(extra or {}))
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, separators=(',', ':')) + "\n")
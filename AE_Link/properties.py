@@ -1,11 +1,27 @@
 import bpy
 from bpy.types import PropertyGroup
-from bpy.props import StringProperty, CollectionProperty, IntProperty, BoolProperty, FloatProperty, FloatVectorProperty
+from bpy.props import StringProperty, CollectionProperty, IntProperty, BoolProperty, FloatProperty, FloatVectorProperty, EnumProperty
+
+from . import operators, parser, stream, watch
+
+def update_cache_budget(self, context):
+    parser.set_cache_budget(self.bl_cache_budget_mb * 1024 * 1024)
+
+def update_catalog_search(self, context):
+    operators.search_catalog(self)
 
 class BL_JSON_Item(PropertyGroup):
     name: StringProperty(name="Name")
     type: StringProperty(name="Type")
+    comp: StringProperty(name="Composition")
     id: StringProperty(name="ID")
+    # Export file of catalog results, empty for items of the scene's file
+    file: StringProperty(name="File", subtype='FILE_PATH')
+    selected: BoolProperty(
+        name="Selected",
+        description="Include this item in Import Checked",
+        default=False
+    )
 
 def register():
     bpy.utils.register_class(BL_JSON_Item)
@@ -20,6 +36,92 @@ def register():
     bpy.types.Scene.bl_json_items = CollectionProperty(type=BL_JSON_Item)
     bpy.types.Scene.bl_active_json_index = IntProperty(default=0)
     
+    # Project catalog
+    bpy.types.Scene.bl_catalog_root = StringProperty(
+        name="Project Folder",
+        description="Folder searched for export files, including subfolders",
+        subtype='DIR_PATH',
+        default="",
+        update=update_catalog_search
+    )
+    
+    bpy.types.Scene.bl_catalog_in_folder = BoolProperty(
+        name="Store in Project Folder",
+        description="Keep the catalog database in the project folder instead of the user cache, to share it",
+        default=False,
+        update=update_catalog_search
+    )
+    
+    bpy.types.Scene.bl_catalog_search = StringProperty(
+        name="Search",
+        description="Show cataloged items whose name, composition or file contains this text",
+        default="",
+        options={'TEXTEDIT_UPDATE'},
+        update=update_catalog_search
+    )
+    
+    bpy.types.Scene.bl_catalog_items = CollectionProperty(type=BL_JSON_Item)
+    bpy.types.Scene.bl_active_catalog_index = IntProperty(default=0)
+    
+    bpy.types.Scene.bl_cache_budget_mb = IntProperty(
+        name="Cache Size (MB)",
+        description="Memory budget for parsed export data shared by Sync, Import and Delete",
+        min=0,
+        default=parser.DEFAULT_CACHE_BUDGET // (1024 * 1024),
+        update=update_cache_budget
+    )
+    
+    # Live updates
+    bpy.types.Scene.bl_watch_enabled = BoolProperty(
+        name="Live Sync",
+        description="Watch the JSON file and update imported cameras of items that change",
+        default=False,
+        update=watch.update_watch_enabled
+    )
+    
+    bpy.types.Scene.bl_watch_interval = FloatProperty(
+        name="Interval (s)",
+        description="Seconds between checks of the JSON file for changes",
+        min=0.1,
+        max=60.0,
+        default=1.0
+    )
+    
+    bpy.types.Scene.bl_stream_enabled = BoolProperty(
+        name="Receive Stream",
+        description="Listen on a local port for cameras streamed by a sender and apply them as they arrive",
+        default=False,
+        update=watch.update_stream_enabled
+    )
+    
+    bpy.types.Scene.bl_stream_port = IntProperty(
+        name="Port",
+        description="Localhost TCP port the stream receiver listens on",
+        min=1024,
+        max=65535,
+        default=stream.DEFAULT_PORT
+    )
+    
+    # Profiling
+    bpy.types.Scene.bl_profile_enabled = BoolProperty(
+        name="Profile Operations",
+        description="Record the time spent in each stage of Sync, Import and other operations",
+        default=False
+    )
+    
+    bpy.types.Scene.bl_profile_memory = BoolProperty(
+        name="Track Memory",
+        description="Also record peak memory per stage (slows operations down)",
+        default=False
+    )
+    
+    bpy.types.Scene.bl_profile_log_path = StringProperty(
+        name="Log File",
+        description="Append every profiled run as a JSON line to this file",
+        subtype='FILE_PATH',
+        default=""
+    )
+    
     # Camera-specific import options
     bpy.types.Scene.bl_camera_create_new_scene = BoolProperty(
         name="Create New Scene",
@@ -48,6 +150,12 @@ def register():
         default=True
     )
     
+    bpy.types.Scene.bl_camera_bake_reduction = BoolProperty(
+        name="Bake Reduction",
+        description="Write the reduced motion into the keyframes instead of adding constraints and a helper empty",
+        default=False
+    )
+    
     bpy.types.Scene.bl_camera_apply_comp_settings = BoolProperty(
         name="Apply Composition Settings",
         description="Apply composition width, height, FPS, and frame range",
@@ -67,6 +175,74 @@ def register():
         default=True
     )
 
+    bpy.types.Scene.bl_camera_bulk_keyframes = BoolProperty(
+        name="Bulk Keyframes",
+        description="Write all keyframes at once instead of inserting them frame by frame",
+        default=True
+    )
+
+    bpy.types.Scene.bl_camera_decimate = BoolProperty(
+        name="Reduce Keyframes",
+        description="Keep only the keyframes needed to follow the baked motion within the tolerances",
+        default=False
+    )
+
+    bpy.types.Scene.bl_camera_decimate_mode = EnumProperty(
+        name="Interpolation",
+        description="Interpolation of the reduced keyframes",
+        items=[
+            ('BEZIER', "Bezier", "Smooth curves, fewest keys on smooth motion"),
+            ('LINEAR', "Linear", "Straight segments between keys"),
+        ],
+        default='BEZIER'
+    )
+
+    bpy.types.Scene.bl_camera_location_tolerance = FloatProperty(
+        name="Location Tolerance",
+        description="Maximum location deviation from the baked frames, in scene units",
+        min=0.0,
+        default=0.1
+    )
+
+    bpy.types.Scene.bl_camera_rotation_tolerance = FloatProperty(
+        name="Rotation Tolerance",
+        description="Maximum rotation deviation from the baked frames, in degrees",
+        min=0.0,
+        default=0.05
+    )
+
+    bpy.types.Scene.bl_camera_retime = BoolProperty(
+        name="Retime",
+        description="Resample the baked frames to another frame rate or to sub-frame steps, without exporting again",
+        default=False
+    )
+
+    bpy.types.Scene.bl_camera_retime_fps = FloatProperty(
+        name="Frame Rate",
+        description="Frame rate of the resampled keys and the scene, 0 keeps the composition frame rate",
+        min=0.0,
+        max=240.0,
+        default=0.0
+    )
+
+    bpy.types.Scene.bl_camera_retime_step = FloatProperty(
+        name="Step",
+        description="Frames between resampled keys, 0.5 writes two keys per frame for accurate motion blur",
+        min=0.05,
+        max=1.0,
+        default=1.0
+    )
+
+    bpy.types.Scene.bl_camera_retime_position = EnumProperty(
+        name="Position",
+        description="Interpolation of positions between baked frames, rotations always take the shortest path",
+        items=[
+            ('SPLINE', "Spline", "Smooth curve through the baked positions"),
+            ('LINEAR', "Linear", "Straight segments between the baked positions"),
+        ],
+        default='SPLINE'
+    )
+
 
 def unregister():
     bpy.utils.unregister_class(BL_JSON_Item)
@@ -74,11 +250,34 @@ def unregister():
     del bpy.types.Scene.bl_json_file_path
     del bpy.types.Scene.bl_json_items
     del bpy.types.Scene.bl_active_json_index
+    del bpy.types.Scene.bl_catalog_root
+    del bpy.types.Scene.bl_catalog_in_folder
+    del bpy.types.Scene.bl_catalog_search
+    del bpy.types.Scene.bl_catalog_items
+    del bpy.types.Scene.bl_active_catalog_index
+    del bpy.types.Scene.bl_cache_budget_mb
+    del bpy.types.Scene.bl_watch_enabled
+    del bpy.types.Scene.bl_watch_interval
+    del bpy.types.Scene.bl_stream_enabled
+    del bpy.types.Scene.bl_stream_port
+    del bpy.types.Scene.bl_profile_enabled
+    del bpy.types.Scene.bl_profile_memory
+    del bpy.types.Scene.bl_profile_log_path
     del bpy.types.Scene.bl_camera_create_new_scene
     del bpy.types.Scene.bl_camera_enable_motion_blur
     del bpy.types.Scene.bl_camera_start_position
     
     del bpy.types.Scene.bl_camera_reduce_motion
+    del bpy.types.Scene.bl_camera_bake_reduction
     del bpy.types.Scene.bl_camera_apply_comp_settings
     del bpy.types.Scene.bl_camera_transparent_bg
-    del bpy.types.Scene.bl_camera_set_qt_preset
\ No newline at end of file
+    del bpy.types.Scene.bl_camera_set_qt_preset
+    del bpy.types.Scene.bl_camera_bulk_keyframes
+    del bpy.types.Scene.bl_camera_decimate
+    del bpy.types.Scene.bl_camera_decimate_mode
+    del bpy.types.Scene.bl_camera_location_tolerance
+    del bpy.types.Scene.bl_camera_rotation_tolerance
+    del bpy.types.Scene.bl_camera_retime
+    del bpy.types.Scene.bl_camera_retime_fps
+    del bpy.types.Scene.bl_camera_retime_step
+    del bpy.types.Scene.bl_camera_retime_position
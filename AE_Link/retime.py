@@ -0,0 +1,131 @@
+"""Frame-rate retiming and sub-frame resampling of baked tracks.
+
+AE bakes one sample per composition frame. These functions resample the
+baked arrays at other times, so a different frame rate or sub-frame keys
+for motion blur do not need a new export. Positions are interpolated
+linearly or with a cubic spline, orientations along the shortest path
+between the rotations of neighbouring samples.
+
+This module does not depend on bpy.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+POSITION_MODES = ('LINEAR', 'SPLINE')
+
+# Rotations closer than this are blended linearly, slerp is unstable there
+_SLERP_THRESHOLD = 1e-6
+
+
+def sample_times(frames: np.ndarray, start_frame: float, ratio: float, step: float) -> np.ndarray:
+    """Times in target frames covered by frames, on a grid of step from start_frame
+
+    ratio is target fps / source fps. The grid starts at the retimed
+    start frame, so the first key still lands on Blender frame 1.
+    """
+    origin = start_frame * ratio
+    first = np.ceil((frames[0] * ratio - origin) / step - 1e-9)
+    last = np.floor((frames[-1] * ratio - origin) / step + 1e-9)
+    return origin + step * np.arange(first, last + 1)
+
+
+def _segments(frames: np.ndarray, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (segment index, segment length, position 0..1 in segment) of each time"""
+    index = np.clip(np.searchsorted(frames, times, side='right') - 1, 0, len(frames) - 2)
+    length = frames[index + 1] - frames[index]
+    safe_length = np.where(length > 0, length, 1.0)
+    u = np.clip((times - frames[index]) / safe_length, 0.0, 1.0)
+    return index, safe_length, u
+
+
+def interpolate_positions(frames: np.ndarray, positions: np.ndarray, times: np.ndarray,
+                          mode: str = 'LINEAR') -> np.ndarray:
+    """Positions at times, times and frames in the same units
+
+    'SPLINE' is a cubic Hermite spline with tangents from the neighbouring
+    samples, which passes through every baked position.
+    """
+    index, length, u = _segments(frames, times)
+    p0 = positions[index]
+    p1 = positions[index + 1]
+    u = u[:, None]
+    if mode == 'LINEAR':
+        return p0 + (p1 - p0) * u
+
+    tangents = np.gradient(positions, frames, axis=0)
+    m0 = tangents[index] * length[:, None]
+    m1 = tangents[index + 1] * length[:, None]
+    u2 = u * u
+    u3 = u2 * u
+    return ((2 * u3 - 3 * u2 + 1) * p0 + (u3 - 2 * u2 + u) * m0
+            + (-2 * u3 + 3 * u2) * p1 + (u3 - u2) * m1)
+
+
+def euler_to_quaternions(eulers: np.ndarray) -> np.ndarray:
+    """(N, 4) w, x, y, z quaternions of (N, 3) XYZ euler radians, as Blender composes them"""
+    half = eulers * 0.5
+    cx, cy, cz = np.cos(half).T
+    sx, sy, sz = np.sin(half).T
+    return np.stack((
+        cx * cy * cz + sx * sy * sz,
+        sx * cy * cz - cx * sy * sz,
+        cx * sy * cz + sx * cy * sz,
+        cx * cy * sz - sx * sy * cz,
+    ), axis=1)
+
+
+def quaternions_to_euler(quaternions: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """XYZ euler radians of quaternions, choosing the solution closest to reference
+
+    Every rotation has two euler solutions, each repeating every 2 pi.
+    Picking the one next to reference keeps the curves free of flips.
+    """
+    w, x, y, z = quaternions.T
+    pitch = np.arctan2(2 * (y * z + w * x), 1 - 2 * (x * x + y * y))
+    yaw = np.arcsin(np.clip(2 * (w * y - x * z), -1.0, 1.0))
+    roll = np.arctan2(2 * (x * y + w * z), 1 - 2 * (y * y + z * z))
+
+    first = np.stack((pitch, yaw, roll), axis=1)
+    second = np.stack((pitch + np.pi, np.pi - yaw, roll + np.pi), axis=1)
+    best = None
+    for candidate in (first, second):
+        candidate = candidate + 2 * np.pi * np.round((reference - candidate) / (2 * np.pi))
+        if best is None:
+            best = candidate
+        else:
+            closer = (np.square(candidate - reference).sum(axis=1)
+                      < np.square(best - reference).sum(axis=1))
+            best[closer] = candidate[closer]
+    return best
+
+
+def interpolate_rotations(frames: np.ndarray, eulers: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """XYZ euler radians at times, along the shortest rotation between samples
+
+    The result is unwrapped, so Blender's euler interpolation between the
+    keys does not spin around where the baked angles wrap.
+    """
+    index, _, u = _segments(frames, times)
+    quaternions = euler_to_quaternions(eulers)
+    q0 = quaternions[index]
+    q1 = quaternions[index + 1]
+
+    dot = np.einsum('ij,ij->i', q0, q1)
+    # q and -q are the same rotation, take the nearer one
+    q1 = np.where(dot[:, None] < 0, -q1, q1)
+    dot = np.minimum(np.abs(dot), 1.0)
+
+    theta = np.arccos(dot)
+    sin_theta = np.sin(theta)
+    near = sin_theta < _SLERP_THRESHOLD
+    safe_sin = np.where(near, 1.0, sin_theta)
+    w0 = np.where(near, 1.0 - u, np.sin((1.0 - u) * theta) / safe_sin)
+    w1 = np.where(near, u, np.sin(u * theta) / safe_sin)
+    blended = w0[:, None] * q0 + w1[:, None] * q1
+    blended /= np.linalg.norm(blended, axis=1, keepdims=True)
+
+    # The linear blend of the eulers picks the branch of the result
+    reference = eulers[index] + (eulers[index + 1] - eulers[index]) * u[:, None]
+    return np.unwrap(quaternions_to_euler(blended, reference), axis=0)
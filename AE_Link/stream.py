@@ -0,0 +1,308 @@
+"""Streaming of exported items over a local socket.
+
+A sender opens a TCP connection to the add-on and writes messages, each a
+5 byte header (kind, payload length) followed by the payload:
+
+    ITEM    UTF-8 JSON of an item without its frames, with an 'id' field
+    FRAMES  item id (uint16 length + UTF-8) and float64 rows of
+            frame, position xyz, orientation xyz
+    END     item id, the item is complete
+
+The Receiver accepts connections on a background thread and decodes
+messages into a queue. StreamedItems assembles queued messages into items
+and tracks on the main thread, where they can be applied in batches.
+
+This module does not depend on bpy.
+"""
+
+import json
+import queue
+import socket
+import struct
+import threading
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from . import parser
+from .track import FRAME_WIDTH, Track, hold_interpolation, load_item
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 47800
+
+# Stored as the source file of objects built from streamed items
+STREAM_SOURCE = '<stream>'
+
+KIND_ITEM = 1
+KIND_FRAMES = 2
+KIND_END = 3
+
+_HEADER = struct.Struct('<BI')
+_ID_LENGTH = struct.Struct('<H')
+
+# Frames per FRAMES message written by the sender
+DEFAULT_CHUNK_FRAMES = 1000
+
+
+def encode_message(kind: int, payload: bytes) -> bytes:
+    return _HEADER.pack(kind, len(payload)) + payload
+
+
+def _encode_id(item_id: str) -> bytes:
+    encoded = item_id.encode('utf-8')
+    return _ID_LENGTH.pack(len(encoded)) + encoded
+
+
+def _decode_id(payload: bytes) -> Tuple[str, int]:
+    """Return (item id, offset of the data after it)"""
+    (length,) = _ID_LENGTH.unpack_from(payload)
+    end = _ID_LENGTH.size + length
+    return payload[_ID_LENGTH.size:end].decode('utf-8'), end
+
+
+def encode_item(item_id: str, item: Dict) -> bytes:
+    """ITEM message of an item dict, its frames are left out"""
+    header = dict(item, id=item_id)
+    transform_data = header.get('transform_data')
+    if isinstance(transform_data, dict) and 'frames' in transform_data:
+        header['transform_data'] = {k: v for k, v in transform_data.items() if k != 'frames'}
+    return encode_message(KIND_ITEM, json.dumps(header, separators=(',', ':')).encode('utf-8'))
+
+
+def encode_frames(item_id: str, rows: np.ndarray) -> bytes:
+    """FRAMES message of an (N, 7) array of frame rows"""
+    data = np.ascontiguousarray(rows, dtype='<f8').tobytes()
+    return encode_message(KIND_FRAMES, _encode_id(item_id) + data)
+
+
+def encode_end(item_id: str) -> bytes:
+    return encode_message(KIND_END, _encode_id(item_id))
+
+
+def decode_message(kind: int, payload: bytes) -> Tuple[int, str, object]:
+    """Return (kind, item id, data) of a received message
+
+    data is the item dict for ITEM, an (N, 7) array for FRAMES and None
+    for END messages.
+    """
+    if kind == KIND_ITEM:
+        item = json.loads(payload.decode('utf-8'))
+        return kind, str(item.pop('id')), item
+    if kind == KIND_FRAMES:
+        item_id, offset = _decode_id(payload)
+        rows = np.frombuffer(payload, dtype='<f8', offset=offset).reshape(-1, FRAME_WIDTH)
+        return kind, item_id, rows
+    if kind == KIND_END:
+        item_id, _ = _decode_id(payload)
+        return kind, item_id, None
+    raise ValueError(f"Unknown message kind {kind}")
+
+
+def _read_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Read size bytes, None if the connection closed before"""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            return None
+        received += count
+    return bytes(buffer)
+
+
+def read_messages(sock: socket.socket) -> Iterator[Tuple[int, str, object]]:
+    """Yield decoded messages from a connection until it is closed"""
+    while True:
+        header = _read_exact(sock, _HEADER.size)
+        if header is None:
+            return
+        kind, length = _HEADER.unpack(header)
+        payload = _read_exact(sock, length)
+        if payload is None:
+            return
+        yield decode_message(kind, payload)
+
+
+class Receiver:
+    """Localhost server that queues messages of all connected senders
+
+    Connections are read and decoded on background threads, the main
+    thread only takes finished messages from the queue with drain().
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.messages: 'queue.Queue' = queue.Queue()
+        self.errors: List[str] = []
+        self._server: Optional[socket.socket] = None
+        self._threads: List[threading.Thread] = []
+        self._connections: Set[socket.socket] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    def start(self):
+        """Bind the server socket, the actual port is stored in self.port"""
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            server.bind((self.host, self.port))
+            server.listen()
+        except OSError:
+            server.close()
+            raise
+        self.port = server.getsockname()[1]
+        self._server = server
+        self._spawn(self._accept, server)
+
+    def stop(self):
+        server, self._server = self._server, None
+        if server is None:
+            return
+        server.close()
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+
+    def drain(self, limit: Optional[int] = None) -> List[Tuple[int, str, object]]:
+        """Take up to limit queued messages without blocking"""
+        messages = []
+        while limit is None or len(messages) < limit:
+            try:
+                messages.append(self.messages.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+    def _spawn(self, target, *args):
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        self._threads = [t for t in self._threads if t.is_alive()]
+        self._threads.append(thread)
+        thread.start()
+
+    def _accept(self, server: socket.socket):
+        while self._server is server:
+            try:
+                connection, _ = server.accept()
+            except OSError:
+                return
+            self._spawn(self._read, connection)
+
+    def _read(self, connection: socket.socket):
+        with self._lock:
+            self._connections.add(connection)
+        try:
+            for message in read_messages(connection):
+                self.messages.put(message)
+        except (OSError, ValueError) as e:
+            self.errors.append(str(e))
+        finally:
+            with self._lock:
+                self._connections.discard(connection)
+            connection.close()
+
+
+class StreamedItems:
+    """Items assembled from received messages
+
+    written holds how many rows of each item the caller has applied
+    already. A new ITEM header starts the item over and removes its count.
+    """
+
+    def __init__(self):
+        self.items: Dict[str, Dict] = {}
+        self.complete: Set[str] = set()
+        self.written: Dict[str, int] = {}
+        self._chunks: Dict[str, List[np.ndarray]] = {}
+
+    def apply(self, messages) -> Set[str]:
+        """Add messages, return the ids of items that changed"""
+        changed = set()
+        for kind, item_id, data in messages:
+            if kind == KIND_ITEM:
+                # A new header starts the item over
+                self.items[item_id] = data
+                self._chunks[item_id] = []
+                self.complete.discard(item_id)
+                self.written.pop(item_id, None)
+            elif item_id not in self.items:
+                continue
+            elif kind == KIND_FRAMES:
+                self._chunks[item_id].append(data)
+            elif kind == KIND_END:
+                self.complete.add(item_id)
+            changed.add(item_id)
+        return changed
+
+    def rows(self, item_id: str) -> np.ndarray:
+        """All frame rows received for an item so far"""
+        chunks = self._chunks.get(item_id) or [np.empty((0, FRAME_WIDTH))]
+        if len(chunks) > 1:
+            # Keep the concatenation, later calls only add the new chunks
+            chunks[:] = [np.concatenate(chunks)]
+        return chunks[0]
+
+    def track(self, item_id: str, start: int = 0) -> Track:
+        """Track of the rows received for an item, from row start on
+
+        Without a start frame in the header, frames count from the first
+        row received, also for the tracks of later rows.
+        """
+        all_rows = self.rows(item_id)
+        rows = all_rows[start:]
+        transform_data = self.items[item_id].get('transform_data', {})
+        start_frame = transform_data.get('start_frame')
+        if start_frame is None and len(all_rows):
+            start_frame = all_rows[0, 0]
+        return Track(
+            rows[:, 0],
+            rows[:, 1:4],
+            rows[:, 4:7],
+            start_frame,
+            transform_data.get('end_frame')
+        )
+
+    def appendable(self, item_id: str) -> bool:
+        """True if the rows after the written ones can be added as keys after them"""
+        rows = self.rows(item_id)
+        written = self.written.get(item_id, 0)
+        if not written or written >= len(rows):
+            return False
+        # Frames have to continue in order, and sparse holds change the earlier keys
+        frames = rows[written - 1:, 0]
+        return bool(np.all(np.diff(frames) > 0)) and hold_interpolation(rows[:, 0]) is None
+
+
+def export_messages(filepath: str, chunk_frames: int = DEFAULT_CHUNK_FRAMES) -> Iterator[bytes]:
+    """Yield the encoded messages that replay every visible item of an export file"""
+    for entry in parser.visible_items(filepath):
+        item, track = load_item(filepath, entry.id)
+        if item is None:
+            continue
+        yield encode_item(entry.id, item)
+        rows = np.column_stack((track.frames, track.positions, track.orientations))
+        for start in range(0, len(rows), max(1, chunk_frames)):
+            yield encode_frames(entry.id, rows[start:start + chunk_frames])
+        yield encode_end(entry.id)
+
+
+def send_export(filepath: str, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                chunk_frames: int = DEFAULT_CHUNK_FRAMES) -> int:
+    """Replay an export file to a Receiver, return the number of bytes sent"""
+    sent = 0
+    with socket.create_connection((host, port)) as sock:
+        for message in export_messages(filepath, chunk_frames):
+            sock.sendall(message)
+            sent += len(message)
+    return sent
@@ -0,0 +1,262 @@
+"""Array-backed transform tracks and AE to Blender conversion.
+
+This module does not depend on bpy, so the conversion math can be used
+and tested outside of Blender.
+"""
+
+import hashlib
+import struct
+from itertools import chain
+from math import exp
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import parser, profiling, retime
+
+# Values stored per frame: frame, position xyz, orientation xyz
+FRAME_WIDTH = 7
+
+
+def _frame_values(frame: Dict) -> Tuple[float, ...]:
+    pos = frame['position']
+    rot = frame['orientation']
+    return (frame['frame'], pos['x'], pos['y'], pos['z'], rot['x'], rot['y'], rot['z'])
+
+
+class Track:
+    """Baked transform track of one exported layer
+
+    frames is an (N,) array of AE frame numbers, positions and orientations
+    are contiguous (N, 3) arrays in AE space (pixels and degrees).
+    """
+
+    __slots__ = ('frames', 'positions', 'orientations', 'start_frame', 'end_frame', '_cache')
+
+    def __init__(self, frames, positions, orientations, start_frame: Optional[float] = None,
+                 end_frame: Optional[float] = None):
+        self.frames = np.ascontiguousarray(frames, dtype=np.float64)
+        self.positions = np.ascontiguousarray(positions, dtype=np.float64).reshape(-1, 3)
+        self.orientations = np.ascontiguousarray(orientations, dtype=np.float64).reshape(-1, 3)
+
+        count = len(self.frames)
+        self.start_frame = start_frame if start_frame is not None else (self.frames[0] if count else 0)
+        self.end_frame = end_frame if end_frame is not None else (self.frames[-1] if count else 0)
+        # Digest and conversions, so work done on a worker thread is reused
+        self._cache = {}
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    @classmethod
+    def from_transform_data(cls, transform_data: Dict) -> 'Track':
+        """Build a track from the 'transform_data' dict of an exported item"""
+        frames = transform_data.get('frames', [])
+        count = len(frames)
+        values = np.fromiter(
+            chain.from_iterable(map(_frame_values, frames)),
+            dtype=np.float64,
+            count=count * FRAME_WIDTH
+        ).reshape(count, FRAME_WIDTH)
+
+        return cls(
+            values[:, 0],
+            values[:, 1:4],
+            values[:, 4:7],
+            transform_data.get('start_frame', 0),
+            transform_data.get('end_frame', count - 1)
+        )
+
+    @classmethod
+    def from_sidecar(cls, sidecar: 'parser.Sidecar', item_id: str) -> 'Track':
+        """Build a track from the memory-mapped columns of a binary sidecar
+
+        The columns are copied, so no view keeps the mapping open when the
+        sidecar is rebuilt.
+        """
+        offset, count = sidecar.column_span(item_id)
+        columns = np.frombuffer(
+            sidecar.buffer,
+            dtype='<f8',
+            count=count * parser.FRAME_COLUMNS,
+            offset=offset
+        ).reshape(parser.FRAME_COLUMNS, count).copy()
+
+        transform_data = sidecar.item(item_id).get('transform_data', {})
+        return cls(
+            columns[0],
+            columns[1:4].T,
+            columns[4:7].T,
+            transform_data.get('start_frame', 0),
+            transform_data.get('end_frame', count - 1)
+        )
+
+    def digest(self) -> str:
+        """Content hash of the frames and frame range, equal for equal tracks"""
+        if 'digest' not in self._cache:
+            digest = hashlib.blake2b(digest_size=16)
+            for array in (self.frames, self.positions, self.orientations):
+                digest.update(array.data)
+            digest.update(struct.pack('<dd', self.start_frame, self.end_frame))
+            self._cache['digest'] = digest.hexdigest()
+        return self._cache['digest']
+
+    def blender_frames(self) -> np.ndarray:
+        """Frame numbers in Blender convention (first AE frame becomes 1)"""
+        return self.frames - self.start_frame + 1
+
+    def start_offset(self, start_position: Sequence[float] = (0.0, 0.0, 0.0)) -> np.ndarray:
+        """Offset that moves the first Blender location to start_position"""
+        offset = np.asarray(start_position, dtype=np.float64).copy()
+        if len(self):
+            x, y, z = self.positions[0]
+            offset -= (x, z, -y)
+        return offset
+
+    def blender_locations(self, start_position: Sequence[float] = (0.0, 0.0, 0.0),
+                          offset: Optional[Sequence[float]] = None) -> np.ndarray:
+        """Positions in Blender space, offset so the first one is start_position
+
+        AE: X, Y, Z (Z is depth)
+        Blender: X, Z, -Y (Y is up)
+
+        An explicit offset is added instead, to keep layers in place
+        relative to a camera of the same composition.
+        """
+        pos = self.positions
+        locations = np.empty_like(pos)
+        locations[:, 0] = pos[:, 0]
+        locations[:, 1] = pos[:, 2]
+        locations[:, 2] = -pos[:, 1]
+
+        if offset is None:
+            offset = self.start_offset(start_position)
+        locations += np.asarray(offset, dtype=np.float64)
+        return locations
+
+    def blender_rotations(self) -> np.ndarray:
+        """Orientations as Blender XYZ euler radians
+
+        AE: X (pitch), Y (yaw), Z (roll)
+        Blender: X (pitch), Z (yaw), Y (roll) with sign adjustments.
+        90 degrees are added to X so the camera does not point at the floor.
+        """
+        rot = self.orientations
+        rotations = np.empty_like(rot)
+        rotations[:, 0] = 90.0 - rot[:, 0]
+        rotations[:, 1] = rot[:, 2]
+        rotations[:, 2] = -rot[:, 1]
+        return np.radians(rotations)
+
+    def to_blender(self, start_position: Sequence[float] = (0.0, 0.0, 0.0),
+                   offset: Optional[Sequence[float]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (frames, locations, rotations) converted to Blender space
+
+        The result is kept per offset, the returned arrays must not be modified.
+        """
+        if offset is None:
+            offset = self.start_offset(start_position)
+        key = ('blender', tuple(float(v) for v in offset))
+        if key not in self._cache:
+            self._cache[key] = (self.blender_frames(), self.blender_locations(offset=offset),
+                                self.blender_rotations())
+        return self._cache[key]
+
+    def resample(self, source_fps: float, target_fps: float, step: float = 1.0,
+                 position_mode: str = 'LINEAR') -> 'Track':
+        """Track sampled at target_fps every step frames, frames in target frame units
+
+        Positions are interpolated linearly or with a spline, orientations
+        along the shortest rotation in the Blender frame, so the keys turn
+        the camera the way Blender would between them.
+        """
+        key = ('resample', float(source_fps), float(target_fps), float(step), position_mode)
+        if key in self._cache:
+            return self._cache[key]
+        ratio = target_fps / source_fps
+        if len(self) < 2:
+            resampled = Track(self.frames * ratio, self.positions, self.orientations,
+                              self.start_frame * ratio, self.end_frame * ratio)
+            self._cache[key] = resampled
+            return resampled
+
+        # Interpolate in source frames, store in target frames
+        times = retime.sample_times(self.frames, self.start_frame, ratio, step)
+        source_times = times / ratio
+        positions = retime.interpolate_positions(self.frames, self.positions, source_times, position_mode)
+
+        # AE orientation to Blender euler and back, see blender_rotations
+        rot = self.orientations
+        eulers = np.radians(np.stack((90.0 - rot[:, 0], rot[:, 2], -rot[:, 1]), axis=1))
+        eulers = np.degrees(retime.interpolate_rotations(self.frames, eulers, source_times))
+        orientations = np.stack((90.0 - eulers[:, 0], -eulers[:, 2], eulers[:, 1]), axis=1)
+
+        resampled = Track(times, positions, orientations, self.start_frame * ratio, self.end_frame * ratio)
+        self._cache[key] = resampled
+        return resampled
+
+
+def hold_interpolation(frames: np.ndarray) -> Optional[np.ndarray]:
+    """Key interpolation of a sparse track, None if it has a sample on every frame
+
+    Sparse exports leave out the frames of static stretches and write the
+    last frame of each as a hold. A key followed by a gap starts a hold and
+    gets CONSTANT, all other keys LINEAR, so the keys follow the baked
+    values without filling the left out frames in again.
+    """
+    gaps = np.diff(frames) > 1.0 + 1e-6
+    if not gaps.any():
+        return None
+    return np.where(np.append(gaps, False), 'CONSTANT', 'LINEAR')
+
+
+def motion_reduction_influence(factor: float) -> float:
+    """Constraint influence of a motion reduction factor
+
+    Maps the factor from [1, 100] to [0, 1] on an exponential curve that
+    gives most values in the 0.9-1.0 range. For factor=100 the influence
+    is 1.0 - exp(-5.5) = ~0.9959.
+    """
+    normalized_factor = (factor - 1) / 99.0
+    return 1.0 - exp(-5.5 * normalized_factor)
+
+
+def reduce_motion(locations: np.ndarray, start_position: Sequence[float], influence: float) -> np.ndarray:
+    """Locations pulled towards start_position with the given influence
+
+    Matches the COPY_LOCATION constraint to an empty at start_position.
+    The COPY_ROTATION constraint in ADD mode that goes with it adds the
+    rotation of that unrotated empty, so rotations stay unchanged.
+    """
+    target = np.asarray(start_position, dtype=np.float64)
+    return (1.0 - influence) * locations + influence * target
+
+
+def read_item(filepath: str, item_id: str) -> Tuple[Optional[Dict], Optional[Track], Optional[int]]:
+    """Return (item, track, checksum) of an exported item
+
+    The memory-mapped binary sidecar is used when it is up to date, the
+    JSON file otherwise. The returned item may lack the 'frames' list, use
+    the track for frame data. checksum is the parser.item_checksum of the
+    item. Returns (None, None, None) if the item is missing.
+    """
+    sidecar = parser.open_sidecar(filepath)
+    if sidecar is not None and item_id in sidecar.items:
+        with profiling.stage("sidecar") as record:
+            track = Track.from_sidecar(sidecar, item_id)
+            record['frames'] = len(track)
+        return sidecar.item(item_id), track, sidecar.checksum(item_id)
+
+    item_data, checksum = parser.read_item(filepath, item_id)
+    if item_data is None:
+        return None, None, None
+    with profiling.stage("track") as record:
+        track = Track.from_transform_data(item_data.get('transform_data', {}))
+        record['frames'] = len(track)
+    return item_data, track, checksum
+
+
+def load_item(filepath: str, item_id: str) -> Tuple[Optional[Dict], Optional[Track]]:
+    """Return (item, track) of an exported item, see read_item"""
+    item_data, track, _ = read_item(filepath, item_id)
+    return item_data, track
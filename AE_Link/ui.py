@@ -1,14 +1,117 @@
+import os
 import bpy
+from bpy.props import StringProperty
 from bpy.types import Panel, UIList
 
+from . import jobs, operators, parser, profiling
+
+ITEM_ICONS = {'camera': 'OUTLINER_OB_CAMERA', 'av': 'FILE_MOVIE'}
+
+class ItemSearchIndex:
+    """Lower-case search fields of an items list, built once per list change
+    
+    The results of the last few filters are kept, so a list drawn in several
+    places with different filters does not search again on every redraw.
+    While a filter only gets longer, as when typing, just the items that
+    matched a kept filter are tested again.
+    """
+    
+    # Filter results kept per index
+    MAX_RESULTS = 8
+    
+    def __init__(self, items):
+        self.names = [item.name.lower() for item in items]
+        self.types = [item.type.lower() for item in items]
+        self.comps = [item.comp.lower() for item in items]
+        self._order = None
+        self._results = {}
+    
+    def matches(self, name, type_, comp):
+        """Return the indices of the items containing all filter texts"""
+        filters = (name.lower(), type_.lower(), comp.lower())
+        visible = self._results.get(filters)
+        if visible is not None:
+            return visible
+        
+        candidates = range(len(self.names))
+        for kept_filters, kept_visible in self._results.items():
+            if len(kept_visible) < len(candidates) and all(
+                    old in new for old, new in zip(kept_filters, filters)):
+                candidates = kept_visible
+        
+        name, type_, comp = filters
+        names, types, comps = self.names, self.types, self.comps
+        visible = [i for i in candidates if name in names[i] and type_ in types[i] and comp in comps[i]]
+        if len(self._results) >= self.MAX_RESULTS:
+            del self._results[next(iter(self._results))]
+        self._results[filters] = visible
+        return visible
+    
+    def alphabetical_order(self):
+        """New position of every item when sorted by name"""
+        if self._order is None:
+            self._order = [0] * len(self.names)
+            for position, i in enumerate(sorted(range(len(self.names)), key=self.names.__getitem__)):
+                self._order[i] = position
+        return self._order
+
+# Search index per items list: (owner pointer, property) -> (list generation, length, index)
+_search_indices = {}
+
+def item_search_index(data, propname, items):
+    key = (data.as_pointer(), propname)
+    cached = _search_indices.get(key)
+    if cached and cached[0] == operators.item_list_generation and cached[1] == len(items):
+        return cached[2]
+    index = ItemSearchIndex(items)
+    _search_indices[key] = (operators.item_list_generation, len(items), index)
+    return index
+
 class BL_UL_json_items(UIList):
     """Display JSON items in a list"""
+    filter_type: StringProperty(
+        name="Type",
+        description="Show only items whose type contains this text"
+    )
+    filter_comp: StringProperty(
+        name="Composition",
+        description="Show only items whose composition contains this text"
+    )
+    
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
         # Set icon based on item type
-        icon = 'OUTLINER_OB_CAMERA' if item.type == 'camera' else 'QUESTION'
+        icon = ITEM_ICONS.get(item.type, 'QUESTION')
         
+        layout.prop(item, "selected", text="")
         layout.label(text=item.name, icon=icon)
-        layout.label(text=item.type, icon='BLANK1')
+        layout.label(text=item.comp or item.type, icon='BLANK1')
+    
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="", icon='VIEWZOOM')
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+        row.prop(self, "use_filter_sort_alpha", text="", icon='SORTALPHA')
+        row = layout.row(align=True)
+        row.prop(self, "filter_type", text="", icon='FILTER')
+        row.prop(self, "filter_comp", text="", icon='SCENE_DATA')
+    
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        search = item_search_index(data, propname, items)
+        visible = search.matches(self.filter_name, self.filter_type, self.filter_comp)
+        
+        flag = self.bitflag_filter_item
+        if self.use_filter_invert:
+            flags = [flag] * len(items)
+            for i in visible:
+                flags[i] = 0
+        else:
+            flags = [0] * len(items)
+            for i in visible:
+                flags[i] = flag
+        
+        order = search.alphabetical_order() if self.use_filter_sort_alpha else []
+        return flags, order
 
 class BL_PT_main_panel(Panel):
     bl_label = "AE Link"
@@ -21,6 +124,12 @@ class BL_PT_main_panel(Panel):
         layout = self.layout
         scene = context.scene
         
+        # Reading and importing in the background
+        for job in jobs.active:
+            row = layout.row()
+            row.progress(factor=job.progress, type='BAR', text=f"{job.name}: {job.status or 'Reading'}")
+            row.operator("bl.cancel_jobs", text="", icon='CANCEL')
+        
         # File selection
         box = layout.box()
         row = box.row()
@@ -33,6 +142,23 @@ class BL_PT_main_panel(Panel):
             # Sync button
             row = box.row()
             row.operator("bl.refresh_json_items", icon='FILE_REFRESH')
+            box.prop(scene, "bl_cache_budget_mb")
+            
+            # Live sync of imported cameras
+            row = box.row()
+            row.prop(scene, "bl_watch_enabled")
+            sub = row.row()
+            sub.enabled = scene.bl_watch_enabled
+            sub.prop(scene, "bl_watch_interval")
+            
+            # Binary sidecar status
+            row = box.row()
+            if parser.open_sidecar(scene.bl_json_file_path):
+                row.label(text="Binary sidecar up to date", icon='CHECKMARK')
+            else:
+                row.operator("bl.build_sidecar", icon='FILE_CACHE')
+            if not parser.is_json_lines(scene.bl_json_file_path):
+                row.operator("bl.convert_json_lines", icon='FILE_REFRESH')
             
             # Items list
             if scene.bl_json_items:
@@ -50,8 +176,17 @@ class BL_PT_main_panel(Panel):
                 row = layout.row()
                 row.operator("bl.import_item", icon='IMPORT', text="Import Selected")
                 
+                # Batch import of all checked items
+                row.operator("bl.import_selected", icon='IMPORT')
+                
                 # Add delete button
                 row.operator("bl.delete_item", icon='TRASH', text="Delete")
+                
+                # Deleted items are only hidden until the file is compacted
+                # Compacting also drops the replaced records of a JSON Lines file
+                if (os.path.isfile(parser.tombstone_path(scene.bl_json_file_path))
+                        or parser.is_json_lines(scene.bl_json_file_path)):
+                    row.operator("bl.compact_json_file", icon='PACKAGE')
                 # --- END MODIFIED ---
                 
                 # Show import options only if an item is selected
@@ -71,6 +206,56 @@ class BL_PT_main_panel(Panel):
                     # --- END REMOVED ---
             else:
                 layout.label(text="No items found in JSON file", icon='ERROR')
+        
+        self.draw_catalog(layout, scene)
+        
+        # Socket stream receiver, works without a JSON file
+        box = layout.box()
+        row = box.row()
+        row.prop(scene, "bl_stream_enabled")
+        sub = row.row()
+        sub.enabled = not scene.bl_stream_enabled
+        sub.prop(scene, "bl_stream_port")
+        
+        self.draw_profiling(layout, scene)
+    
+    def draw_catalog(self, layout, scene):
+        """Draw the project catalog search over all export files of a folder"""
+        box = layout.box()
+        box.label(text="Project Catalog:", icon='ASSET_MANAGER')
+        row = box.row(align=True)
+        row.prop(scene, "bl_catalog_root", text="")
+        row.operator("bl.scan_catalog", icon='FILE_REFRESH')
+        if not scene.bl_catalog_root:
+            return
+        
+        box.prop(scene, "bl_catalog_in_folder")
+        box.prop(scene, "bl_catalog_search", text="", icon='VIEWZOOM')
+        if scene.bl_catalog_items:
+            box.template_list(
+                "BL_UL_json_items", "catalog",
+                scene, "bl_catalog_items",
+                scene, "bl_active_catalog_index",
+                rows=4
+            )
+            box.operator("bl.import_catalog_items", icon='IMPORT')
+    
+    def draw_profiling(self, layout, scene):
+        """Draw profiling settings and the stages of the last profiled run"""
+        box = layout.box()
+        box.prop(scene, "bl_profile_enabled")
+        if not scene.bl_profile_enabled:
+            return
+        
+        box.prop(scene, "bl_profile_memory")
+        box.prop(scene, "bl_profile_log_path")
+        
+        result = profiling.last_result
+        if result:
+            col = box.column(align=True)
+            col.label(text=f"{result['run']}: {result['total_seconds'] * 1000:.1f} ms", icon='TIME')
+            for stage in result['stages']:
+                col.label(text="    " * (stage['depth'] + 1) + profiling.format_stage(stage))
     
     def draw_camera_options(self, layout, scene):
         """Draw camera-specific import options"""
@@ -95,10 +280,33 @@ class BL_PT_main_panel(Panel):
         # Replaced slider with new checkbox
         box.prop(scene, "bl_camera_reduce_motion")
         # --- END MODIFIED ---
+        row = box.row()
+        row.enabled = scene.bl_camera_reduce_motion
+        row.prop(scene, "bl_camera_bake_reduction")
+        row.operator("bl.verify_motion_reduction", text="", icon='CHECKMARK')
         
         # Scene creation
         box.prop(scene, "bl_camera_create_new_scene")
         
+        # Keyframe writer
+        box.prop(scene, "bl_camera_bulk_keyframes")
+        
+        # Keyframe reduction
+        box.prop(scene, "bl_camera_decimate")
+        col = box.column()
+        col.enabled = scene.bl_camera_decimate
+        col.prop(scene, "bl_camera_decimate_mode")
+        col.prop(scene, "bl_camera_location_tolerance")
+        col.prop(scene, "bl_camera_rotation_tolerance")
+        
+        # Resampling of the baked frames
+        box.prop(scene, "bl_camera_retime")
+        col = box.column()
+        col.enabled = scene.bl_camera_retime
+        col.prop(scene, "bl_camera_retime_fps")
+        col.prop(scene, "bl_camera_retime_step")
+        col.prop(scene, "bl_camera_retime_position")
+        
         # --- REMOVED (UX Improvement) ---
         # Delete button was moved up
         # --- END REMOVED ---
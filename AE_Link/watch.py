@@ -0,0 +1,284 @@
+"""Live updates of imported cameras, from their export file or a socket stream.
+
+While file sync is enabled, a timer polls the size and modification time
+of the scene's JSON file. When it changes, the file is re-indexed and only
+the items whose bytes changed are loaded again and written into the
+cameras that were imported from them. Cameras keep their names, constraints and any other
+edits, only lens settings and keyframes are replaced.
+
+The stream receiver decodes messages of a local sender on background
+threads (see stream.py). A main thread timer takes them in batches and
+adds the frames received since the last batch to the camera of each
+changed item, creating it in the current scene on the first batch.
+"""
+
+import json
+
+import bpy
+from bpy.app.handlers import persistent
+
+from . import dedup, keyframes, parser, profiling, stream
+from .operators import MOTION_REDUCTION_FACTOR, CameraImportMixin, fill_item_list
+from .track import load_item, motion_reduction_influence, reduce_motion
+
+# Signature of the watched file at the last sync, (path, size, mtime_ns)
+_last_signature = None
+
+# Running stream receiver and the items it assembled
+_receiver = None
+_streamed = None
+
+# Seconds between applied stream batches, and messages taken per batch
+STREAM_INTERVAL = 0.1
+STREAM_BATCH_MESSAGES = 5000
+
+
+class CameraUpdater(CameraImportMixin):
+    """Runs the shared import code outside of an operator"""
+
+    def report(self, level, message):
+        print(f"AE Link: {message}")
+
+    def append_frames(self, obj, track, options):
+        """Add the keys of track after the keys of obj, return False if obj has to be baked again
+
+        Only plain per-frame keys can be extended. Retimed, reduced and sparse
+        animation depends on all frames, and a shared action would change
+        other objects too.
+        """
+        anim_data = obj.animation_data
+        action = anim_data.action if anim_data else None
+        if (options['retime'] or options['decimate'] or action is None or action.users > 1
+                or "ae_link_offset" not in obj):
+            return False
+
+        frames, locations, rotations = track.to_blender(offset=list(obj["ae_link_offset"]))
+        if obj.type == 'CAMERA' and options['reduce_motion'] and options['bake_reduction']:
+            influence = motion_reduction_influence(MOTION_REDUCTION_FACTOR)
+            locations = reduce_motion(locations, options['start_position'], influence)
+        keyframes.write_transform_keyframes(obj, frames, locations, rotations, append=True)
+        # The action no longer matches the fingerprint of the track it was baked from
+        for key in (dedup.FINGERPRINT_KEY, dedup.STATE_KEY):
+            if key in action:
+                del action[key]
+        return True
+
+
+def linked_objects(source):
+    """Return {item id: [objects]} of the objects imported from a file or stream.STREAM_SOURCE"""
+    linked = {}
+    for obj in bpy.data.objects:
+        if obj.get("ae_link_id") and obj.get("ae_link_file") == source:
+            linked.setdefault(obj["ae_link_id"], []).append(obj)
+    return linked
+
+
+def sync_changed_items(context, filepath):
+    """Rewrite the linked objects of all items that changed, return their ids"""
+    linked = linked_objects(filepath)
+    if not linked:
+        return []
+
+    updater = CameraUpdater()
+    defaults = updater.read_import_options(context)
+    digests = parser.item_digests(filepath)
+    updated = []
+
+    for item_id, objects in linked.items():
+        digest = digests.get(item_id)
+        # Items removed from the file keep their last animation
+        if digest is None:
+            continue
+        digest = parser.checksum_text(digest)
+        stale = [obj for obj in objects if obj.get("ae_link_hash") != digest]
+        if not stale:
+            continue
+
+        item_data, track = load_item(filepath, item_id)
+        if not item_data or item_data.get('type') not in ('camera', 'av'):
+            continue
+
+        for obj in stale:
+            options = dict(defaults, **json.loads(obj.get("ae_link_options", "{}")))
+            updater.update_camera(obj, item_data, track, options)
+            obj["ae_link_hash"] = digest
+        updated.append(item_id)
+
+    return updated
+
+
+def sync(context):
+    """Sync the scene with its export file if the file changed since the last call"""
+    global _last_signature
+    scene = context.scene
+    filepath = scene.bl_json_file_path
+
+    try:
+        signature = (filepath, *parser.file_signature(filepath))
+    except OSError:
+        return
+    if signature == _last_signature:
+        return
+
+    try:
+        with profiling.stage("watch_sync"):
+            updated = sync_changed_items(context, filepath)
+            fill_item_list(scene, parser.visible_items(filepath))
+    except Exception as e:
+        # After Effects may still be writing the file, retry on the next poll
+        print(f"AE Link: live sync of {filepath} failed: {str(e)}")
+        return
+
+    _last_signature = signature
+    if updated:
+        print(f"AE Link: updated {len(updated)} items from {filepath}")
+    for area in context.screen.areas if context.screen else ():
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
+
+
+def _poll():
+    context = bpy.context
+    scene = context.scene
+    if scene is None or not scene.bl_watch_enabled:
+        return None
+    if scene.bl_json_file_path:
+        sync(context)
+    return scene.bl_watch_interval
+
+
+def start():
+    global _last_signature
+    _last_signature = None
+    if not bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.register(_poll, first_interval=0.0)
+
+
+def stop():
+    if bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.unregister(_poll)
+
+
+def update_watch_enabled(self, context):
+    if self.bl_watch_enabled:
+        start()
+    else:
+        stop()
+
+
+def apply_stream(context):
+    """Write a batch of received messages into cameras, return the ids of updated items"""
+    changed = _streamed.apply(_receiver.drain(STREAM_BATCH_MESSAGES))
+    if not changed:
+        return []
+
+    updater = CameraUpdater()
+    # A timer must not switch the window to a new scene for every streamed item
+    options = dict(updater.read_import_options(context), create_new_scene=False)
+    linked = linked_objects(stream.STREAM_SOURCE)
+    updated = []
+
+    for item_id in sorted(changed):
+        item = _streamed.items[item_id]
+        if item.get('type') != 'camera':
+            continue
+        rows = _streamed.rows(item_id)
+        written = _streamed.written.get(item_id, 0)
+        if not len(rows) or written == len(rows):
+            continue
+
+        objects = linked.get(item_id)
+        if objects:
+            appendable = _streamed.appendable(item_id)
+            for obj in objects:
+                obj_options = dict(options, **json.loads(obj.get("ae_link_options", "{}")))
+                if not (appendable and updater.append_frames(obj, _streamed.track(item_id, written),
+                                                             obj_options)):
+                    updater.update_camera(obj, item, _streamed.track(item_id), obj_options)
+        else:
+            camera_obj = updater.import_camera(context, item, _streamed.track(item_id),
+                                               stream.STREAM_SOURCE, item_id, options=options)
+            # Later batches of this item go to the new camera
+            linked[item_id] = [camera_obj]
+        _streamed.written[item_id] = len(rows)
+        updated.append(item_id)
+
+    return updated
+
+
+def _poll_stream():
+    if _receiver is None:
+        return None
+    context = bpy.context
+    if context.scene is None:
+        return STREAM_INTERVAL
+    try:
+        apply_stream(context)
+    except Exception as e:
+        print(f"AE Link: applying streamed frames failed: {str(e)}")
+    for error in _receiver.errors:
+        print(f"AE Link: stream connection error: {error}")
+    _receiver.errors.clear()
+    return STREAM_INTERVAL
+
+
+def start_receiver(port):
+    """Listen for senders on localhost, raises OSError if the port is taken"""
+    global _receiver, _streamed
+    stop_receiver()
+    receiver = stream.Receiver(stream.DEFAULT_HOST, port)
+    receiver.start()
+    _receiver = receiver
+    _streamed = stream.StreamedItems()
+    bpy.app.timers.register(_poll_stream, first_interval=STREAM_INTERVAL)
+    print(f"AE Link: receiving on {receiver.host}:{receiver.port}")
+
+
+def stop_receiver():
+    global _receiver, _streamed
+    if bpy.app.timers.is_registered(_poll_stream):
+        bpy.app.timers.unregister(_poll_stream)
+    if _receiver is not None:
+        _receiver.stop()
+    _receiver = None
+    _streamed = None
+
+
+def update_stream_enabled(self, context):
+    if not self.bl_stream_enabled:
+        stop_receiver()
+        return
+    try:
+        start_receiver(self.bl_stream_port)
+    except OSError as e:
+        print(f"AE Link: cannot listen on port {self.bl_stream_port}: {str(e)}")
+        self.bl_stream_enabled = False
+
+
+@persistent
+def _resume_after_load(dummy):
+    # Timers do not survive loading another .blend file
+    scene = bpy.context.scene
+    if scene is not None and scene.bl_watch_enabled:
+        start()
+    else:
+        stop()
+    # The receiver keeps running, but only if the loaded file asks for it
+    if scene is None or not scene.bl_stream_enabled:
+        stop_receiver()
+    elif _receiver is None:
+        try:
+            start_receiver(scene.bl_stream_port)
+        except OSError as e:
+            print(f"AE Link: cannot listen on port {scene.bl_stream_port}: {str(e)}")
+
+
+def register():
+    bpy.app.handlers.load_post.append(_resume_after_load)
+
+
+def unregister():
+    stop()
+    stop_receiver()
+    if _resume_after_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_resume_after_load)
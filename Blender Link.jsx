@@ -261,6 +261,20 @@ function setTimeInInput(inputField) {
   inputField.text = currentFrame.toString();
 }
 
+function hasChanged(previous, sample, tolerance) {
+  var keys = ["x", "y", "z"];
+  for (var i = 0; i < keys.length; i++) {
+    var key = keys[i];
+    if (
+      Math.abs(sample.position[key] - previous.position[key]) > tolerance ||
+      Math.abs(sample.orientation[key] - previous.orientation[key]) > tolerance
+    ) {
+      return true;
+    }
+  }
+  return false;
+}
+
 function timeToFrames(time, fps) {
   return Math.round(time * fps);
 }
@@ -287,7 +301,7 @@ function handleWholeLayer() {
 }
 
 function handleBrowse() {
-  var saveFile = File.saveDialog("Save camera data", "Data Files:*.json;*.txt");
+  var saveFile = File.saveDialog("Save camera data", "Data Files:*.json;*.jsonl;*.txt");
   if (saveFile) {
     var fileName = saveFile.toString();
     filePathInput.text = fileName;
@@ -346,8 +360,7 @@ function handleExport() {
       layer.source.mainSource instanceof FileSource
     ) {
       type = "av";
-      var path = layer.source.file.absoluteURI;
-      return;
+      var path = layer.source.file.fsName;
     }
 
     if (type === undefined) {
@@ -421,6 +434,8 @@ function handleExport() {
     if (type == "av") {
       exportData.avData = {
         path: path,
+        width: layer.source.width,
+        height: layer.source.height,
       };
     }
 
@@ -431,6 +446,19 @@ function handleExport() {
     win.bar.maxValue = frameDiff + 1;
     win.show();
 
+    // Sparse exports only keep frames that change, see below
+    var sparse = sparseCheckbox.value;
+    var tolerance = parseFloat(sparseTolerance.text);
+    if (sparse) {
+      if (isNaN(tolerance) || tolerance < 0) {
+        tolerance = 0;
+      }
+      exportData.transform_data.sparse = true;
+      exportData.transform_data.tolerance = tolerance;
+    }
+    var frames = exportData.transform_data.frames;
+    var held = null;
+
     // Export frame-by-frame
     var transform = dataNull.transform;
     var positionProp = transform.position;
@@ -455,19 +483,65 @@ function handleExport() {
         z: oriValue[2],
       };
 
-      exportData.transform_data.frames.push({
+      var sample = {
         frame: frame,
         position: position,
         orientation: orientation,
-      });
+      };
+
+      if (
+        sparse &&
+        frames.length > 0 &&
+        !hasChanged(frames[frames.length - 1], sample, tolerance)
+      ) {
+        // Static: only the last frame of the hold is written, marked as
+        // such, so the add-on keeps the values until the next change
+        held = sample;
+        if (frame == endFrame) {
+          held.hold = true;
+          frames.push(held);
+        }
+      } else {
+        if (held !== null) {
+          held.hold = true;
+          frames.push(held);
+          held = null;
+        }
+        frames.push(sample);
+      }
 
       win.bar.value += 1;
-      win.update();
+      // Redrawing the progress bar costs more than sampling a frame
+      if ((frame - startFrame) % 25 == 0 || frame == endFrame) {
+        win.update();
+      }
     }
     deleteHelperNull(comp);
 
     // Write to file
     var exportFile = new File(filePathInput.text);
+
+    // JSON Lines files get one appended record per export, the add-on
+    // keeps the last record of every layer id
+    if (/\.jsonl$/i.test(filePathInput.text)) {
+      var record = {};
+      record[layer.id] = exportData;
+      try {
+        exportFile.encoding = "UTF-8";
+        exportFile.lineFeed = "Unix";
+        exportFile.open("a");
+        exportFile.writeln(JSON.stringify(record));
+        exportFile.close();
+      } catch (error) {
+        alert("Error writing a file. Check file path or extension.");
+        return;
+      }
+
+      win.close();
+      alert("Added layer data to " + filePathInput.text + ".");
+      return;
+    }
+
     var allData = {};
 
     if (exportFile.exists) {
@@ -511,6 +585,8 @@ function createUI(thisObj) {
   fromInput = keyframeData.fromInput;
   toInput = keyframeData.toInput;
   filePathInput = exportData.filePathInput;
+  sparseCheckbox = exportData.sparseCheckbox;
+  sparseTolerance = exportData.sparseTolerance;
   camFilmSize = detailsData.camFilmSize;
   reverseSort = sortingData.reverseSort;
 
@@ -620,6 +696,28 @@ function createExportPanel(parent) {
   );
   // projectPathButton.alignment = ["fill", "center"];
 
+  // Sparse export
+  var sparseGroup = exportPanel.add("group");
+  sparseGroup.orientation = "row";
+  sparseGroup.alignChildren = ["left", "center"];
+
+  var sparseCheckbox = sparseGroup.add(
+    "checkbox",
+    undefined,
+    "Changed frames only"
+  );
+  sparseCheckbox.value = false;
+  sparseCheckbox.helpTip =
+    "Skip frames where position and orientation stay within the tolerance. " +
+    "Static stretches are written as a hold, which makes files of mostly " +
+    "static shots smaller and faster to export and import.";
+
+  var sparseTolerance = sparseGroup.add("edittext");
+  sparseTolerance.preferredSize.width = 60;
+  sparseTolerance.text = "0.001";
+  sparseTolerance.helpTip =
+    "Largest change of a position (pixels) or orientation (degrees) value still treated as static.";
+
   var exportButton = exportPanel.add("button", undefined, "Export layer");
   exportButton.helpTip =
     "Export layer position and rotation data to a file. Values are taken " +
@@ -634,6 +732,8 @@ function createExportPanel(parent) {
   return {
     panel: exportPanel,
     filePathInput: filePathInput,
+    sparseCheckbox: sparseCheckbox,
+    sparseTolerance: sparseTolerance,
   };
 }
 
@@ -0,0 +1,187 @@
+"""Lightweight bpy stand-in for running the add-on on plain CPython.
+
+Only the parts of the API the add-on touches while importing are modelled.
+Keyframe storage keeps the arrays passed to foreach_set, so timings include
+the add-on's own conversion work but not Blender's internals.
+"""
+
+import sys
+import types
+
+import numpy as np
+
+
+class _Struct:
+    """Base for registrable classes (Operator, Panel, PropertyGroup, ...)"""
+
+    def report(self, level, message):
+        pass
+
+
+class KeyframePoints:
+    def __init__(self):
+        self.count = 0
+        self.arrays = {}
+
+    def __len__(self):
+        return self.count
+
+    def add(self, count):
+        self.count += count
+
+    def clear(self):
+        self.count = 0
+        self.arrays = {}
+
+    def foreach_set(self, attr, seq):
+        self.arrays[attr] = np.array(seq, copy=True)
+
+    def foreach_get(self, attr, seq):
+        stored = self.arrays.get(attr)
+        if stored is not None:
+            seq[:len(stored)] = stored
+
+    def insert(self, frame, value):
+        co = self.arrays.get('co', np.empty(0, dtype=np.float32))
+        self.arrays['co'] = np.append(co, np.float32((frame, value)))
+        self.count += 1
+
+
+class FCurve:
+    def __init__(self, data_path, index, group=None):
+        self.data_path = data_path
+        self.array_index = index
+        self.group = group
+        self.keyframe_points = KeyframePoints()
+
+    def update(self):
+        co = self.keyframe_points.arrays.get('co')
+        if co is not None and len(co):
+            # Blender sorts keys and recalculates handles here
+            pairs = co.reshape(-1, 2)
+            self.keyframe_points.arrays['co'] = pairs[np.argsort(pairs[:, 0], kind='stable')].ravel()
+
+
+class FCurves(list):
+    def find(self, data_path, index=0):
+        for fcurve in self:
+            if fcurve.data_path == data_path and fcurve.array_index == index:
+                return fcurve
+        return None
+
+    def new(self, data_path, index=0, action_group=""):
+        fcurve = FCurve(data_path, index, action_group)
+        self.append(fcurve)
+        return fcurve
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+        self.fcurves = FCurves()
+
+
+class AnimData:
+    def __init__(self):
+        self.action = None
+
+
+class Object:
+    def __init__(self, name, data=None):
+        self.name = name
+        self.data = data
+        self.animation_data = None
+        self.location = (0.0, 0.0, 0.0)
+        self.rotation_euler = (0.0, 0.0, 0.0)
+        self.constraints = []
+
+    def animation_data_create(self):
+        if self.animation_data is None:
+            self.animation_data = AnimData()
+        return self.animation_data
+
+    def keyframe_insert(self, data_path, index=-1, frame=0.0):
+        action = self.animation_data_create().action
+        if action is None:
+            action = self.animation_data.action = data.actions.new(f"{self.name}Action")
+        for i, value in enumerate(getattr(self, data_path)):
+            fcurve = action.fcurves.find(data_path, i) or action.fcurves.new(data_path, i)
+            fcurve.keyframe_points.insert(frame, value)
+        return True
+
+
+class _Collection(list):
+    def __init__(self, factory):
+        super().__init__()
+        self.factory = factory
+
+    def new(self, name, *args):
+        item = self.factory(name, *args)
+        self.append(item)
+        return item
+
+
+def _prop(**kwargs):
+    return kwargs
+
+
+data = types.SimpleNamespace(
+    actions=_Collection(Action),
+    objects=_Collection(Object),
+    cameras=_Collection(lambda name: types.SimpleNamespace(name=name, lens=50.0, sensor_width=36.0)),
+)
+
+context = types.SimpleNamespace(
+    preferences=types.SimpleNamespace(
+        edit=types.SimpleNamespace(
+            keyframe_new_interpolation_type='BEZIER',
+            keyframe_new_handle_type='AUTO_CLAMPED',
+        )
+    ),
+)
+
+
+def install():
+    """Register the stand-in as bpy, bpy.types, bpy.props and bpy_extras"""
+    if 'bpy' in sys.modules:
+        return sys.modules['bpy']
+
+    bpy = types.ModuleType('bpy')
+    bpy.data = data
+    bpy.context = context
+
+    bpy.types = types.ModuleType('bpy.types')
+    for name in ('Operator', 'Panel', 'UIList', 'PropertyGroup', 'AddonPreferences', 'Scene'):
+        setattr(bpy.types, name, type(name, (_Struct,), {}))
+
+    bpy.props = types.ModuleType('bpy.props')
+    for name in ('StringProperty', 'CollectionProperty', 'IntProperty', 'BoolProperty',
+                 'FloatProperty', 'FloatVectorProperty', 'EnumProperty', 'PointerProperty'):
+        setattr(bpy.props, name, _prop)
+
+    bpy.utils = types.SimpleNamespace(register_class=lambda cls: None,
+                                      unregister_class=lambda cls: None)
+    bpy.app = types.ModuleType('bpy.app')
+    bpy.app.timers = types.SimpleNamespace(
+        register=lambda *args, **kwargs: None,
+        unregister=lambda *args, **kwargs: None,
+        is_registered=lambda *args: False,
+    )
+    bpy.app.handlers = types.ModuleType('bpy.app.handlers')
+    bpy.app.handlers.persistent = lambda func: func
+    bpy.app.handlers.load_post = []
+
+    bpy_extras = types.ModuleType('bpy_extras')
+    bpy_extras.io_utils = types.ModuleType('bpy_extras.io_utils')
+    bpy_extras.io_utils.ImportHelper = type('ImportHelper', (), {})
+
+    sys.modules.update({
+        'bpy': bpy,
+        'bpy.types': bpy.types,
+        'bpy.props': bpy.props,
+        'bpy.app': bpy.app,
+        'bpy.app.handlers': bpy.app.handlers,
+        'bpy_extras': bpy_extras,
+        'bpy_extras.io_utils': bpy_extras.io_utils,
+    })
+    return bpy
@@ -0,0 +1,233 @@
+"""Headless benchmarks of the AE Link parse, convert and keyframe stages.
+
+Runs on plain CPython with numpy, using a bpy stand-in, so it can run in CI:
+
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --cases 1x1000000 500x1000 --compare bench.json
+
+Each case generates a synthetic export file with ITEMS items of FRAMES
+frames and times every stage separately. Results are written as JSON. With
+--compare, stages slower than the stored baseline by more than --threshold
+are listed and the exit code is 1.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_bpy  # noqa: E402
+import synthetic  # noqa: E402
+
+fake_bpy.install()
+
+from AE_Link import decimate, keyframes, parser  # noqa: E402
+from AE_Link.track import Track, hold_interpolation, load_item  # noqa: E402
+
+DEFAULT_CASES = ['1x100', '1x10000', '1x100000', '10x10000', '100x1000', '500x100']
+FULL_CASES = DEFAULT_CASES + ['1x1000000', '50x20000', '500x1000']
+
+# The per-frame keyframe_insert stand-in is slow, skip it on long tracks
+LEGACY_KEYFRAME_LIMIT = 100000
+
+# Default Location and Rotation Tolerance of the import options
+LOCATION_TOLERANCE = 0.1
+ROTATION_TOLERANCE = math.radians(0.05)
+
+
+def addon_version():
+    with open(os.path.join(ROOT, 'AE_Link', 'blender_manifest.toml'), 'r') as f:
+        match = re.search(r'^version\s*=\s*"([^"]+)"', f.read(), re.MULTILINE)
+    return match.group(1) if match else 'unknown'
+
+
+def measure(func, repeat):
+    """Return (timing summary, last result) of calling func repeat times"""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    return {'min': min(samples), 'median': statistics.median(samples)}, result
+
+
+def run_case(directory, item_count, frame_count, repeat, sparse_tolerance=None):
+    path = os.path.join(directory, f"export_{item_count}x{frame_count}.json")
+    synthetic.write_export(path, item_count, frame_count, sparse_tolerance=sparse_tolerance)
+    stages = {}
+
+    def legacy_refresh():
+        with open(path, 'r') as f:
+            return {key: (value.get('layer_name'), value.get('type')) for key, value in json.load(f).items()}
+
+    def refresh():
+        parser.invalidate(path)
+        return parser.index_json_file(path)
+
+    stages['refresh_legacy'], _ = measure(legacy_refresh, repeat)
+    stages['refresh'], index = measure(refresh, repeat)
+    stages['refresh_cached'], _ = measure(lambda: parser.index_json_file(path), repeat)
+
+    # Item lookup after a Sync: the index is warm, the parsed item is not
+    item_id = index[len(index) // 2].id
+
+    def lookup():
+        parser.document_cache.invalidate(path)
+        return parser.load_item(path, item_id)
+
+    stages['lookup'], item_data = measure(lookup, repeat)
+    stages['lookup_cached'], _ = measure(lambda: parser.load_item(path, item_id), repeat)
+
+    # Same lookup through a memory-mapped binary sidecar
+    stages['sidecar_build'], _ = measure(lambda: parser.write_sidecar(path), 1)
+    stages['lookup_sidecar'], _ = measure(lambda: load_item(path, item_id), repeat)
+
+    transform_data = item_data['transform_data']
+    stages['track_build'], track = measure(lambda: Track.from_transform_data(transform_data), repeat)
+    stages['convert'], converted = measure(
+        lambda: (track.blender_frames(), track.blender_locations((0.0, 0.0, 0.0)), track.blender_rotations()),
+        repeat
+    )
+
+    # A fresh track per run, resample keeps its result
+    stages['retime'], _ = measure(
+        lambda: Track(track.frames, track.positions, track.orientations,
+                      track.start_frame, track.end_frame).resample(30.0, 24.0, 0.5, 'SPLINE'),
+        repeat
+    )
+
+    frames, locations, rotations = converted
+    # Sparse exports are keyed with holds, like bake_animation does
+    interpolation = hold_interpolation(frames)
+
+    def bulk_keyframes():
+        obj = fake_bpy.Object("Camera")
+        keyframes.write_transform_keyframes(obj, frames, locations, rotations, interpolation)
+        return obj
+
+    stages['keyframes'], _ = measure(bulk_keyframes, repeat)
+
+    # Keyframe reduction of all six channels, like write_decimated_keyframes
+    def reduce(mode):
+        return ([decimate.reduce_channel(frames, locations[:, i], LOCATION_TOLERANCE, mode) for i in range(3)]
+                + [decimate.reduce_channel(frames, rotations[:, i], ROTATION_TOLERANCE, mode) for i in range(3)])
+
+    stages['decimate'], _ = measure(lambda: reduce('BEZIER'), repeat)
+    stages['decimate_linear'], _ = measure(lambda: reduce('LINEAR'), repeat)
+
+    if frame_count <= LEGACY_KEYFRAME_LIMIT:
+        def legacy_keyframes():
+            obj = fake_bpy.Object("Camera")
+            for frame, location, rotation in zip(frames.tolist(), locations.tolist(), rotations.tolist()):
+                obj.location = location
+                obj.keyframe_insert(data_path="location", frame=frame)
+                obj.rotation_euler = rotation
+                obj.keyframe_insert(data_path="rotation_euler", frame=frame)
+            return obj
+
+        stages['keyframes_legacy'], _ = measure(legacy_keyframes, 1)
+
+    size = os.path.getsize(path)
+    os.remove(path)
+    os.remove(parser.sidecar_path(path))
+    parser.invalidate(path)
+    return {
+        'items': item_count,
+        'frames': frame_count,
+        'file_size': size,
+        'keys': len(frames),
+        'stages': stages,
+    }
+
+
+def parse_case(text):
+    items, frames = text.lower().split('x')
+    return int(items), int(frames)
+
+
+def compare(results, baseline_path, threshold):
+    """Return a list of regressions of results against a stored baseline"""
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)
+
+    previous = {(c['items'], c['frames']): c['stages'] for c in baseline.get('cases', [])}
+    regressions = []
+    for case in results['cases']:
+        old_stages = previous.get((case['items'], case['frames']))
+        if not old_stages:
+            continue
+        for stage, timing in case['stages'].items():
+            old = old_stages.get(stage)
+            if old and old['min'] > 0 and timing['min'] > old['min'] * threshold:
+                regressions.append(
+                    f"{case['items']}x{case['frames']} {stage}: "
+                    f"{old['min'] * 1000:.2f} ms -> {timing['min'] * 1000:.2f} ms"
+                )
+    return regressions
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--cases', nargs='+', metavar='ITEMSxFRAMES',
+                            help=f"cases to run (default: {' '.join(DEFAULT_CASES)})")
+    arg_parser.add_argument('--full', action='store_true',
+                            help="also run the large cases, up to 1M frames and 500 items")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="runs per stage, the minimum is kept")
+    arg_parser.add_argument('--sparse', type=float, metavar='TOLERANCE',
+                            help="generate \"Changed frames only\" exports with this tolerance")
+    arg_parser.add_argument('--output', help="write the results to this JSON file")
+    arg_parser.add_argument('--compare', metavar='BASELINE', help="JSON results of a previous run")
+    arg_parser.add_argument('--threshold', type=float, default=1.25,
+                            help="slowdown factor reported as a regression (default: 1.25)")
+    args = arg_parser.parse_args(argv)
+
+    cases = args.cases or (FULL_CASES if args.full else DEFAULT_CASES)
+    results = {
+        'version': addon_version(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'sparse': args.sparse,
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'cases': [],
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for text in cases:
+            item_count, frame_count = parse_case(text)
+            case = run_case(directory, item_count, frame_count, max(1, args.repeat), args.sparse)
+            results['cases'].append(case)
+
+            print(f"{item_count} items x {frame_count} frames ({case['file_size'] / 1e6:.1f} MB, "
+                  f"{case['keys']} keys per channel)")
+            for stage, timing in case['stages'].items():
+                print(f"  {stage:<18} {timing['min'] * 1000:10.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Stand-in sender for the AE Link stream receiver.
+
+Replays an export file over the stream protocol, like a live After Effects
+connection would send it:
+
+    python benchmarks/stream_sender.py blenderlink.json --port 47800
+
+With --loopback the receiver runs in this process instead of Blender, and
+the received tracks are compared against the file, so the protocol can be
+tested offline. --synthetic ITEMSxFRAMES replays a generated export.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_bpy  # noqa: E402
+import synthetic  # noqa: E402
+
+fake_bpy.install()
+
+from AE_Link import parser, stream  # noqa: E402
+from AE_Link.track import load_item  # noqa: E402
+
+
+def receive_all(receiver, expected_items, timeout):
+    """Assemble messages until expected_items items are complete"""
+    streamed = stream.StreamedItems()
+    deadline = time.perf_counter() + timeout
+    while len(streamed.complete) < expected_items:
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"{len(streamed.complete)} of {expected_items} items received")
+        messages = receiver.drain()
+        if messages:
+            streamed.apply(messages)
+        else:
+            time.sleep(0.001)
+    return streamed
+
+
+def verify(filepath, streamed):
+    """Return a list of items whose received track differs from the file"""
+    mismatches = []
+    for entry in parser.visible_items(filepath):
+        _, track = load_item(filepath, entry.id)
+        received = streamed.track(entry.id)
+        if not (np.array_equal(track.frames, received.frames)
+                and np.array_equal(track.positions, received.positions)
+                and np.array_equal(track.orientations, received.orientations)
+                and track.start_frame == received.start_frame):
+            mismatches.append(entry.id)
+    return mismatches
+
+
+def loopback(filepath, chunk_frames, timeout):
+    receiver = stream.Receiver(port=0)
+    receiver.start()
+    try:
+        start = time.perf_counter()
+        sent = stream.send_export(filepath, receiver.host, receiver.port, chunk_frames)
+        streamed = receive_all(receiver, len(parser.visible_items(filepath)), timeout)
+        elapsed = time.perf_counter() - start
+    finally:
+        receiver.stop()
+
+    frames = sum(len(streamed.rows(item_id)) for item_id in streamed.items)
+    print(f"{len(streamed.items)} items, {frames} frames, {sent / 1e6:.1f} MB in {elapsed * 1000:.1f} ms "
+          f"({frames / max(elapsed, 1e-9):.0f} frames/s)")
+
+    mismatches = verify(filepath, streamed)
+    for item_id in mismatches:
+        print(f"MISMATCH {item_id}")
+    return 1 if mismatches or receiver.errors else 0
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('path', nargs='?', help="export file to replay")
+    arg_parser.add_argument('--synthetic', metavar='ITEMSxFRAMES', help="replay a generated export instead")
+    arg_parser.add_argument('--host', default=stream.DEFAULT_HOST)
+    arg_parser.add_argument('--port', type=int, default=stream.DEFAULT_PORT)
+    arg_parser.add_argument('--chunk-frames', type=int, default=stream.DEFAULT_CHUNK_FRAMES,
+                            help="frames per message")
+    arg_parser.add_argument('--loopback', action='store_true',
+                            help="receive in this process and verify the result")
+    arg_parser.add_argument('--timeout', type=float, default=60.0)
+    args = arg_parser.parse_args(argv)
+
+    if not args.path and not args.synthetic:
+        arg_parser.error("give an export file or --synthetic")
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = args.path
+        if args.synthetic:
+            items, frames = (int(n) for n in args.synthetic.lower().split('x'))
+            filepath = os.path.join(directory, 'export.json')
+            synthetic.write_export(filepath, items, frames)
+
+        if args.loopback:
+            return loopback(filepath, args.chunk_frames, args.timeout)
+
+        start = time.perf_counter()
+        sent = stream.send_export(filepath, args.host, args.port, args.chunk_frames)
+        print(f"Sent {sent / 1e6:.1f} MB in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
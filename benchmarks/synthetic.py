@@ -0,0 +1,121 @@
+"""Synthetic export files matching the schema written by Blender Link.jsx."""
+
+import json
+import math
+
+
+def _samples(item_index, start_frame, frame_count):
+    """Yield (frame, position xyz, orientation xyz) of one item"""
+    phase = item_index * 0.37
+    for i in range(frame_count):
+        t = i / 24.0 + phase
+        # Smooth dolly with a hold every few seconds, like a typical camera move
+        hold = (i // 120) % 4 == 3
+        s = (i // 120) * 120 / 24.0 + phase if hold else t
+        yield (
+            start_frame + i,
+            (960.0 + 400.0 * math.sin(s * 0.5),
+             540.0 + 120.0 * math.sin(s * 0.8),
+             -2666.7 + 300.0 * math.cos(s * 0.3)),
+            (10.0 * math.sin(s * 0.4),
+             25.0 * math.sin(s * 0.2),
+             2.0 * math.cos(s * 0.7)),
+        )
+
+
+def _sparse_samples(samples, tolerance):
+    """Keep the samples the "Changed frames only" export of Blender Link.jsx keeps
+
+    Yields (sample, hold), hold marking the last frame of a static stretch.
+    """
+    last = held = None
+    samples = list(samples)
+    for i, sample in enumerate(samples):
+        static = last is not None and all(
+            abs(a - b) <= tolerance for a, b in zip(sample[1] + sample[2], last[1] + last[2]))
+        if static:
+            held = sample
+            if i == len(samples) - 1:
+                yield held, True
+        else:
+            if held is not None:
+                yield held, True
+                held = None
+            yield sample, False
+            last = sample
+
+
+def _frame_lines(item_index, start_frame, frame_count, sparse_tolerance=None):
+    """Yield the frames of one item formatted like JSON.stringify(data, null, 2)"""
+    template = (
+        '        {{\n'
+        '          "frame": {frame},\n'
+        '          "position": {{\n'
+        '            "x": {px!r},\n'
+        '            "y": {py!r},\n'
+        '            "z": {pz!r}\n'
+        '          }},\n'
+        '          "orientation": {{\n'
+        '            "x": {ox!r},\n'
+        '            "y": {oy!r},\n'
+        '            "z": {oz!r}\n'
+        '          }}{hold}\n'
+        '        }}'
+    )
+    samples = _samples(item_index, start_frame, frame_count)
+    if sparse_tolerance is None:
+        marked = ((sample, False) for sample in samples)
+    else:
+        marked = _sparse_samples(samples, sparse_tolerance)
+    for (frame, (px, py, pz), (ox, oy, oz)), hold in marked:
+        yield template.format(frame=frame, px=px, py=py, pz=pz, ox=ox, oy=oy, oz=oz,
+                              hold=',\n          "hold": true' if hold else '')
+
+
+def write_export(path, item_count, frame_count, start_frame=0, sparse_tolerance=None):
+    """Write an export file with item_count camera items of frame_count frames each
+
+    With sparse_tolerance, frames are left out like the "Changed frames
+    only" export does.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{')
+        for item_index in range(item_count):
+            header = {
+                'layer_name': f"Camera {item_index + 1}",
+                'type': 'camera',
+                'comp': f"Comp {item_index % 5 + 1}",
+                'comp_details': {
+                    'fps': 24,
+                    'width': 1920,
+                    'height': 1080,
+                    'shutter_angle': 180,
+                    'shutter_phase': -90,
+                },
+                'transform_data': {
+                    'start_frame': start_frame,
+                    'end_frame': start_frame + frame_count - 1,
+                    'frames': [],
+                },
+                'camera_data': {
+                    'focal_length': "35.00",
+                    'sensor_size': 36,
+                },
+            }
+            if sparse_tolerance is not None:
+                header['transform_data'].update(sparse=True, tolerance=sparse_tolerance)
+            text = json.dumps(header, indent=2).replace('\n', '\n  ')
+            before, after = text.split('"frames": []')
+
+            f.write(',\n  ' if item_index else '\n  ')
+            f.write(f'"{1000 + item_index}": ')
+            f.write(before)
+            f.write('"frames": [')
+            first = True
+            for line in _frame_lines(item_index, start_frame, frame_count, sparse_tolerance):
+                f.write('\n' if first else ',\n')
+                f.write(line)
+                first = False
+            f.write('\n      ]' if not first else ']')
+            f.write(after)
+        f.write('\n}')
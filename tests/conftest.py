@@ -0,0 +1,12 @@
+"""Run the add-on modules on plain CPython with the bpy stand-in of the benchmarks"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import fake_bpy  # noqa: E402
+
+fake_bpy.install()
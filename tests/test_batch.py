@@ -0,0 +1,88 @@
+import os
+
+import pytest
+import synthetic
+
+from AE_Link import batch, parser
+
+
+class StubBuilder:
+    """Records the jobs it builds and writes an empty output file"""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.built = []
+
+    def build(self, job, options):
+        self.built.append((job.name, dict(options)))
+        if job.name in self.fail:
+            raise RuntimeError(f"cannot build {job.name}")
+        with open(job.output, 'wb'):
+            pass
+        return len(job.item_ids), [f"INFO: built {job.name}"]
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = str(tmp_path / "shot.json")
+    synthetic.write_export(path, 7, 20)
+    yield path
+    parser.invalidate(path)
+
+
+def test_plan_jobs_groups_by_comp(export_file, tmp_path):
+    jobs = batch.plan_jobs([export_file], 'comp', str(tmp_path / "out"))
+
+    assert sorted(job.name for job in jobs) == [f"Comp {i}" for i in range(1, 6)]
+    assert sum(len(job.item_ids) for job in jobs) == 7
+    assert len(set(job.output for job in jobs)) == len(jobs)
+    assert all(job.frames == 20 * len(job.item_ids) for job in jobs)
+
+
+def test_run_jobs_builds_every_job(export_file, tmp_path):
+    jobs = batch.plan_jobs([export_file], 'item', str(tmp_path / "out"))
+    builder = StubBuilder()
+
+    results = batch.run_jobs(jobs, {'decimate': True}, builder)
+
+    assert [result['name'] for result in results] == [job.name for job in jobs]
+    assert [name for name, _ in builder.built] == [job.name for job in jobs]
+    assert all(options == {'decimate': True} for _, options in builder.built)
+    for job, result in zip(jobs, results):
+        assert result['error'] is None
+        assert result['items'] == 1
+        assert result['reports'] == [f"INFO: built {job.name}"]
+        assert result['seconds'] >= 0.0
+        assert os.path.isfile(job.output)
+
+
+def test_run_jobs_failure_is_kept_to_its_job(export_file, tmp_path):
+    jobs = batch.plan_jobs([export_file], 'comp', str(tmp_path / "out"))
+    failing = jobs[1].name
+
+    results = batch.run_jobs(jobs, {}, StubBuilder(fail=[failing]))
+
+    errors = {result['name']: result['error'] for result in results}
+    assert errors.pop(failing) == f"RuntimeError: cannot build {failing}"
+    assert all(error is None for error in errors.values())
+    assert len(results) == len(jobs)
+
+
+def test_run_jobs_without_imported_items_fails(tmp_path):
+    job = batch.BatchJob("Empty", "missing.json", [], str(tmp_path / "empty.blend"), 0)
+
+    result, = batch.run_jobs([job], {}, StubBuilder())
+
+    assert result['items'] == 0
+    assert result['error'] == "No item was imported"
+
+
+def test_assign_workers_balances_frames():
+    jobs = [batch.BatchJob(str(i), "f.json", [str(i)], f"{i}.blend", frames)
+            for i, frames in enumerate((100, 60, 50, 40, 10))]
+
+    assigned = batch.assign_workers(jobs, 2)
+
+    loads = sorted(sum(job.frames for job in worker_jobs) for worker_jobs in assigned)
+    assert loads == [120, 140]
+    assert sorted(job.name for worker_jobs in assigned for job in worker_jobs) == sorted(job.name for job in jobs)
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+import synthetic
+
+from AE_Link import catalog, parser
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    for shot in ("sh010", "sh020"):
+        (root / shot).mkdir(parents=True)
+        synthetic.write_export(str(root / shot / "cameras.json"), 3, 10)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    yield str(root), str(cache_dir)
+    parser.invalidate()
+
+
+def test_scan_stores_database_in_cache(project):
+    root, cache_dir = project
+    db_path = catalog.cache_path(cache_dir, root)
+    project_catalog = catalog.Catalog(root, db_path)
+
+    result = project_catalog.scan()
+
+    assert (result.indexed, result.unchanged, result.removed, result.errors) == (2, 0, 0, [])
+    assert os.path.isfile(db_path)
+    assert not os.path.exists(catalog.catalog_path(root))
+    assert len(project_catalog.search()) == 6
+    assert {item.comp for item in project_catalog.search("Comp 2")} == {"Comp 2"}
+    assert catalog.Catalog(root, db_path).scan().unchanged == 2
+
+
+def test_cache_path_per_root(project, tmp_path):
+    root, cache_dir = project
+
+    assert catalog.cache_path(cache_dir, root) == catalog.cache_path(cache_dir, root + os.sep)
+    assert catalog.cache_path(cache_dir, root) != catalog.cache_path(cache_dir, str(tmp_path))
+    assert catalog.Catalog(root).db_path == catalog.catalog_path(os.path.abspath(root))
+
+
+def test_scan_does_not_keep_indexes(project):
+    root, cache_dir = project
+    parser.invalidate()
+
+    catalog.Catalog(root, catalog.cache_path(cache_dir, root)).scan()
+
+    assert not parser._index_cache
+
+
+def test_load_reads_cataloged_span(project):
+    root, cache_dir = project
+    project_catalog = catalog.Catalog(root, catalog.cache_path(cache_dir, root))
+    project_catalog.scan()
+    entry = project_catalog.search("Camera 2")[0]
+
+    item, track, checksum = project_catalog.load(entry.file, entry.id)
+
+    assert item == parser.load_item(entry.file, entry.id)
+    assert len(track) == 10
+    assert checksum == parser.item_checksum(entry.file, parser.find_item(entry.file, entry.id))
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from AE_Link import decimate
+
+
+def evaluate(reduction, x):
+    """Value of the reduced keys at x, Bezier segments evaluated from their handles"""
+    kx, ky = reduction.frames, reduction.values
+    if reduction.handles_left is None:
+        return np.interp(x, kx, ky)
+
+    segment = np.clip(np.searchsorted(kx, x, side='right') - 1, 0, len(kx) - 2)
+    x0, x1 = kx[segment], kx[segment + 1]
+    # Handles one third of the interval long make x linear in the Bezier parameter
+    t = (x - x0) / (x1 - x0)
+    p0 = ky[segment]
+    p1 = reduction.handles_right[segment, 1]
+    p2 = reduction.handles_left[segment + 1, 1]
+    p3 = ky[segment + 1]
+    s = 1.0 - t
+    return s ** 3 * p0 + 3 * s * s * t * p1 + 3 * s * t * t * p2 + t ** 3 * p3
+
+
+def channels():
+    rng = np.random.default_rng(11)
+    x = np.arange(1.0, 2001.0)
+    return {
+        'smooth': (x, np.sin(x / 40.0) * 50.0 + x * 0.01),
+        'random': (x, np.cumsum(rng.normal(size=len(x)))),
+        'noise': (x, rng.normal(size=len(x))),
+        'steps': (x, np.floor(x / 150.0) * 3.0),
+    }
+
+
+@pytest.mark.parametrize('mode', ['LINEAR', 'BEZIER'])
+@pytest.mark.parametrize('name', ['smooth', 'random', 'noise', 'steps'])
+@pytest.mark.parametrize('tolerance', [0.5, 0.01])
+def test_keys_stay_within_tolerance(mode, name, tolerance):
+    x, y = channels()[name]
+
+    reduction = decimate.reduce_channel(x, y, tolerance, mode)
+
+    error = np.abs(evaluate(reduction, x) - y).max()
+    assert reduction.max_error <= tolerance
+    assert error <= tolerance + 1e-9
+    assert error == pytest.approx(reduction.max_error, abs=1e-9)
+    assert reduction.frames[0] == x[0] and reduction.frames[-1] == x[-1]
+    assert np.all(np.diff(reduction.frames) > 0)
+    assert np.isin(reduction.frames, x).all()
+
+
+def test_smooth_channel_needs_few_keys():
+    x, y = channels()['smooth']
+
+    linear = decimate.reduce_channel(x, y, 0.05, 'LINEAR')
+    bezier = decimate.reduce_channel(x, y, 0.05, 'BEZIER')
+
+    assert len(bezier.frames) < len(linear.frames) < len(x) // 2
+
+
+def test_handles_follow_hermite_tangents():
+    x, y = channels()['random']
+    reduction = decimate.reduce_channel(x, y, 0.2, 'BEZIER')
+    kx, ky = reduction.frames, reduction.values
+
+    slopes = decimate.hermite_tangents(kx, ky)
+
+    left, right = reduction.handles_left, reduction.handles_right
+    np.testing.assert_allclose((right[:, 1] - ky) / (right[:, 0] - kx), slopes, atol=1e-9)
+    np.testing.assert_allclose((ky - left[:, 1]) / (kx - left[:, 0]), slopes, atol=1e-9)
+    intervals = np.diff(kx) / 3.0
+    np.testing.assert_allclose(right[:-1, 0] - kx[:-1], intervals)
+    np.testing.assert_allclose(kx[1:] - left[1:, 0], intervals)
+
+
+def test_bezier_handles_evaluate_to_hermite_curve():
+    keys = np.array([0, 4, 10, 12])
+    x = np.arange(0.0, 13.0)
+    y = np.zeros_like(x)
+    y[keys] = (1.0, 3.0, -2.0, 0.5)
+    slopes = decimate.hermite_tangents(x[keys], y[keys])
+    left, right = decimate.bezier_handles(x[keys], y[keys], slopes)
+    reduction = decimate.Reduction(x[keys], y[keys], left, right, 0.0)
+
+    # Inner samples of every key interval, as reduce_channel measures them
+    samples = np.setdiff1d(np.arange(13), keys)
+    lengths = np.diff(keys) - 1
+    hermite = decimate._hermite_curve(x, y, keys, samples, np.arange(len(keys) - 1), lengths, slopes)
+
+    np.testing.assert_allclose(evaluate(reduction, x[samples]), hermite, atol=1e-12)
+
+
+def test_hermite_tangents_clamp_extrema():
+    slopes = decimate.hermite_tangents(np.array([0.0, 1.0, 2.0, 3.0]), np.array([0.0, 2.0, 1.0, 3.0]))
+
+    assert slopes[0] == slopes[-1] == 0.0
+    assert slopes[1] == 0.0 and slopes[2] == 0.0
+
+
+@pytest.mark.parametrize('mode', ['LINEAR', 'BEZIER'])
+@pytest.mark.parametrize('count', [0, 1, 2, 3])
+def test_short_channels(mode, count):
+    x = np.arange(float(count))
+    y = np.array([0.0, 5.0, 0.0])[:count]
+
+    reduction = decimate.reduce_channel(x, y, 0.1, mode)
+
+    assert len(reduction.frames) == len(reduction.values)
+    np.testing.assert_array_equal(reduction.frames, x)
+    np.testing.assert_array_equal(reduction.values, y)
+    assert reduction.max_error == 0.0
+    if mode == 'BEZIER':
+        assert reduction.handles_left.shape == reduction.handles_right.shape == (count, 2)
+
+
+@pytest.mark.parametrize('mode', ['LINEAR', 'BEZIER'])
+def test_constant_channel_reduces_to_two_keys(mode):
+    x = np.arange(1.0, 501.0)
+
+    reduction = decimate.reduce_channel(x, np.full(len(x), 2.5), 0.0, mode)
+
+    np.testing.assert_array_equal(reduction.frames, [1.0, 500.0])
+    np.testing.assert_array_equal(reduction.values, [2.5, 2.5])
+    assert reduction.max_error == 0.0
@@ -0,0 +1,40 @@
+import numpy as np
+import fake_bpy
+
+from AE_Link import dedup, keyframes
+
+
+def baked_action(values):
+    obj = fake_bpy.Object("Camera")
+    frames = np.arange(1.0, len(values) + 1.0)
+    locations = np.column_stack((values, values * 2.0, values * 3.0))
+    keyframes.write_transform_keyframes(obj, frames, locations, np.zeros_like(locations))
+    return obj.animation_data.action
+
+
+def test_action_state_is_equal_for_equal_keys():
+    values = np.linspace(0.0, 1.0, 50)
+
+    assert dedup.action_state(baked_action(values)) == dedup.action_state(baked_action(values.copy()))
+
+
+def test_action_state_changes_when_keys_are_edited():
+    action = baked_action(np.linspace(0.0, 1.0, 50))
+    state = dedup.action_state(action)
+
+    points = action.fcurves[1].keyframe_points
+    co = np.empty(len(points) * 2, dtype=np.float32)
+    points.foreach_get('co', co)
+    co[21] += 0.5
+    points.foreach_set('co', co)
+
+    assert dedup.action_state(action) != state
+
+
+def test_action_state_changes_when_keys_are_added():
+    action = baked_action(np.linspace(0.0, 1.0, 50))
+    state = dedup.action_state(action)
+
+    action.fcurves[0].keyframe_points.insert(60.0, 2.0)
+
+    assert dedup.action_state(action) != state
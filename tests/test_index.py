@@ -0,0 +1,38 @@
+import json
+import os
+
+import pytest
+import synthetic
+
+from AE_Link import parser
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = str(tmp_path / "export.json")
+    synthetic.write_export(path, 4, 30)
+    yield path
+    parser.invalidate(path)
+
+
+def test_index_spans_hold_the_items(export_file):
+    with open(export_file, 'r') as f:
+        document = json.load(f)
+
+    index = parser.index_json_file(export_file)
+
+    assert [entry.id for entry in index] == list(document)
+    for entry in index:
+        item = document[entry.id]
+        assert (entry.name, entry.type, entry.comp) == (item['layer_name'], item['type'], item['comp'])
+        assert entry.frame_count == len(item['transform_data']['frames'])
+        assert parser.load_item(export_file, entry.id) == item
+
+
+def test_index_follows_file_changes(export_file):
+    assert len(parser.index_json_file(export_file)) == 4
+
+    synthetic.write_export(export_file, 2, 10)
+    os.utime(export_file, ns=(0, 1))
+
+    assert [entry.frame_count for entry in parser.index_json_file(export_file)] == [10, 10]
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+import synthetic
+
+from AE_Link import parser
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = str(tmp_path / "export.json")
+    synthetic.write_export(path, 4, 30)
+    yield path
+    parser.invalidate(path)
+
+
+def write_json_lines(path, records, tail=b""):
+    with open(path, 'wb') as f:
+        for record in records:
+            f.write(json.dumps(record).encode('utf-8') + b"\n")
+        f.write(tail)
+
+
+def camera(name, frame_count=3):
+    frames = [{'frame': i, 'position': {'x': i, 'y': 0, 'z': 0}, 'orientation': {'x': 0, 'y': 0, 'z': 0}}
+              for i in range(frame_count)]
+    return {'layer_name': name, 'type': 'camera', 'comp': "Comp 1",
+            'transform_data': {'start_frame': 0, 'end_frame': frame_count - 1, 'frames': frames}}
+
+
+def test_json_lines_last_writer_wins(tmp_path):
+    path = str(tmp_path / "export.jsonl")
+    write_json_lines(path, [{'1': camera("A"), '2': camera("B")}, {'1': camera("A2", 5)}])
+
+    index = parser.index_json_file(path)
+
+    assert [(entry.id, entry.name, entry.frame_count) for entry in index] == [('1', "A2", 5), ('2', "B", 3)]
+    assert parser.load_item(path, '1') == camera("A2", 5)
+    parser.invalidate(path)
+
+
+def test_json_lines_partial_last_line_is_skipped(tmp_path):
+    path = str(tmp_path / "export.jsonl")
+    partial = json.dumps({'1': camera("A3"), '3': camera("C")}).encode('utf-8')[:-40]
+    write_json_lines(path, [{'1': camera("A"), '2': camera("B")}], tail=partial)
+
+    index = parser.index_json_file(path)
+
+    assert [(entry.id, entry.name) for entry in index] == [('1', "A"), ('2', "B")]
+    assert parser.load_item(path, '1') == camera("A")
+
+    # Once the record is complete, its items are indexed
+    write_json_lines(path, [{'1': camera("A"), '2': camera("B")}, {'1': camera("A3"), '3': camera("C")}])
+    index = parser.index_json_file(path)
+    assert [(entry.id, entry.name) for entry in index] == [('1', "A3"), ('2', "B"), ('3', "C")]
+    parser.invalidate(path)
+
+
+def test_read_json_file_skips_partial_last_line(tmp_path):
+    path = str(tmp_path / "export.jsonl")
+    partial = json.dumps({'1': camera("A3"), '3': camera("C")}).encode('utf-8')[:-40]
+    write_json_lines(path, [{'1': camera("A"), '2': camera("B")}, {'2': camera("B2")}], tail=partial)
+
+    assert parser.read_json_file(path) == {'1': camera("A"), '2': camera("B2")}
+
+    # A broken line followed by others is an error
+    write_json_lines(path, [{'1': camera("A")}], tail=partial + b"\n" + json.dumps({'2': camera("B")}).encode('utf-8'))
+    assert parser.read_json_file(path) is None
+    parser.invalidate(path)
+
+
+def test_compact_json_lines_keeps_one_record_per_item(tmp_path):
+    path = str(tmp_path / "export.jsonl")
+    write_json_lines(path, [{'1': camera("A"), '2': camera("B")}, {'1': camera("A2")}, {'3': camera("C")}])
+    parser.add_tombstone(path, '3')
+
+    assert parser.compact(path) == 1
+
+    with open(path, 'r') as f:
+        records = [json.loads(line) for line in f]
+    assert records == [{'1': camera("A2")}, {'2': camera("B")}]
+    parser.invalidate(path)
+
+
+def test_convert_to_json_lines(export_file):
+    with open(export_file, 'r') as f:
+        document = json.load(f)
+    parser.add_tombstone(export_file, '1000')
+
+    out_path = parser.convert_to_json_lines(export_file)
+
+    assert out_path.endswith(parser.JSON_LINES_SUFFIX)
+    del document['1000']
+    assert {entry.id: parser.load_item(out_path, entry.id) for entry in parser.index_json_file(out_path)} == document
+    parser.invalidate(out_path)
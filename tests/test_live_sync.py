@@ -0,0 +1,33 @@
+import json
+
+from AE_Link import parser
+
+
+def camera(name, frame_count=3):
+    frames = [{'frame': i, 'position': {'x': i, 'y': 0, 'z': 0}, 'orientation': {'x': 0, 'y': 0, 'z': 0}}
+              for i in range(frame_count)]
+    return {'layer_name': name, 'type': 'camera', 'comp': "Comp 1",
+            'transform_data': {'start_frame': 0, 'end_frame': frame_count - 1, 'frames': frames}}
+
+
+def test_digests_change_only_for_changed_items(tmp_path):
+    path = str(tmp_path / "export.jsonl")
+    with open(path, 'w') as f:
+        f.write(json.dumps({'1': camera("A"), '2': camera("B")}) + "\n")
+    before = parser.item_digests(path)
+
+    with open(path, 'a') as f:
+        f.write(json.dumps({'2': camera("B", 5)}) + "\n")
+    after = parser.item_digests(path)
+
+    assert after['1'] == before['1']
+    assert after['2'] != before['2']
+    for entry in parser.index_json_file(path):
+        assert after[entry.id] == parser.item_checksum(path, entry)
+    parser.invalidate(path)
+
+
+def test_checksum_text_fits_any_crc():
+    assert parser.checksum_text(0) == "00000000"
+    assert parser.checksum_text(2736983185) == "a3230c91"
+    assert parser.checksum_text(2 ** 32 - 1) == "ffffffff"
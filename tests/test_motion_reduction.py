@@ -0,0 +1,35 @@
+from math import exp
+
+import numpy as np
+import pytest
+
+from AE_Link.track import motion_reduction_influence, reduce_motion
+
+
+def test_influence_curve():
+    assert motion_reduction_influence(1) == 0.0
+    assert motion_reduction_influence(100) == pytest.approx(1.0 - exp(-5.5))
+    factors = np.arange(1, 101)
+    assert np.all(np.diff([motion_reduction_influence(f) for f in factors]) > 0)
+
+
+def test_reduce_motion_matches_copy_location_constraint():
+    rng = np.random.default_rng(3)
+    locations = rng.normal(scale=50.0, size=(200, 3))
+    start_position = (1.0, -2.0, 0.5)
+    influence = motion_reduction_influence(100)
+
+    reduced = reduce_motion(locations, start_position, influence)
+
+    # COPY_LOCATION mixes the owner and target location by influence, per frame
+    expected = [[(1.0 - influence) * value + influence * target for value, target in zip(row, start_position)]
+                for row in locations.tolist()]
+    np.testing.assert_allclose(reduced, expected)
+    assert reduced.shape == locations.shape
+
+
+def test_reduce_motion_bounds():
+    locations = np.array([[10.0, 20.0, 30.0], [-5.0, 0.0, 5.0]])
+
+    np.testing.assert_array_equal(reduce_motion(locations, (0.0, 0.0, 0.0), 0.0), locations)
+    np.testing.assert_allclose(reduce_motion(locations, (1.0, 2.0, 3.0), 1.0), [[1.0, 2.0, 3.0]] * 2)
@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+import synthetic
+
+from AE_Link import operators, parser, retime
+from AE_Link.track import Track
+
+
+def test_sample_times_start_on_retimed_start_frame():
+    frames = np.arange(10.0, 41.0)
+
+    times = retime.sample_times(frames, 10.0, 24.0 / 30.0, 0.5)
+
+    assert times[0] == pytest.approx(8.0)
+    assert times[-1] == pytest.approx(32.0)
+    np.testing.assert_allclose(np.diff(times), 0.5)
+
+
+def test_sample_times_skip_grid_points_before_first_frame():
+    times = retime.sample_times(np.array([3.0, 4.0, 5.0]), 0.0, 1.0, 2.0)
+
+    np.testing.assert_allclose(times, [4.0])
+
+
+@pytest.mark.parametrize('mode', retime.POSITION_MODES)
+def test_positions_pass_through_samples(mode):
+    frames = np.arange(8.0)
+    positions = np.column_stack((frames ** 2, np.sin(frames), np.cos(frames)))
+
+    np.testing.assert_allclose(retime.interpolate_positions(frames, positions, frames, mode), positions,
+                               atol=1e-12)
+
+
+def test_spline_positions_follow_curve_between_samples():
+    frames = np.arange(0.0, 20.0)
+    positions = np.column_stack((np.sin(frames / 3.0), frames, np.zeros_like(frames)))
+    times = np.arange(0.5, 19.0)
+
+    linear = retime.interpolate_positions(frames, positions, times, 'LINEAR')
+    spline = retime.interpolate_positions(frames, positions, times, 'SPLINE')
+
+    exact = np.sin(times / 3.0)
+    assert np.abs(spline[:, 0] - exact)[1:-1].max() < np.abs(linear[:, 0] - exact)[1:-1].max()
+    np.testing.assert_allclose(spline[:, 1], times)
+
+
+def test_euler_quaternion_round_trip():
+    rng = np.random.default_rng(5)
+    eulers = rng.uniform(-1.4, 1.4, size=(100, 3))
+
+    back = retime.quaternions_to_euler(retime.euler_to_quaternions(eulers), eulers)
+
+    np.testing.assert_allclose(back, eulers, atol=1e-9)
+
+
+def test_rotations_take_shortest_path_across_wrap():
+    frames = np.array([0.0, 1.0])
+    eulers = np.radians([[0.0, 0.0, 170.0], [0.0, 0.0, -170.0]])
+
+    rotations = np.degrees(retime.interpolate_rotations(frames, eulers, np.array([0.0, 0.5, 1.0])))
+
+    # 20 degrees through 180, not 340 degrees through 0
+    assert rotations[1, 2] % 360.0 == pytest.approx(180.0)
+    assert abs(rotations[2, 2] - rotations[0, 2]) == pytest.approx(20.0)
+
+
+def test_load_items_retimes_and_converts_on_the_worker(tmp_path):
+    path = str(tmp_path / "export.json")
+    synthetic.write_export(path, 2, 60)
+    options = {'start_position': (0.0, 0.0, 0.0), 'retime': True, 'retime_fps': 30.0,
+               'retime_step': 0.5, 'retime_position': 'SPLINE'}
+
+    loaded = operators.load_items(None, [(path, '1000'), (path, '1001')], options)
+
+    for item in loaded:
+        retimed = operators.retime_track(item.data, item.track, options)
+        assert retimed is not item.track
+        assert retimed is operators.retime_track(item.data, item.track, options)
+        assert len(retimed) == 148
+        assert 'digest' in retimed._cache
+        offset = retimed.start_offset(options['start_position'])
+        assert ('blender', tuple(offset)) in retimed._cache
+    parser.invalidate(path)
+
+
+def linear_track(count=31, start_frame=0.0):
+    frames = np.arange(count, dtype=np.float64) + start_frame
+    positions = np.column_stack((frames * 2.0, frames * -1.0, np.full(count, 500.0)))
+    orientations = np.column_stack((frames * 0.5, frames * 1.5, frames * -0.25))
+    return Track(frames, positions, orientations)
+
+
+@pytest.mark.parametrize('source_fps, target_fps, step, count', [
+    (30.0, 30.0, 1.0, 31),
+    (30.0, 24.0, 1.0, 25),
+    (24.0, 48.0, 1.0, 61),
+    (30.0, 30.0, 0.5, 61),
+    (30.0, 24.0, 0.25, 97),
+])
+def test_resample_times(source_fps, target_fps, step, count):
+    track = linear_track()
+
+    resampled = track.resample(source_fps, target_fps, step)
+
+    ratio = target_fps / source_fps
+    assert len(resampled) == count
+    np.testing.assert_allclose(np.diff(resampled.frames), step)
+    assert resampled.frames[0] == 0.0
+    assert resampled.frames[-1] == pytest.approx(30.0 * ratio)
+    assert (resampled.start_frame, resampled.end_frame) == (0.0, pytest.approx(30.0 * ratio))
+
+
+@pytest.mark.parametrize('mode', ['LINEAR', 'SPLINE'])
+def test_resample_interpolates_between_samples(mode):
+    track = linear_track()
+
+    resampled = track.resample(30.0, 24.0, 0.5, mode)
+
+    # Linear motion is reproduced exactly by both position modes
+    source_frames = resampled.frames * 30.0 / 24.0
+    np.testing.assert_allclose(resampled.positions[:, 0], source_frames * 2.0, atol=1e-9)
+    np.testing.assert_allclose(resampled.positions[:, 1], -source_frames, atol=1e-9)
+    np.testing.assert_allclose(resampled.positions[:, 2], 500.0)
+    # Orientations agree with the samples where the grids meet
+    on_sample = np.isclose(source_frames, np.round(source_frames))
+    np.testing.assert_allclose(resampled.orientations[on_sample],
+                               track.orientations[np.round(source_frames[on_sample]).astype(int)], atol=1e-9)
+
+
+def test_resample_keeps_first_key_on_start_frame():
+    track = linear_track(count=20, start_frame=7.0)
+
+    resampled = track.resample(25.0, 50.0, 1.0)
+
+    assert resampled.start_frame == 14.0
+    assert resampled.blender_frames()[0] == 1.0
+    np.testing.assert_allclose(resampled.positions[0], track.positions[0])
+
+
+def test_resample_is_cached():
+    track = linear_track()
+
+    assert track.resample(30.0, 24.0) is track.resample(30.0, 24.0)
+    assert track.resample(30.0, 24.0) is not track.resample(30.0, 24.0, 0.5)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+import synthetic
+
+from AE_Link import parser
+from AE_Link.track import Track, load_item
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = str(tmp_path / "export.json")
+    synthetic.write_export(path, 3, 240, start_frame=12)
+    yield path
+    parser.invalidate(path)
+
+
+def test_sidecar_track_matches_json(export_file):
+    item = parser.load_item(export_file, '1002')
+    expected = Track.from_transform_data(item['transform_data'])
+
+    parser.write_sidecar(export_file)
+    sidecar_item, track = load_item(export_file, '1002')
+
+    assert not sidecar_item['transform_data'].get('frames')
+    assert (track.start_frame, track.end_frame) == (expected.start_frame, expected.end_frame)
+    np.testing.assert_array_equal(track.frames, expected.frames)
+    np.testing.assert_array_equal(track.positions, expected.positions)
+    np.testing.assert_array_equal(track.orientations, expected.orientations)
+    assert track.digest() == expected.digest()
+
+
+def test_stale_sidecar_is_not_used(export_file):
+    parser.write_sidecar(export_file)
+    assert parser.open_sidecar(export_file) is not None
+
+    synthetic.write_export(export_file, 3, 50, start_frame=12)
+    parser.invalidate(export_file)
+
+    assert parser.open_sidecar(export_file) is None
+    _, track = load_item(export_file, '1002')
+    assert len(track) == 50
+
+    parser.write_sidecar(export_file)
+    sidecar = parser.open_sidecar(export_file)
+    assert sidecar is not None
+    assert sidecar.column_span('1002')[1] == 50
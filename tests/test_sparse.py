@@ -0,0 +1,28 @@
+import numpy as np
+import synthetic
+
+from AE_Link import parser
+from AE_Link.track import Track, hold_interpolation
+
+
+def test_hold_interpolation_of_sparse_frames():
+    assert hold_interpolation(np.arange(5.0)) is None
+    assert list(hold_interpolation(np.array([0.0, 1.0, 5.0, 6.0, 9.0]))) == \
+        ['LINEAR', 'CONSTANT', 'LINEAR', 'CONSTANT', 'LINEAR']
+
+
+def test_sparse_export_loads_with_holds(tmp_path):
+    dense_path = str(tmp_path / "dense.json")
+    sparse_path = str(tmp_path / "sparse.json")
+    synthetic.write_export(dense_path, 2, 480)
+    synthetic.write_export(sparse_path, 2, 480, sparse_tolerance=0.5)
+
+    dense = Track.from_transform_data(parser.load_item(dense_path, '1000')['transform_data'])
+    sparse = Track.from_transform_data(parser.load_item(sparse_path, '1000')['transform_data'])
+
+    assert len(sparse) < len(dense)
+    assert sparse.frames[0] == dense.frames[0]
+    assert sparse.frames[-1] == dense.frames[-1]
+    assert hold_interpolation(sparse.frames) is not None
+    parser.invalidate(dense_path)
+    parser.invalidate(sparse_path)
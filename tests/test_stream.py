@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from AE_Link import stream
+
+
+def frame_rows(first, count):
+    frames = np.arange(first, first + count, dtype=np.float64)
+    return np.column_stack((frames, frames * 2.0, -frames, np.full(count, 100.0),
+                            frames * 0.1, np.zeros(count), np.ones(count)))
+
+
+def decoded(message):
+    kind, length = stream._HEADER.unpack_from(message)
+    payload = message[stream._HEADER.size:]
+    assert len(payload) == length
+    return stream.decode_message(kind, payload)
+
+
+ITEM = {'layer_name': "Camera 1", 'type': 'camera', 'comp': "Comp 1",
+        'transform_data': {'start_frame': 10, 'end_frame': 19, 'frames': [{'frame': 10}]}}
+
+
+def test_item_round_trip_leaves_out_frames():
+    kind, item_id, item = decoded(stream.encode_item("cam é", ITEM))
+
+    assert (kind, item_id) == (stream.KIND_ITEM, "cam é")
+    assert item['transform_data'] == {'start_frame': 10, 'end_frame': 19}
+    assert item['layer_name'] == "Camera 1"
+    assert 'id' not in item
+    assert ITEM['transform_data']['frames']
+
+
+def test_frames_and_end_round_trip():
+    rows = frame_rows(10, 25)
+
+    kind, item_id, data = decoded(stream.encode_frames("7", rows))
+    assert (kind, item_id) == (stream.KIND_FRAMES, "7")
+    np.testing.assert_array_equal(data, rows)
+
+    assert decoded(stream.encode_end("7")) == (stream.KIND_END, "7", None)
+
+
+def test_unknown_kind_is_an_error():
+    with pytest.raises(ValueError):
+        stream.decode_message(9, b"")
+
+
+def messages(*encoded):
+    return [decoded(message) for message in encoded]
+
+
+def test_apply_assembles_items():
+    items = stream.StreamedItems()
+
+    changed = items.apply(messages(stream.encode_item("1", ITEM), stream.encode_frames("1", frame_rows(10, 5)),
+                                   stream.encode_frames("1", frame_rows(15, 5)), stream.encode_end("1"),
+                                   stream.encode_frames("2", frame_rows(0, 3))))
+
+    # Frames of items without a header are dropped
+    assert changed == {"1"}
+    assert items.complete == {"1"}
+    np.testing.assert_array_equal(items.rows("1"), frame_rows(10, 10))
+
+
+def test_new_item_header_starts_over():
+    items = stream.StreamedItems()
+    items.apply(messages(stream.encode_item("1", ITEM), stream.encode_frames("1", frame_rows(10, 5)),
+                         stream.encode_end("1")))
+    items.written["1"] = 5
+
+    changed = items.apply(messages(stream.encode_item("1", dict(ITEM, layer_name="Camera 2")),
+                                   stream.encode_frames("1", frame_rows(10, 2))))
+
+    assert changed == {"1"}
+    assert items.items["1"]['layer_name'] == "Camera 2"
+    assert "1" not in items.complete
+    assert "1" not in items.written
+    assert len(items.rows("1")) == 2
+
+
+@pytest.mark.parametrize('header_start', [10, None])
+def test_track_frames_count_from_the_first_row(header_start):
+    item = dict(ITEM, transform_data={} if header_start is None else {'start_frame': header_start})
+    items = stream.StreamedItems()
+    items.apply(messages(stream.encode_item("1", item), stream.encode_frames("1", frame_rows(10, 6)),
+                         stream.encode_frames("1", frame_rows(16, 4))))
+
+    whole = items.track("1")
+    appended = items.track("1", 6)
+
+    np.testing.assert_array_equal(whole.blender_frames(), np.arange(1.0, 11.0))
+    np.testing.assert_array_equal(appended.blender_frames(), np.arange(7.0, 11.0))
+    np.testing.assert_array_equal(appended.positions, frame_rows(16, 4)[:, 1:4])
+
+
+def streamed(rows, written):
+    items = stream.StreamedItems()
+    items.apply(messages(stream.encode_item("1", ITEM), stream.encode_frames("1", rows)))
+    items.written["1"] = written
+    return items
+
+
+def test_appendable_continuing_frames():
+    assert streamed(frame_rows(10, 8), 5).appendable("1")
+
+
+@pytest.mark.parametrize('written', [0, 8, 9])
+def test_appendable_needs_written_and_new_rows(written):
+    assert not streamed(frame_rows(10, 8), written).appendable("1")
+
+
+def test_appendable_rejects_frames_out_of_order():
+    rows = np.concatenate((frame_rows(10, 5), frame_rows(12, 3)))
+
+    assert not streamed(rows, 5).appendable("1")
+
+
+def test_appendable_rejects_sparse_holds():
+    rows = np.concatenate((frame_rows(10, 5), frame_rows(20, 3)))
+
+    assert not streamed(rows, 5).appendable("1")
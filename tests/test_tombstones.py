@@ -0,0 +1,62 @@
+import json
+import os
+
+import pytest
+import synthetic
+
+from AE_Link import parser
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = str(tmp_path / "export.json")
+    synthetic.write_export(path, 4, 30)
+    yield path
+    parser.invalidate(path)
+
+
+def write_json_lines(path, records):
+    with open(path, 'wb') as f:
+        for record in records:
+            f.write(json.dumps(record).encode('utf-8') + b"\n")
+
+
+def camera(name, frame_count=3):
+    frames = [{'frame': i, 'position': {'x': i, 'y': 0, 'z': 0}, 'orientation': {'x': 0, 'y': 0, 'z': 0}}
+              for i in range(frame_count)]
+    return {'layer_name': name, 'type': 'camera', 'comp': "Comp 1",
+            'transform_data': {'start_frame': 0, 'end_frame': frame_count - 1, 'frames': frames}}
+
+
+def test_tombstone_hides_item_until_compacted(export_file):
+    with open(export_file, 'r') as f:
+        document = json.load(f)
+
+    assert parser.add_tombstone(export_file, '1001')
+    assert not parser.add_tombstone(export_file, 'missing')
+
+    assert parser.deleted_items(export_file) == ['1001']
+    assert [entry.id for entry in parser.visible_items(export_file)] == ['1000', '1002', '1003']
+
+    assert parser.compact(export_file) == 1
+    assert not os.path.exists(parser.tombstone_path(export_file))
+    with open(export_file, 'r') as f:
+        compacted = json.load(f)
+    del document['1001']
+    assert compacted == document
+    assert [entry.id for entry in parser.visible_items(export_file)] == ['1000', '1002', '1003']
+    assert parser.load_item(export_file, '1003') == document['1003']
+
+
+def test_tombstone_of_changed_item_is_ignored(tmp_path):
+    path = str(tmp_path / "export.jsonl")
+    write_json_lines(path, [{'1': camera("A"), '2': camera("B")}])
+    parser.add_tombstone(path, '1')
+    assert [entry.id for entry in parser.visible_items(path)] == ['2']
+
+    # After Effects exports the deleted layer again with other frames
+    write_json_lines(path, [{'1': camera("A"), '2': camera("B")}, {'1': camera("A", 5)}])
+
+    assert [entry.id for entry in parser.visible_items(path)] == ['1', '2']
+    assert parser.compact(path) == 0
+    parser.invalidate(path)
@@ -0,0 +1,78 @@
+import json
+from math import radians
+
+import numpy as np
+import pytest
+import synthetic
+
+from AE_Link import parser
+from AE_Link.track import Track
+
+
+def legacy_keys(item, start_position):
+    """Keys of the per-frame import loop the track conversion replaced"""
+    frames = item['transform_data']['frames']
+    ae_start_frame = item['transform_data']['start_frame']
+    first_pos = frames[0]['position']
+    position_offset = (
+        start_position[0] - first_pos['x'],
+        start_position[1] - first_pos['z'],
+        start_position[2] + first_pos['y']
+    )
+    keys = []
+    for frame_data in frames:
+        pos = frame_data['position']
+        rot = frame_data['orientation']
+        location = (
+            pos['x'] + position_offset[0],
+            pos['z'] + position_offset[1],
+            -pos['y'] + position_offset[2]
+        )
+        rotation = (radians(-rot['x'] + 90), radians(rot['z']), radians(-rot['y']))
+        keys.append((frame_data['frame'] - ae_start_frame + 1, location, rotation))
+    return keys
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = str(tmp_path / "export.json")
+    synthetic.write_export(path, 3, 240, start_frame=12)
+    yield path
+    parser.invalidate(path)
+
+
+@pytest.mark.parametrize('start_position', [(0.0, 0.0, 0.0), (1.5, -2.0, 3.25)])
+def test_conversion_matches_legacy_loop(export_file, start_position):
+    item = parser.load_item(export_file, '1001')
+    track = Track.from_transform_data(item['transform_data'])
+
+    frames, locations, rotations = track.to_blender(start_position)
+
+    legacy_frames, legacy_locations, legacy_rotations = zip(*legacy_keys(item, start_position))
+    np.testing.assert_allclose(frames, legacy_frames)
+    np.testing.assert_allclose(locations, legacy_locations, atol=1e-9)
+    np.testing.assert_allclose(rotations, legacy_rotations, atol=1e-12)
+    np.testing.assert_allclose(locations[0], start_position, atol=1e-9)
+
+
+def test_explicit_offset_replaces_start_position(export_file):
+    item = parser.load_item(export_file, '1000')
+    track = Track.from_transform_data(item['transform_data'])
+    offset = (10.0, 20.0, 30.0)
+
+    locations = track.blender_locations((5.0, 5.0, 5.0), offset=offset)
+
+    pos = track.positions
+    np.testing.assert_allclose(locations, np.column_stack((pos[:, 0], pos[:, 2], -pos[:, 1])) + offset)
+
+
+def test_transform_data_of_export_round_trips(export_file):
+    with open(export_file, 'r') as f:
+        document = json.load(f)
+
+    for item_id, item in document.items():
+        track = Track.from_transform_data(item['transform_data'])
+        frames = item['transform_data']['frames']
+        assert len(track) == len(frames)
+        assert track.frames[0] == frames[0]['frame']
+        assert tuple(track.orientations[-1]) == tuple(frames[-1]['orientation'][axis] for axis in 'xyz')